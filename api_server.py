@@ -2,17 +2,27 @@
 Flask API Server for PrizePicks EV Dashboard
 Serves ev_analysis.json and handles data refresh requests
 """
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 import json
-import subprocess
 import os
+from datetime import datetime
+from backend.pipeline import run_pipeline
+from ev_data_cache import EVDataCache
+from ev_stream import EVBroadcaster, StreamLimitError
+from refresh_jobs import RefreshJobManager
+from refresh_scheduler import SCHEDULER_ENABLED, RefreshScheduler, acquire_scheduler_lock
 from database_queries import (  # ADD THIS IMPORT
     get_top_winners, 
     get_top_hit_lines, 
     search_user,
+    get_user_entry_history,
     get_available_states,
-    get_date_range
+    get_date_range,
+    get_analytics_metadata,
+    InvalidCursorError,
+    LEADERBOARD_MAX_LIMIT,
+    QUERY_CACHE
 )
 
 app = Flask(__name__)
@@ -21,16 +31,40 @@ CORS(app)
 # Path to data file
 DATA_FILE = 'backend/data_storage/ev_analysis.json'
 
+# Flask debug mode (and its auto-reloader) for `python api_server.py`
+DEBUG = os.getenv('FLASK_DEBUG', '1').lower() not in ('0', 'false', 'no')
+
+# How long browsers may reuse /api/analytics/bootstrap before revalidating (seconds)
+BOOTSTRAP_MAX_AGE = int(os.getenv('BOOTSTRAP_MAX_AGE', '30'))
+
+# Serialized + gzipped ev_analysis.json, reloaded only when the file changes
+EV_CACHE = EVDataCache(DATA_FILE)
+
+# Pushes EV diffs to every open /api/ev-stream connection
+EV_STREAM = EVBroadcaster(EV_CACHE)
+
 @app.route('/api/ev-data', methods=['GET'])
 def get_ev_data():
     """
     GET endpoint to retrieve current EV analysis data
-    Returns the contents of ev_analysis.json
+    Returns the contents of ev_analysis.json from the in-memory EV cache
+    Supports conditional requests (ETag / If-None-Match) and gzip
     """
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-        return jsonify(data), 200
+        snapshot = EV_CACHE.get()
+        
+        if request.if_none_match.contains(snapshot.etag):
+            response = Response(status=304)
+        elif request.accept_encodings['gzip']:
+            response = Response(snapshot.gzip_body, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(snapshot.body, mimetype='application/json')
+        
+        response.set_etag(snapshot.etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
     except FileNotFoundError:
         return jsonify({
             'error': 'Data file not found',
@@ -42,132 +76,158 @@ def get_ev_data():
             'message': str(e)
         }), 500
 
+@app.route('/api/ev-stream', methods=['GET'])
+def stream_ev_data():
+    """
+    GET Server-Sent Events stream of EV updates
+    Sends a 'snapshot' event with the full EV array on connect, then a 'diff'
+    event (added / changed / removed props) each time new data is published.
+    Answers 503 when this process already serves its maximum number of streams;
+    the dashboard then polls /api/ev-data instead
+    """
+    try:
+        subscriber = EV_STREAM.subscribe()
+    except StreamLimitError as e:
+        response = jsonify({
+            'error': 'Too many live streams',
+            'message': str(e)
+        })
+        response.headers['Retry-After'] = '60'
+        return response, 503
+    
+    response = Response(
+        EV_STREAM.stream(subscriber, request.headers.get('Last-Event-ID')),
+        mimetype='text/event-stream'
+    )
+    response.call_on_close(lambda: EV_STREAM.unsubscribe(subscriber))
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Don't let a reverse proxy buffer the stream
+    return response
+
+def refresh_message(result):
+    """Human-readable summary of a pipeline result"""
+    if result['published']:
+        return 'Data refreshed successfully'
+    if result['unchanged']:
+        return 'Upstream data unchanged, kept current data'
+    return 'No new matches found, kept previous data'
+
+def publish_refresh(result):
+    """Called by the job manager after every successful pipeline run"""
+    if result['published']:
+        EV_CACHE.invalidate()
+        EV_STREAM.sync()
+    
+    print("\n" + "="*60)
+    print("🎉 REFRESH COMPLETE! ALL STAGES RAN SUCCESSFULLY")
+    print("="*60)
+    print(f"✅ {result['prop_count']} props in new data")
+    print(f"⏱️  Stage timings: {result['timings']}")
+    print(f"⏰ Completed at: {datetime.now()}")
+    print("\n" + "="*60 + "\n")
+
+# Runs the pipeline in the background, one refresh at a time (single-flight per process)
+REFRESH_JOBS = RefreshJobManager(run_pipeline, on_complete=publish_refresh)
+
+# Adaptive background refresher (started with the app when REFRESH_SCHEDULER=1)
+SCHEDULER = RefreshScheduler(REFRESH_JOBS, DATA_FILE)
+
+# Held for the life of the process by whichever process runs the scheduler
+_scheduler_lock = None
+
+def start_scheduler():
+    """
+    Start SCHEDULER if REFRESH_SCHEDULER=1 and no other process on this host runs it
+    
+    Under gunicorn every worker imports this module; the lock file lets exactly
+    one of them schedule (see refresh_scheduler.py).
+    """
+    global _scheduler_lock
+    if not SCHEDULER_ENABLED or _scheduler_lock is not None:
+        return
+    _scheduler_lock = acquire_scheduler_lock()
+    if _scheduler_lock is None:
+        print(f"⏰ Refresh scheduler already running in another process (pid {os.getpid()} skips it)")
+        return
+    SCHEDULER.start()
+
+# Imported by a WSGI server (gunicorn): start with the app. Run directly, __main__
+# decides, because the debug reloader imports this file in a watcher process too.
+if __name__ != '__main__':
+    start_scheduler()
+
+def job_response(job):
+    """Status payload for a refresh job"""
+    payload = job.to_dict()
+    payload['status_url'] = f"/api/refresh/{job.id}"
+    if job.result is not None:
+        payload['message'] = refresh_message(job.result)
+        payload['prop_count'] = job.result['prop_count']
+    elif job.error is not None:
+        payload['message'] = job.error['error']
+    return payload
+
 @app.route('/api/refresh', methods=['POST'])
 def refresh_data():
     """
     POST endpoint to refresh all data
-    Runs all backend scripts in sequence:
-    1. sportsbookapi.py - Get sportsbook passing yards lines
-    2. prizepicksapi.py - Get PrizePicks props
-    3. match_props.py - Match the props (±2.5 yard tolerance)
-    4. calculate_ev.py - Calculate EV with probability adjustments
+    Starts the in-process pipeline (backend/pipeline.py) in the background:
+    1. Sportsbook API + PrizePicks API - Collected concurrently
+    2. Match props (±2.5 yard tolerance)
+    3. Calculate EV with probability adjustments
+    
+    Returns 202 with a job id right away; poll GET /api/refresh/<job_id> for progress.
+    A refresh requested while another one is running joins that run (deduplicated: true).
     """
     try:
         print("\n" + "="*60)
         print("🔄 REFRESH REQUEST RECEIVED FROM FRONTEND")
         print("="*60)
-        print(f"⏰ Timestamp: {__import__('datetime').datetime.now()}")
-        
-        # Step 1: Get sportsbook data
-        print("\n" + "🏈" * 30)
-        print("[1/4] 📊 RUNNING SPORTSBOOKAPI.PY (Passing Yards)...")
-        print("🏈" * 30)
-        result1 = subprocess.run(
-            ['python', 'backend/data_collection/sportsbookapi.py'],
-            capture_output=True,
-            text=True,
-            timeout=60  # 60 second timeout
-        )
-        if result1.returncode != 0:
-            print("❌ SPORTSBOOK API FAILED!")
-            print(f"Error: {result1.stderr}")
-            return jsonify({
-                'error': 'Sportsbook API failed',
-                'details': result1.stderr
-            }), 500
-        print("✅ SPORTSBOOK DATA COLLECTED SUCCESSFULLY")
-        print(f"Output preview: {result1.stdout[:200]}...")
-        
-        # Step 2: Get PrizePicks data
-        print("\n" + "🎯" * 30)
-        print("[2/4] 🎲 RUNNING PRIZEPICKSAPI.PY...")
-        print("🎯" * 30)
-        result2 = subprocess.run(
-            ['python', 'backend/data_collection/prizepicksapi.py'],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        if result2.returncode != 0:
-            print("❌ PRIZEPICKS API FAILED!")
-            print(f"Error: {result2.stderr}")
-            return jsonify({
-                'error': 'PrizePicks API failed',
-                'details': result2.stderr
-            }), 500
-        print("✅ PRIZEPICKS DATA COLLECTED SUCCESSFULLY")
-        print(f"Output preview: {result2.stdout[:200]}...")
+        print(f"⏰ Timestamp: {datetime.now()}")
         
-        # Step 3: Match props
-        print("\n" + "🔗" * 30)
-        print("[3/4] 🔀 RUNNING MATCH_PROPS.PY (±2.5 yard tolerance)...")
-        print("🔗" * 30)
-        result3 = subprocess.run(
-            ['python', 'backend/data_processing/match_props.py'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result3.returncode != 0:
-            print("❌ PROP MATCHING FAILED!")
-            print(f"Error: {result3.stderr}")
-            return jsonify({
-                'error': 'Prop matching failed',
-                'details': result3.stderr
-            }), 500
-        print("✅ PROPS MATCHED SUCCESSFULLY")
-        print(f"Output preview: {result3.stdout[:200]}...")
+        job, deduplicated = REFRESH_JOBS.submit(trigger='manual')
+        if deduplicated:
+            print(f"🔁 Refresh already in progress - joined job {job.id[:8]}")
         
-        # Step 4: Calculate EV
-        print("\n" + "💰" * 30)
-        print("[4/4] 📈 RUNNING CALCULATE_EV.PY (with probability adjustments)...")
-        print("💰" * 30)
-        result4 = subprocess.run(
-            ['python', 'backend/ev_calculation/calculate_ev.py'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if result4.returncode != 0:
-            print("❌ EV CALCULATION FAILED!")
-            print(f"Error: {result4.stderr}")
-            return jsonify({
-                'error': 'EV calculation failed',
-                'details': result4.stderr
-            }), 500
-        print("✅ EV CALCULATED SUCCESSFULLY")
-        print(f"Output preview: {result4.stdout[:200]}...")
+        payload = job_response(job)
+        payload['deduplicated'] = deduplicated
+        response = jsonify(payload)
+        response.headers['Location'] = payload['status_url']
+        return response, 202
         
-        print("\n" + "="*60)
-        print("🎉 REFRESH COMPLETE! ALL SCRIPTS RAN SUCCESSFULLY")
-        print("="*60)
-        
-        # Load and return the new data
-        print("\n📂 Loading new ev_analysis.json file...")
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-        
-        print(f"✅ Loaded {len(data)} props from new data")
-        print(f"⏰ Completed at: {__import__('datetime').datetime.now()}")
-        print("\n" + "="*60 + "\n")
-        
-        return jsonify({
-            'status': 'success',
-            'message': 'Data refreshed successfully',
-            'prop_count': len(data)
-        }), 200
-        
-    except subprocess.TimeoutExpired:
-        return jsonify({
-            'error': 'Refresh timeout',
-            'message': 'One of the scripts took too long to run'
-        }), 500
     except Exception as e:
         return jsonify({
             'error': 'Refresh failed',
             'message': str(e)
         }), 500
 
+@app.route('/api/refresh/<job_id>', methods=['GET'])
+def refresh_status(job_id):
+    """
+    GET status of a refresh job
+    Returns the job's status (queued, running, succeeded, failed), per-stage
+    progress and timings, and the pipeline result or error once it finishes
+    """
+    job = REFRESH_JOBS.get(job_id)
+    if job is None:
+        return jsonify({
+            'error': 'Refresh job not found',
+            'message': f'No refresh job with id {job_id} (it may have expired)'
+        }), 404
+    
+    response = jsonify(job_response(job))
+    response.headers['Cache-Control'] = 'no-store'
+    return response, 200
+
+@app.route('/api/refresh/schedule', methods=['GET'])
+def refresh_schedule():
+    """
+    GET scheduled refresher state
+    Returns whether it is running, the current interval and why, the next run time
+    and the Odds API quota it is budgeting against
+    """
+    return jsonify(SCHEDULER.status()), 200
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Simple health check endpoint"""
@@ -189,25 +249,38 @@ def api_top_winners():
         - state: US state code or None for all (default: None)
         - start_date: YYYY-MM-DD format (default: None)
         - end_date: YYYY-MM-DD format (default: None)
-        - limit: number of results (default: 10)
+        - limit: number of results (default: 10, max: 100)
+        - cursor: next_cursor from the previous page (default: None = first page)
     """
     try:
         sort_by = request.args.get('sort_by', 'revenue')
         state = request.args.get('state', None)
         start_date = request.args.get('start_date', None)
         end_date = request.args.get('end_date', None)
-        limit = request.args.get('limit', 10, type=int)
+        limit = max(1, min(request.args.get('limit', 10, type=int), LEADERBOARD_MAX_LIMIT))
+        cursor = request.args.get('cursor', None)
         
         result = get_top_winners(
             sort_by=sort_by,
             state=state,
             start_date=start_date,
             end_date=end_date,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
         
         return jsonify(result), 200
         
+    except InvalidCursorError as e:
+        return jsonify({
+            'error': 'Invalid cursor',
+            'message': 'cursor must be a next_cursor returned for the same sort_by'
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'error': 'Invalid date filter',
+            'message': 'start_date and end_date must be YYYY-MM-DD'
+        }), 400
     except Exception as e:
         return jsonify({
             'error': 'Failed to fetch top winners',
@@ -223,25 +296,38 @@ def api_top_hit_lines():
         - state: US state code or None for all (default: None)
         - start_date: YYYY-MM-DD format (default: None)
         - end_date: YYYY-MM-DD format (default: None)
-        - limit: number of results (default: 10)
+        - limit: number of results (default: 10, max: 100)
+        - cursor: next_cursor from the previous page (default: None = first page)
     """
     try:
         sort_by = request.args.get('sort_by', 'revenue')
         state = request.args.get('state', None)
         start_date = request.args.get('start_date', None)
         end_date = request.args.get('end_date', None)
-        limit = request.args.get('limit', 10, type=int)
+        limit = max(1, min(request.args.get('limit', 10, type=int), LEADERBOARD_MAX_LIMIT))
+        cursor = request.args.get('cursor', None)
         
         result = get_top_hit_lines(
             sort_by=sort_by,
             state=state,
             start_date=start_date,
             end_date=end_date,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
         
         return jsonify(result), 200
         
+    except InvalidCursorError as e:
+        return jsonify({
+            'error': 'Invalid cursor',
+            'message': 'cursor must be a next_cursor returned for the same sort_by'
+        }), 400
+    except ValueError as e:
+        return jsonify({
+            'error': 'Invalid date filter',
+            'message': 'start_date and end_date must be YYYY-MM-DD'
+        }), 400
     except Exception as e:
         return jsonify({
             'error': 'Failed to fetch top hit lines',
@@ -251,12 +337,17 @@ def api_top_hit_lines():
 @app.route('/api/analytics/user-search', methods=['GET'])
 def api_user_search():
     """
-    Search for a user by username or email
+    Search for users by username, email or name
+    Returns the best match's profile plus a ranked page of every match
     Query params:
-        - q: search query (username or email)
+        - q: search query (username, email or name, partial match)
+        - limit: number of matches per page (default: 10, max: 50)
+        - offset: number of matches to skip (default: 0)
     """
     try:
-        query = request.args.get('q', '')
+        query = request.args.get('q', '').strip()
+        limit = request.args.get('limit', 10, type=int)
+        offset = request.args.get('offset', 0, type=int)
         
         if not query:
             return jsonify({
@@ -264,7 +355,7 @@ def api_user_search():
                 'message': 'Please provide a search query using ?q=username'
             }), 400
         
-        result = search_user(query)
+        result = search_user(query, limit=limit, offset=offset)
         
         return jsonify(result), 200
         
@@ -274,6 +365,36 @@ def api_user_search():
             'message': str(e)
         }), 500
 
+@app.route('/api/analytics/users/<int:user_id>/entries', methods=['GET'])
+def api_user_entries(user_id):
+    """
+    GET a user's full entry history, newest first, one page at a time (picks embedded)
+    Query params:
+        - limit: entries per page (default: 20, max: 100)
+        - cursor: next_cursor from the previous page, or entries_cursor from a
+          user-search profile (default: None = newest entries)
+        - summary: 1 to include totals over the page (default: 0)
+    """
+    try:
+        limit = request.args.get('limit', 20, type=int)
+        cursor = request.args.get('cursor', None)
+        summary = request.args.get('summary', '0').lower() in ('1', 'true', 'yes')
+        
+        result = get_user_entry_history(user_id, limit=limit, cursor=cursor, summary=summary)
+        
+        return jsonify(result), 200
+        
+    except InvalidCursorError as e:
+        return jsonify({
+            'error': 'Invalid cursor',
+            'message': 'cursor must be a next_cursor returned for the same user'
+        }), 400
+    except Exception as e:
+        return jsonify({
+            'error': 'Failed to fetch entry history',
+            'message': str(e)
+        }), 500
+
 @app.route('/api/analytics/states', methods=['GET'])
 def api_get_states():
     """
@@ -310,6 +431,47 @@ def api_get_date_range():
             'message': str(e)
         }), 500
 
+@app.route('/api/analytics/bootstrap', methods=['GET'])
+def api_bootstrap():
+    """
+    GET everything the analytics page needs on load in one cacheable response:
+    states (for dropdowns), date range (for date pickers) and row counts
+    Served from an in-memory snapshot that is rebuilt only after the database changes
+    Supports conditional requests (ETag / If-None-Match)
+    """
+    try:
+        metadata = get_analytics_metadata()
+        
+        if request.if_none_match.contains(metadata['version']):
+            response = Response(status=304)
+        else:
+            response = jsonify({
+                'status': 'success',
+                **metadata
+            })
+        
+        response.set_etag(metadata['version'])
+        # Counts change whenever entries are placed, so browsers reuse it only briefly and
+        # then revalidate with the ETag (a 304 while the data is unchanged)
+        response.headers['Cache-Control'] = f"private, max-age={BOOTSTRAP_MAX_AGE}"
+        return response
+        
+    except Exception as e:
+        return jsonify({
+            'error': 'Failed to fetch analytics metadata',
+            'message': str(e)
+        }), 500
+
+@app.route('/api/analytics/cache-stats', methods=['GET'])
+def api_cache_stats():
+    """
+    GET leaderboard result cache counters (hits, misses, evictions, invalidations)
+    """
+    return jsonify({
+        'status': 'success',
+        'cache': QUERY_CACHE.stats()
+    }), 200
+
 if __name__ == '__main__':
     print("\n" + "🚀" * 30)
     print("PRIZEPICKS EV DASHBOARD API SERVER")
@@ -317,17 +479,23 @@ if __name__ == '__main__':
     
     print("\n📊 EV Analysis Endpoints:")
     print("  GET  /api/ev-data              - Get current EV analysis")
-    print("  POST /api/refresh              - Refresh all data")
+    print("  GET  /api/ev-stream            - Live EV updates (Server-Sent Events)")
+    print("  POST /api/refresh              - Start a data refresh (returns job id)")
+    print("  GET  /api/refresh/<job_id>     - Refresh job status and progress")
+    print("  GET  /api/refresh/schedule     - Scheduled refresher status")
     print("  GET  /api/health               - Health check")
     
     print("\n👥 User Analytics Endpoints:")
     print("  GET  /api/analytics/top-winners    - Top winning users")
     print("  GET  /api/analytics/top-hit-lines  - Top hit player props")
-    print("  GET  /api/analytics/user-search    - Search for user (param: q)")
+    print("  GET  /api/analytics/user-search    - Search for users (params: q, limit, offset)")
+    print("  GET  /api/analytics/users/<id>/entries - Paged entry history (params: limit, cursor, summary)")
     
     print("\n🔧 Helper Endpoints:")
+    print("  GET  /api/analytics/bootstrap      - States, date range and row counts (cacheable)")
     print("  GET  /api/analytics/states         - List of available states")
     print("  GET  /api/analytics/date-range     - Min/max dates for filters")
+    print("  GET  /api/analytics/cache-stats    - Leaderboard cache hit/miss counters")
     
     print("\n💡 Example Usage:")
     print("  http://localhost:5000/api/analytics/top-winners?sort_by=revenue&state=NY")
@@ -338,4 +506,9 @@ if __name__ == '__main__':
     print("Frontend should connect from: http://localhost:3000")
     print("\n" + "="*60 + "\n")
     
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # With the debug reloader this block runs in a file watcher and again in the
+    # serving child (WERKZEUG_RUN_MAIN); only the child should schedule
+    if not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_scheduler()
+    
+    app.run(debug=DEBUG, port=5000)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Shared HTTP client for the data collectors
+
+Every collector request goes through one requests.Session so TCP/TLS connections
+are pooled and reused (HTTP keep-alive) across calls and across refreshes instead
+of paying a fresh handshake per request.
+
+Each upstream host gets its own connection pool. pool_block=True turns the pool
+size into a hard per-host limit: extra concurrent requests wait for a free
+connection rather than opening (and then discarding) more of them.
+"""
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Number of per-host pools kept alive at once
+POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '4'))
+
+# Default max connections per host
+POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '8'))
+
+# Per-host connection limits (override POOL_MAXSIZE for known upstreams)
+HOST_LIMITS = {
+    'https://api.the-odds-api.com': int(os.getenv('HTTP_ODDS_API_MAXSIZE', '8')),
+    'https://api.prizepicks.com': int(os.getenv('HTTP_PRIZEPICKS_MAXSIZE', '2')),
+}
+
+# Only advertise brotli when urllib3 can actually decode it (needs brotli or brotlicffi)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, host_limits=None):
+    """
+    Build a pooled keep-alive session
+
+    Args:
+        pool_connections (int): Number of per-host pools to keep
+        pool_maxsize (int): Default connections per host
+        host_limits (dict): URL prefix -> max connections for that host
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+
+    default_adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=True
+    )
+    session.mount('https://', default_adapter)
+    session.mount('http://', default_adapter)
+
+    for prefix, limit in (HOST_LIMITS if host_limits is None else host_limits).items():
+        session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=limit, pool_block=True))
+
+    return session
+
+
+def get_session():
+    """Return the process-wide collector session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def close_session():
+    """Close pooled connections (the next get_session() call builds a new pool)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,146 @@
+"""
+Local stub of the Odds API
+
+Serves the two endpoints the sportsbook collector calls (the games list and
+per-event odds) with canned data, and keeps a credit counter that is reported
+in the same quota headers the real API sends (x-requests-remaining,
+x-requests-used, x-requests-last). Set `remaining` to simulate a spent quota
+or a monthly reset.
+
+Usage (from the project root):
+    python backend/data_collection/odds_stub_server.py --port 8765 --remaining 10
+    ODDS_API_BASE_URL=http://127.0.0.1:8765/v4 python backend/data_collection/sportsbookapi.py
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GAMES = [
+    {
+        'id': 'stub-event-1',
+        'sport_key': 'americanfootball_nfl',
+        'commence_time': '2025-11-14T01:15:00Z',
+        'home_team': 'Kansas City Chiefs',
+        'away_team': 'Denver Broncos',
+    },
+    {
+        'id': 'stub-event-2',
+        'sport_key': 'americanfootball_nfl',
+        'commence_time': '2025-11-16T18:00:00Z',
+        'home_team': 'Buffalo Bills',
+        'away_team': 'Miami Dolphins',
+    },
+]
+
+PASSERS = {
+    'stub-event-1': [('Patrick Mahomes', 262.5), ('Bo Nix', 224.5)],
+    'stub-event-2': [('Josh Allen', 244.5), ('Tua Tagovailoa', 231.5)],
+}
+
+
+def event_odds(game):
+    """Event odds document for one stub game (one bookmaker, passing yards overs/unders)"""
+    outcomes = []
+    for player, line in PASSERS[game['id']]:
+        outcomes.append({'name': 'Over', 'description': player, 'price': -115, 'point': line})
+        outcomes.append({'name': 'Under', 'description': player, 'price': -105, 'point': line})
+    return {
+        **game,
+        'bookmakers': [{
+            'key': 'draftkings',
+            'title': 'DraftKings',
+            'markets': [{'key': 'player_pass_yds', 'outcomes': outcomes}],
+        }],
+    }
+
+
+class OddsStubServer(ThreadingHTTPServer):
+    """
+    Odds API stub with a credit counter
+
+    Every request costs one credit while any are left; once `remaining` reaches 0
+    requests get a 401 (as the real API answers an exhausted key) but still carry
+    the quota headers.
+
+    Args:
+        port (int): Port to listen on (0 picks a free one)
+        remaining (int): Credits left this month
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, remaining=500):
+        super().__init__(('127.0.0.1', port), OddsStubHandler)
+        self.remaining = remaining
+        self.used = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        """Value for ODDS_API_BASE_URL"""
+        return f'http://127.0.0.1:{self.server_address[1]}/v4'
+
+    def start(self):
+        """Serve from a daemon thread; returns self so it can be used inline"""
+        threading.Thread(target=self.serve_forever, name='odds-stub', daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class OddsStubHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            cost = 1 if server.remaining > 0 else 0
+            server.remaining -= cost
+            server.used += cost
+            quota = {
+                'x-requests-remaining': str(server.remaining),
+                'x-requests-used': str(server.used),
+                'x-requests-last': str(cost),
+            }
+
+        path = self.path.split('?', 1)[0].rstrip('/')
+        parts = path.split('/')
+        if not cost:
+            status, body = 401, {'message': 'Usage quota has been reached'}
+        elif len(parts) == 5 and parts[1:3] == ['v4', 'sports'] and parts[4] == 'odds':
+            status, body = 200, GAMES
+        elif len(parts) == 7 and parts[1:3] == ['v4', 'sports'] and parts[4] == 'events' and parts[6] == 'odds':
+            game = next((g for g in GAMES if g['id'] == parts[5]), None)
+            status, body = (200, event_odds(game)) if game else (404, {'message': 'Event not found'})
+        else:
+            status, body = 404, {'message': 'Unknown endpoint'}
+
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in quota.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve a local stub of the Odds API')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--remaining', type=int, default=500, help='Credits left this month')
+    args = parser.parse_args()
+
+    server = OddsStubServer(args.port, args.remaining)
+    print(f"🧪 Odds API stub listening on {server.base_url} ({args.remaining} credits)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
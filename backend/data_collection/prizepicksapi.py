@@ -1,10 +1,125 @@
-import requests
 import json
 import os
 import time
+from urllib.parse import urljoin
+
+try:
+    from backend.data_collection.http_client import get_session
+    from backend.data_collection.response_cache import RESPONSE_CACHE
+except ImportError:  # Run directly as a script from backend/data_collection
+    from http_client import get_session
+    from response_cache import RESPONSE_CACHE
+
+# Streaming JSON parser (optional) - without it each page is loaded with json.load
+try:
+    import ijson
+    JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    JSON_ERRORS = (json.JSONDecodeError,)
+
+OUTPUT_FILE = 'backend/data_storage/prizepicks_props.json'
+
+# Seconds a cached /projections response is reused without revalidating
+PRIZEPICKS_CACHE_TTL = int(os.getenv('PRIZEPICKS_CACHE_TTL', '30'))
+
+# Pagination
+PER_PAGE = 250
+MAX_PAGES = 40  # Safety cap on links.next hops
+REQUEST_DELAY = 1  # Seconds before each network request, to not look suspicious
+
+# Only projections the matcher uses are kept, trimmed to the fields it reads
+PROJECTION_STAT_TYPES = {'Pass Yards'}
+PROJECTION_FIELDS = ('stat_type', 'odds_type', 'adjusted_odds', 'line_score')
+
+# Number of pages on the previous fetch; a different count counts as a change
+_last_page_count = None
+
+def _trim_projection(projection):
+    """Reduce a projection to what match_props reads, or None if it isn't needed"""
+    attributes = projection.get('attributes') or {}
+    new_player = (projection.get('relationships') or {}).get('new_player')
+    if attributes.get('stat_type') not in PROJECTION_STAT_TYPES or not new_player:
+        return None
+    return {
+        'type': projection.get('type'),
+        'id': projection.get('id'),
+        'attributes': {field: attributes.get(field) for field in PROJECTION_FIELDS},
+        'relationships': {'new_player': new_player},
+    }
+
+def _trim_player(item):
+    """Reduce an included new_player record to name + team, or None for other types"""
+    if item.get('type') != 'new_player':
+        return None
+    attributes = item.get('attributes') or {}
+    return {
+        'type': 'new_player',
+        'id': item.get('id'),
+        'attributes': {'name': attributes.get('name'), 'team': attributes.get('team', 'N/A')},
+    }
+
+def parse_projection_page(fileobj):
+    """
+    Parse one /projections page, keeping only the records the matcher needs
+
+    With ijson installed the page is streamed from disk in three passes (data,
+    included, links.next) so only the kept records are ever materialized.
+
+    Returns:
+        tuple: (trimmed projections, trimmed players by id, next page link or None,
+                number of projections seen)
+    """
+    if ijson is None:
+        document = json.load(fileobj)
+        projections = document.get('data') or []
+        included = document.get('included') or []
+        next_links = [(document.get('links') or {}).get('next')]
+    else:
+        projections = ijson.items(fileobj, 'data.item', use_float=True)
+        included = None
+        next_links = None
+
+    kept = []
+    seen = 0
+    for projection in projections:
+        seen += 1
+        trimmed = _trim_projection(projection)
+        if trimmed is not None:
+            kept.append(trimmed)
+
+    if included is None:
+        fileobj.seek(0)
+        included = ijson.items(fileobj, 'included.item', use_float=True)
+    players = {}
+    for item in included:
+        trimmed = _trim_player(item)
+        if trimmed is not None:
+            players[trimmed['id']] = trimmed
+
+    if next_links is None:
+        fileobj.seek(0)
+        next_links = list(ijson.items(fileobj, 'links.next'))
+
+    return kept, players, next(iter(next_links), None), seen
+
+def fetch_prizepicks_props(save=True):
+    """
+    Fetch all NFL props from PrizePicks API through the response cache
+
+    Follows links.next until the feed is exhausted (up to MAX_PAGES), streaming
+    each page from the on-disk cache and keeping only PROJECTION_STAT_TYPES
+    projections and the players they reference.
+
+    Args:
+        save (bool): Also write the trimmed payload to prizepicks_props.json
+
+    Returns:
+        tuple: (JSON:API-shaped document with 'data' and 'included', or None on failure,
+                changed - False when every page matches the previous fetch)
+    """
+    global _last_page_count
 
-def get_prizepicks_props():
-    """Fetch all NFL props from PrizePicks API"""
     url = 'https://api.prizepicks.com/projections'
     
     # More complete headers to mimic a real browser
@@ -12,7 +127,6 @@ def get_prizepicks_props():
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'application/json',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
         'Referer': 'https://app.prizepicks.com/',
         'Origin': 'https://app.prizepicks.com',
         'Connection': 'keep-alive',
@@ -23,54 +137,107 @@ def get_prizepicks_props():
     
     params = {
         'league_id': '9',  # NFL
-        'per_page': '250',
+        'per_page': str(PER_PAGE),
         'single_stat': 'true'
     }
     
     print("Fetching PrizePicks NFL props...")
     
-    # Add a small delay to not look suspicious
-    time.sleep(1)
+    projections = []
+    players = {}
+    total_seen = 0
+    changed = False
+    page_url, page_params = url, params
+    pages = 0
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        
-        print(f"Status code: {response.status_code}")
-        
-        if response.status_code == 200:
-            data = response.json()
+        while page_url and pages < MAX_PAGES:
+            def send(conditional_headers, page_url=page_url, page_params=page_params):
+                # Add a small delay to not look suspicious (only when we actually hit the network)
+                time.sleep(REQUEST_DELAY)
+                return get_session().get(
+                    page_url,
+                    headers={**headers, **conditional_headers},
+                    params=page_params,
+                    timeout=10,
+                    stream=True
+                )
             
-            # Save to file
-            os.makedirs('backend/data_storage', exist_ok=True)
-            with open('backend/data_storage/prizepicks_props.json', 'w') as f:
-                json.dump(data, f, indent=2)
+            response = RESPONSE_CACHE.get(page_url, page_params, PRIZEPICKS_CACHE_TTL, send)
+            pages += 1
             
-            print(f"✅ Successfully fetched {len(data.get('data', []))} PrizePicks props")
-            print(f"📁 Saved to backend/data_storage/prizepicks_props.json")
-            return data
-        elif response.status_code == 403:
-            print("❌ Error 403: Access denied (bot protection triggered)")
-            print("Response text (first 500 chars):")
-            print(response.text[:500])
-            print("\n💡 Try these solutions:")
-            print("   1. Wait a few minutes and try again")
-            print("   2. Use a different IP (try from your phone's hotspot)")
-            print("   3. Visit https://app.prizepicks.com in your browser first")
-            print("   4. Consider using a proxy or Selenium (more advanced)")
-            return None
-        else:
-            print(f"❌ Error: {response.status_code}")
-            print(f"Response: {response.text[:500]}")
-            return None
+            print(f"Page {pages} status code: {response.status_code}{' (cached)' if response.from_cache else ''}")
             
-    except requests.exceptions.JSONDecodeError:
+            if response.status_code == 403:
+                print("❌ Error 403: Access denied (bot protection triggered)")
+                print("Response text (first 500 chars):")
+                print(response.text[:500])
+                print("\n💡 Try these solutions:")
+                print("   1. Wait a few minutes and try again")
+                print("   2. Use a different IP (try from your phone's hotspot)")
+                print("   3. Visit https://app.prizepicks.com in your browser first")
+                print("   4. Consider using a proxy or Selenium (more advanced)")
+                return None, True
+            elif response.status_code != 200:
+                print(f"❌ Error: {response.status_code}")
+                print(f"Response: {response.text[:500]}")
+                return None, True
+            
+            with response.open() as f:
+                kept, page_players, next_link, seen = parse_projection_page(f)
+            projections.extend(kept)
+            players.update(page_players)
+            total_seen += seen
+            changed = changed or response.changed
+            
+            # links.next carries its own query string (and may be relative)
+            page_url = urljoin(url, next_link) if next_link else None
+            page_params = None
+            
+    except JSON_ERRORS:
         print("❌ JSON parsing failed: Response is not valid JSON (likely blocked)")
         print("Response text (first 500 chars):")
         print(response.text[:500])
-        return None
+        return None, True
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        return None
+        return None, True
+    
+    if page_url:
+        print(f"⚠️  Stopped after {MAX_PAGES} pages; more projections are available")
+    
+    changed = changed or pages != _last_page_count
+    _last_page_count = pages
+    
+    referenced = {p['relationships']['new_player']['data']['id'] for p in projections}
+    data = {
+        'data': projections,
+        'included': [player for player_id, player in players.items() if player_id in referenced],
+    }
+    
+    print(f"✅ Successfully fetched {total_seen} PrizePicks props across {pages} page(s) "
+          f"({len(projections)} {', '.join(sorted(PROJECTION_STAT_TYPES))} kept)")
+    
+    # Save to file
+    if save:
+        os.makedirs('backend/data_storage', exist_ok=True)
+        with open(OUTPUT_FILE, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"📁 Saved to {OUTPUT_FILE}")
+    return data, changed
+
+def get_prizepicks_props(save=True):
+    """
+    Fetch all NFL props from PrizePicks API
+
+    Args:
+        save (bool): Also write the trimmed payload to prizepicks_props.json
+
+    Returns:
+        dict: JSON:API-shaped document with 'data' and 'included', or None on failure
+    """
+    data, _ = fetch_prizepicks_props(save)
+    return data
 
 if __name__ == "__main__":
-    get_prizepicks_props()
\ No newline at end of file
+    get_prizepicks_props()
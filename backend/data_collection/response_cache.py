@@ -0,0 +1,228 @@
+"""
+On-disk response cache for the data collectors
+
+Responses are keyed by URL + query params (the apiKey param is never part of the
+key or the stored metadata). Each entry keeps the body and its validators
+(ETag / Last-Modified):
+
+- Within the entry's TTL the cached body is returned without touching the network
+- After the TTL a conditional request is sent; a 304 reuses the cached body
+- A 200 whose body hashes to the stored digest is also treated as unchanged
+
+Every result carries a `changed` flag so the pipeline can skip matching and EV
+calculation when none of its inputs moved. Bodies are streamed straight to disk
+and handed back as files, so large payloads never have to sit in memory. The
+cache is bounded by total body size and evicts least-recently-used entries first.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
+CACHE_DIR = os.getenv('HTTP_CACHE_DIR', os.path.join(PROJECT_ROOT, 'backend', 'data_storage', 'http_cache'))
+
+# Total size of cached bodies before LRU eviction kicks in
+MAX_CACHE_BYTES = int(os.getenv('HTTP_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+
+# Bytes per chunk when streaming bodies to disk
+CHUNK_SIZE = 64 * 1024
+
+# Query params that identify the caller rather than the resource
+SECRET_PARAMS = {'apiKey'}
+
+
+class CachedResponse:
+    """
+    A response served either from the network or from the on-disk cache
+
+    Successful bodies live on disk at `path`; use open() to stream them or
+    content/json() to load them fully.
+    """
+
+    def __init__(self, status_code, headers, changed, from_cache, path=None, body=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.changed = changed
+        self.from_cache = from_cache
+        self.path = path
+        self._body = body
+
+    def open(self):
+        """Open the body as a binary file object (for streaming parsers)"""
+        if self.path is not None:
+            return open(self.path, 'rb')
+        return io.BytesIO(self._body or b'')
+
+    @property
+    def content(self):
+        if self._body is None:
+            with self.open() as f:
+                self._body = f.read()
+        return self._body
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """Validator-aware, size-bounded LRU cache of HTTP response bodies"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url, params=None):
+        """Stable cache key for a URL + params (secret params excluded)"""
+        public = sorted((k, str(v)) for k, v in (params or {}).items() if k not in SECRET_PARAMS)
+        return hashlib.sha256(json.dumps([url, public]).encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json'), os.path.join(self.cache_dir, f'{key}.body')
+
+    def _load(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            # Touch the body so its mtime tracks recency of use for LRU eviction
+            os.utime(body_path)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def _store(self, key, meta, response):
+        """Stream a response body to disk, hashing it on the way; returns the body path"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta_path, body_path = self._paths(key)
+        digest = hashlib.sha256()
+        # Write to temp files and rename so readers never see a half-written entry
+        tmp_body = f'{body_path}.{threading.get_ident()}.tmp'
+        with open(tmp_body, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                digest.update(chunk)
+                f.write(chunk)
+        meta['digest'] = digest.hexdigest()
+        tmp_meta = f'{meta_path}.{threading.get_ident()}.tmp'
+        with open(tmp_meta, 'w') as f:
+            json.dump(meta, f)
+        with self._lock:
+            os.replace(tmp_body, body_path)
+            os.replace(tmp_meta, meta_path)
+            self._evict()
+        return body_path
+
+    def _touch_meta(self, key, meta):
+        meta_path, _ = self._paths(key)
+        with open(meta_path + '.tmp', 'w') as f:
+            json.dump(meta, f)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def _evict(self):
+        """Delete least-recently-used entries until the cache fits in max_bytes"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        bodies = []
+        total = 0
+        for name in names:
+            if not name.endswith('.body'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, name[:-len('.body')]))
+            total += stat.st_size
+        for _, size, key in sorted(bodies):
+            if total <= self.max_bytes:
+                break
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+
+    def get(self, url, params, ttl, send):
+        """
+        Fetch url through the cache
+
+        Args:
+            url (str): Request URL
+            params (dict): Query params (part of the cache key)
+            ttl (float): Seconds a cached body is served without revalidation
+            send (callable): send(extra_headers) -> requests.Response; performs the
+                actual request with any conditional headers merged in. Pass
+                stream=True to requests so bodies go straight to disk.
+
+        Returns:
+            CachedResponse
+        """
+        key = self.make_key(url, params)
+        _, body_path = self._paths(key)
+        with self._lock:
+            meta = self._load(key)
+
+        now = time.time()
+        if meta is not None and now - meta['fetched_at'] < ttl:
+            return CachedResponse(200, meta.get('headers', {}), changed=False, from_cache=True, path=body_path)
+
+        conditional = {}
+        if meta is not None:
+            if meta.get('etag'):
+                conditional['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                conditional['If-Modified-Since'] = meta['last_modified']
+
+        response = send(conditional)
+
+        if response.status_code == 304 and meta is not None:
+            response.close()
+            meta['fetched_at'] = now
+            with self._lock:
+                self._touch_meta(key, meta)
+            return CachedResponse(200, dict(response.headers), changed=False, from_cache=True, path=body_path)
+
+        if response.status_code != 200:
+            return CachedResponse(response.status_code, dict(response.headers),
+                                  changed=True, from_cache=False, body=response.content)
+
+        new_meta = {
+            'url': url,
+            'params': {k: v for k, v in (params or {}).items() if k not in SECRET_PARAMS},
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': now,
+            'headers': {'Content-Type': response.headers.get('Content-Type', '')},
+        }
+        body_path = self._store(key, new_meta, response)
+        changed = meta is None or meta.get('digest') != new_meta['digest']
+        return CachedResponse(200, dict(response.headers), changed=changed, from_cache=False, path=body_path)
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            try:
+                names = os.listdir(self.cache_dir)
+            except OSError:
+                return
+            for name in names:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+
+# Shared by every collector in this process
+RESPONSE_CACHE = ResponseCache()
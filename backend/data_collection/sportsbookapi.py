@@ -1,63 +1,315 @@
 import requests
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 
+try:
+    from backend.data_collection.http_client import get_session
+    from backend.data_collection.response_cache import RESPONSE_CACHE
+except ImportError:  # Run directly as a script from backend/data_collection
+    from http_client import get_session
+    from response_cache import RESPONSE_CACHE
+
 load_dotenv()
 API_KEY = os.getenv('ODDS_API_KEY') # get api key from .env
 
+# Point this at a local stub server to exercise the fetcher without spending credits
+ODDS_API_BASE_URL = os.getenv('ODDS_API_BASE_URL', 'https://api.the-odds-api.com/v4')
+
 SPORT = 'americanfootball_nfl'
 REGIONS = 'us'
 MARKETS = 'player_pass_yds'  # Changed from player_pass_tds to player_pass_yds!
-MAX_GAMES = 5  # Limit to 5 games
-
-# Step 1: Get all NFL games
-games_response = requests.get(
-    f'https://api.the-odds-api.com/v4/sports/{SPORT}/odds',
-    params={
-        'apiKey': API_KEY,
-        'regions': REGIONS,
-        'markets': 'h2h',
-        'oddsFormat': 'american',
-    }
-)
-
-if games_response.status_code != 200: # 200 is successful
-    print(f"Error getting games: {games_response.status_code}")
-    print(games_response.text)
-    exit()
-
-games = games_response.json()
-print(f"Found {len(games)} NFL games")
-print(f"Pulling QB passing yards for first {MAX_GAMES} games\n")
-
-# Step 2: Get QB passing yards props for first 5 games only
-all_props = []
-for i, game in enumerate(games[:MAX_GAMES], 1):  # Only first 5 games
-    print(f"[{i}/{MAX_GAMES}] Getting passing yards for: {game['away_team']} @ {game['home_team']}")
-    
-    props_response = requests.get(
-        f'https://api.the-odds-api.com/v4/sports/{SPORT}/events/{game['id']}/odds',
-        params={
-            'apiKey': API_KEY,
+MAX_GAMES = int(os.getenv('ODDS_MAX_GAMES', '5'))  # Limit to 5 games (0 = full slate)
+REQUEST_TIMEOUT = 10  # Seconds per HTTP request so a stalled call can't hang the refresh
+
+# Concurrent event fetching
+MAX_CONCURRENCY = int(os.getenv('ODDS_MAX_CONCURRENCY', '4'))  # Event odds requests in flight at once
+REQUESTS_PER_SECOND = float(os.getenv('ODDS_REQUESTS_PER_SECOND', '5'))  # Token bucket refill rate
+MAX_RETRIES = 3  # Attempts per event after the first one
+RETRY_BACKOFF = 0.5  # Seconds, doubled after every failed attempt
+QUOTA_RESERVE = int(os.getenv('ODDS_QUOTA_RESERVE', '0'))  # Stop fetching when remaining credits hit this
+QUOTA_PROBE_INTERVAL = int(os.getenv('ODDS_QUOTA_PROBE_INTERVAL', str(6 * 60 * 60)))  # Seconds between quota re-checks once stopped (0 = wait for the monthly reset)
+ODDS_CACHE_TTL = int(os.getenv('ODDS_CACHE_TTL', '60'))  # Seconds a cached Odds API response is reused as-is
+
+OUTPUT_FILE = 'backend/data_storage/qb_passing_yards.json'
+
+
+class SportsbookAPIError(Exception):
+    """Raised when the Odds API game list cannot be fetched"""
+
+
+class QuotaExhaustedError(SportsbookAPIError):
+    """Raised when the Odds API credit quota is at or below QUOTA_RESERVE"""
+
+
+def seconds_until_quota_reset(now=None):
+    """Seconds until the Odds API monthly quota resets (start of next month, UTC)"""
+    now = now or datetime.now(timezone.utc)
+    if now.month == 12:
+        reset = datetime(now.year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        reset = datetime(now.year, now.month + 1, 1, tzinfo=timezone.utc)
+    return (reset - now).total_seconds()
+
+
+class OddsRateLimiter:
+    """
+    Token bucket shared by every Odds API request
+
+    Tokens refill at `rate` per second up to `capacity`. The bucket also tracks the
+    quota headers the Odds API returns on every response (x-requests-remaining,
+    x-requests-used, x-requests-last) and refuses new requests once the remaining
+    credits drop to `reserve`. A 429 pauses the whole bucket for Retry-After seconds.
+
+    The quota lockout expires after `probe_interval` seconds, or at the monthly
+    reset if that comes first. A single probe request is then let through to
+    re-read x-requests-remaining: if the credits are back the lockout lifts,
+    otherwise it starts over.
+    """
+
+    def __init__(self, rate, capacity, reserve=0, probe_interval=QUOTA_PROBE_INTERVAL, clock=time.time):
+        self.rate = rate
+        self.capacity = capacity
+        self.reserve = reserve
+        self.probe_interval = probe_interval
+        self.clock = clock  # Wall clock for the quota lockout (the month boundary is a calendar date)
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.quota_remaining = None
+        self.quota_used = None
+        self.last_cost = None
+        self.locked_until = None
+        self._lock = threading.Lock()
+
+    def _lockout_expiry(self, now):
+        """When a lockout starting at `now` lifts: after probe_interval, or at the monthly reset"""
+        until_reset = seconds_until_quota_reset(datetime.fromtimestamp(now, timezone.utc))
+        if self.probe_interval > 0:
+            return now + min(self.probe_interval, until_reset)
+        return now + until_reset
+
+    def _at_reserve(self):
+        return self.quota_remaining is not None and self.quota_remaining <= self.reserve
+
+    def quota_exhausted(self):
+        """True while requests are refused for quota (False once a probe is due)"""
+        with self._lock:
+            if not self._at_reserve():
+                return False
+            now = self.clock()
+            if self.locked_until is None:
+                self.locked_until = self._lockout_expiry(now)
+            return now < self.locked_until
+
+    def acquire(self):
+        """Block until a token is available, or raise QuotaExhaustedError"""
+        probing = False
+        while True:
+            with self._lock:
+                if self._at_reserve() and not probing:
+                    now = self.clock()
+                    if self.locked_until is None:
+                        self.locked_until = self._lockout_expiry(now)
+                    if now < self.locked_until:
+                        raise QuotaExhaustedError(
+                            f"Odds API quota exhausted ({self.quota_remaining} credits left, reserve {self.reserve})"
+                        )
+                    # Lockout expired: this request probes the quota, everyone else waits for its answer
+                    self.locked_until = self._lockout_expiry(now)
+                    probing = True
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if now >= self.paused_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def record_response(self, response):
+        """Update quota state from response headers and back off on 429"""
+        headers = response.headers
+        with self._lock:
+            if headers.get('x-requests-remaining') is not None:
+                self.quota_remaining = int(float(headers['x-requests-remaining']))
+                if self.quota_remaining > self.reserve:
+                    self.locked_until = None
+                elif self.locked_until is None:
+                    self.locked_until = self._lockout_expiry(self.clock())
+            if headers.get('x-requests-used') is not None:
+                self.quota_used = int(float(headers['x-requests-used']))
+            if headers.get('x-requests-last') is not None:
+                self.last_cost = int(float(headers['x-requests-last']))
+            if response.status_code == 429:
+                retry_after = headers.get('Retry-After')
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else 1.0
+                self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+
+# Shared across refreshes so the rate and quota state persist between runs
+RATE_LIMITER = OddsRateLimiter(REQUESTS_PER_SECOND, MAX_CONCURRENCY, QUOTA_RESERVE)
+
+
+def _get(path, params, limiter=RATE_LIMITER, ttl=None):
+    """
+    Rate-limited, cached GET against the Odds API
+
+    Fresh cache hits skip the network (and the rate limiter) entirely; stale entries
+    are revalidated with a conditional request.
+    """
+    url = f'{ODDS_API_BASE_URL}{path}'
+    request_params = {'apiKey': API_KEY, **params}
+
+    def send(conditional_headers):
+        limiter.acquire()
+        response = get_session().get(
+            url,
+            params=request_params,
+            headers=conditional_headers,
+            timeout=REQUEST_TIMEOUT,
+            stream=True
+        )
+        limiter.record_response(response)
+        return response
+
+    return RESPONSE_CACHE.get(url, request_params, ODDS_CACHE_TTL if ttl is None else ttl, send)
+
+
+def fetch_event_odds(game, limiter=RATE_LIMITER, max_retries=MAX_RETRIES):
+    """
+    Fetch passing yards odds for one event, retrying transient failures
+
+    Network errors, 429s and 5xx responses are retried with exponential backoff.
+    Other 4xx responses (bad key, unknown event) are not.
+
+    Returns:
+        tuple: (event odds document or None if it could not be fetched, changed)
+    """
+    label = f"{game['away_team']} @ {game['home_team']}"
+    for attempt in range(max_retries + 1):
+        try:
+            props_response = _get(
+                f'/sports/{SPORT}/events/{game["id"]}/odds',
+                {
+                    'regions': REGIONS,
+                    'markets': MARKETS,
+                    'oddsFormat': 'american',
+                },
+                limiter
+            )
+        except requests.exceptions.RequestException as e:
+            error = str(e)
+        else:
+            if props_response.status_code == 200:
+                print(f"  ✅ {label}{' (cached)' if props_response.from_cache else ''}")
+                return props_response.json(), props_response.changed
+            error = f"HTTP {props_response.status_code}"
+            if props_response.status_code != 429 and props_response.status_code < 500:
+                break
+
+        if attempt < max_retries:
+            time.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+    print(f"  ❌ Error for {label}: {error}")
+    return None, True
+
+
+def fetch_all_event_odds(games, max_workers=MAX_CONCURRENCY, limiter=RATE_LIMITER):
+    """
+    Fetch odds for every event with a bounded worker pool
+
+    Returns:
+        tuple: (event odds documents in slate order with failed events left out,
+                whether any event's odds changed or failed)
+    """
+    if not games:
+        return [], False
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='odds') as executor:
+        results = list(executor.map(lambda game: fetch_event_odds(game, limiter), games))
+    all_props = [props for props, _ in results if props is not None]
+    return all_props, any(changed for _, changed in results)
+
+
+# Event ids selected on the previous fetch; a different slate counts as a change
+_last_selected_ids = None
+
+
+def fetch_sportsbook_props(max_games=MAX_GAMES, max_workers=MAX_CONCURRENCY):
+    """
+    Fetch QB passing yards props for the first max_games NFL games
+
+    Args:
+        max_games (int): Number of games to pull (0 = full slate)
+        max_workers (int): Event odds requests in flight at once
+
+    Returns:
+        tuple: (one Odds API event odds document per game, changed) where changed is
+        False only when the slate and every event's odds match the previous fetch
+    """
+    global _last_selected_ids
+
+    # Step 1: Get all NFL games
+    games_response = _get(
+        f'/sports/{SPORT}/odds',
+        {
             'regions': REGIONS,
-            'markets': MARKETS,
+            'markets': 'h2h',
             'oddsFormat': 'american',
         }
     )
-    
-    if props_response.status_code == 200:
-        all_props.append(props_response.json())
-    else:
-        print(f"  ❌ Error: {props_response.status_code}")
-
-os.makedirs('backend/data_storage', exist_ok=True)  # Create folder if it doesn't exist
-# Save to file for later use
-with open('backend/data_storage/qb_passing_yards.json', 'w') as f:  # Changed filename from qb_passing_tds.json
-    json.dump(all_props, f, indent=2)
-
-print(f"✅ Successfully pulled QB passing yards for {len(all_props)} games")
-print(f"📁 Saved to backend/data_storage/qb_passing_yards.json")  # Changed print statement
-print(f"💳 Credits remaining: {props_response.headers.get('x-requests-remaining')}")
-print(f"💳 Credits used this month: {props_response.headers.get('x-requests-used')}")
-print(f"💰 Credits used this call: 5 (1 per game)")
\ No newline at end of file
+
+    if games_response.status_code != 200: # 200 is successful
+        print(f"Error getting games: {games_response.status_code}")
+        print(games_response.text)
+        raise SportsbookAPIError(f"Error getting games: {games_response.status_code}")
+
+    games = games_response.json()
+    selected_games = games[:max_games] if max_games else games
+    print(f"Found {len(games)} NFL games")
+    print(f"Pulling QB passing yards for {len(selected_games)} games ({max_workers} at a time)\n")
+
+    # Step 2: Get QB passing yards props for the selected games concurrently
+    all_props, odds_changed = fetch_all_event_odds(selected_games, max_workers)
+
+    # The h2h odds in the games list move constantly, so compare the slate itself
+    selected_ids = [game['id'] for game in selected_games]
+    changed = odds_changed or selected_ids != _last_selected_ids
+    _last_selected_ids = selected_ids
+
+    print(f"✅ Successfully pulled QB passing yards for {len(all_props)} games")
+    print(f"💳 Credits remaining: {RATE_LIMITER.quota_remaining}")
+    print(f"💳 Credits used this month: {RATE_LIMITER.quota_used}")
+    print(f"💰 Credits used this call: {len(selected_games)} (1 per game, fewer when cached)")
+
+    return all_props, changed
+
+
+def get_sportsbook_props(max_games=MAX_GAMES, max_workers=MAX_CONCURRENCY):
+    """
+    Fetch QB passing yards props for the first max_games NFL games
+
+    Returns:
+        list: One Odds API event odds document per game
+    """
+    all_props, _ = fetch_sportsbook_props(max_games, max_workers)
+    return all_props
+
+
+def save_sportsbook_props(all_props):
+    """Save sportsbook props to file for later use"""
+    os.makedirs('backend/data_storage', exist_ok=True)  # Create folder if it doesn't exist
+    with open(OUTPUT_FILE, 'w') as f:  # Changed filename from qb_passing_tds.json
+        json.dump(all_props, f, indent=2)
+    print(f"📁 Saved to {OUTPUT_FILE}")  # Changed print statement
+
+
+if __name__ == "__main__":
+    try:
+        save_sportsbook_props(get_sportsbook_props())
+    except SportsbookAPIError:
+        exit()
@@ -225,15 +225,18 @@ def save_matches(matches):
         json.dump(matches, f, indent=2)
     print(f"\n📁 Saved {len(matches)} matches to backend/data_storage/matched_yards.json")
 
-def main():
-    """Main matching workflow"""
-    print("\n" + "🔄" * 30)
-    print("PRIZEPICKS EV FINDER - PROP MATCHING (PASSING YARDS)")  # Changed title
-    print("🔄" * 30)
+def run_matching(sportsbook_data, prizepicks_data, save=True):
+    """
+    Match already-loaded sportsbook and PrizePicks data
     
-    # Load data
-    sportsbook_data, prizepicks_data = load_data()
+    Args:
+        sportsbook_data (list): Event odds documents from sportsbookapi
+        prizepicks_data (dict): JSON:API document from prizepicksapi
+        save (bool): Also write the matches to matched_yards.json
     
+    Returns:
+        list: Matched props
+    """
     # Extract players from sportsbook (these are the only ones we care about!)
     sportsbook_players = extract_sportsbook_players(sportsbook_data)
     
@@ -247,9 +250,22 @@ def main():
     display_matches(matches)
     
     # Save to file
-    if matches:
+    if matches and save:
         save_matches(matches)
     
+    return matches
+
+def main():
+    """Main matching workflow"""
+    print("\n" + "🔄" * 30)
+    print("PRIZEPICKS EV FINDER - PROP MATCHING (PASSING YARDS)")  # Changed title
+    print("🔄" * 30)
+    
+    # Load data
+    sportsbook_data, prizepicks_data = load_data()
+    
+    matches = run_matching(sportsbook_data, prizepicks_data)
+    
     print("\n" + "="*60)
     print("✅ MATCHING COMPLETE!")
     print("="*60)
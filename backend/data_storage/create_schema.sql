@@ -24,6 +24,8 @@ CREATE TABLE IF NOT EXISTS users (
 -- ============================================================================
 -- WALLETS TABLE
 -- Tracks user account balances and lifetime totals
+-- Maintained from transactions by the wallet ledger triggers below;
+-- verify or rebuild with wallet_ledger.py
 -- ============================================================================
 CREATE TABLE IF NOT EXISTS wallets (
     wallet_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -130,6 +132,71 @@ CREATE TABLE IF NOT EXISTS transactions (
     FOREIGN KEY (related_entry_id) REFERENCES entries(entry_id) ON DELETE SET NULL
 );
 
+-- ============================================================================
+-- USER DAILY STATS (ROLLUP)
+-- Settled entries aggregated per user per day (DATE(entries.created_at))
+-- Maintained by the rollup triggers below; rebuild with rollups.rebuild_rollups()
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS user_daily_stats (
+    user_id INTEGER NOT NULL,
+    day TEXT NOT NULL,  -- YYYY-MM-DD
+    winning_entries INTEGER NOT NULL DEFAULT 0,
+    losing_entries INTEGER NOT NULL DEFAULT 0,
+    total_winnings REAL NOT NULL DEFAULT 0,  -- actual_payout of won entries
+    total_wagered REAL NOT NULL DEFAULT 0,  -- entry_amount of won + lost entries
+    PRIMARY KEY (user_id, day)
+) WITHOUT ROWID;
+
+-- ============================================================================
+-- LINE DAILY STATS (ROLLUP)
+-- Settled picks aggregated per line (player + stat + line + selection) per day
+-- (DATE(picks.created_at)) and per user state
+-- Maintained by the rollup triggers below; rebuild with rollups.rebuild_rollups()
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS line_daily_stats (
+    player_id INTEGER NOT NULL,
+    stat_type TEXT NOT NULL,
+    line DECIMAL(10, 2) NOT NULL,
+    selection TEXT NOT NULL,
+    state TEXT NOT NULL,  -- State of the user who made the pick
+    day TEXT NOT NULL,  -- YYYY-MM-DD
+    times_hit INTEGER NOT NULL DEFAULT 0,
+    times_missed INTEGER NOT NULL DEFAULT 0,
+    revenue REAL NOT NULL DEFAULT 0,  -- actual_payout of won entries, once per hit pick
+    PRIMARY KEY (player_id, stat_type, line, selection, state, day)
+) WITHOUT ROWID;
+
+-- ============================================================================
+-- TABLE COUNTS
+-- Row counts of users, entries and picks for the analytics metadata, so they
+-- are a lookup rather than a COUNT(*) scan
+-- Maintained by the count triggers below; rebuild with rollups.rebuild_rollups()
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS table_counts (
+    table_name TEXT PRIMARY KEY,
+    row_count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+INSERT OR IGNORE INTO table_counts (table_name) VALUES ('users'), ('entries'), ('picks');
+
+-- ============================================================================
+-- USER SEARCH INDEX
+-- Trigram full-text index over the searchable user columns, so substring
+-- searches are index lookups instead of a leading-wildcard LIKE scan.
+-- External content: the text lives in users, rowid = users.user_id.
+-- Kept in sync by the search triggers below; rebuild with
+-- INSERT INTO users_fts(users_fts) VALUES('rebuild')
+-- ============================================================================
+CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+    username,
+    email,
+    first_name,
+    last_name,
+    content='users',
+    content_rowid='user_id',
+    tokenize='trigram'
+);
+
 -- ============================================================================
 -- INDEXES FOR PERFORMANCE
 -- Speed up common queries
@@ -153,20 +220,415 @@ CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date);
 CREATE INDEX IF NOT EXISTS idx_games_status ON games(status);
 
 -- Entry lookups
-CREATE INDEX IF NOT EXISTS idx_entries_user_id ON entries(user_id);
-CREATE INDEX IF NOT EXISTS idx_entries_status ON entries(status);
 CREATE INDEX IF NOT EXISTS idx_entries_created_at ON entries(created_at);
 
+-- Entry history: one user's entries newest first, paged by (created_at, entry_id)
+CREATE INDEX IF NOT EXISTS idx_entries_user_created ON entries(user_id, created_at DESC, entry_id DESC);
+
+-- Top winners, all states: settled entries in a date range, covering the aggregated columns
+CREATE INDEX IF NOT EXISTS idx_entries_status_created_cover
+    ON entries(status, created_at, user_id, entry_amount, actual_payout);
+
+-- Top winners by state / user profiles: one user's entries by status and date (also serves user_id lookups)
+CREATE INDEX IF NOT EXISTS idx_entries_user_status_cover
+    ON entries(user_id, status, created_at, entry_amount, actual_payout);
+
 -- Pick lookups
-CREATE INDEX IF NOT EXISTS idx_picks_entry_id ON picks(entry_id);
-CREATE INDEX IF NOT EXISTS idx_picks_player_id ON picks(player_id);
-CREATE INDEX IF NOT EXISTS idx_picks_result ON picks(result);
+
+-- Top hit lines in a date range: settled picks by date, covering the grouped line columns
+CREATE INDEX IF NOT EXISTS idx_picks_result_created_cover
+    ON picks(result, created_at, player_id, stat_type, line, selection, entry_id);
+
+-- Top hit lines, all dates: picks already in GROUP BY order (also serves player_id lookups)
+CREATE INDEX IF NOT EXISTS idx_picks_line_result_cover
+    ON picks(player_id, stat_type, line, selection, result, entry_id);
+
+-- Top hit lines by state / an entry's picks: covering lookup by entry_id
+CREATE INDEX IF NOT EXISTS idx_picks_entry_cover
+    ON picks(entry_id, result, created_at, player_id, stat_type, line, selection);
+
+-- Single-column indexes superseded by the composite indexes above (dropped on upgrade)
+DROP INDEX IF EXISTS idx_entries_user_id;
+DROP INDEX IF EXISTS idx_entries_status;
+DROP INDEX IF EXISTS idx_picks_entry_id;
+DROP INDEX IF EXISTS idx_picks_player_id;
+DROP INDEX IF EXISTS idx_picks_result;
 
 -- Transaction lookups
 CREATE INDEX IF NOT EXISTS idx_transactions_user_id ON transactions(user_id);
 CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(transaction_type);
 CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(transaction_date);
 
+-- Rollup lookups by date range
+CREATE INDEX IF NOT EXISTS idx_user_daily_stats_day ON user_daily_stats(day);
+CREATE INDEX IF NOT EXISTS idx_line_daily_stats_day ON line_daily_stats(day, state);
+
+-- ============================================================================
+-- ROLLUP TRIGGERS
+-- Keep user_daily_stats and line_daily_stats in step with entries and picks.
+-- Every change removes the old row's contribution and adds the new one, so
+-- settling, re-settling and deleting are all handled the same way.
+-- (A user changing state is not tracked; run rollups.rebuild_rollups() after that.)
+-- ============================================================================
+
+-- Entry settled / created settled: add to the user's day
+CREATE TRIGGER IF NOT EXISTS trg_rollup_entries_insert
+AFTER INSERT ON entries
+WHEN NEW.status IN ('won', 'lost')
+BEGIN
+    INSERT INTO user_daily_stats (user_id, day, winning_entries, losing_entries, total_winnings, total_wagered)
+    VALUES (
+        NEW.user_id,
+        DATE(NEW.created_at),
+        NEW.status = 'won',
+        NEW.status = 'lost',
+        CASE WHEN NEW.status = 'won' THEN NEW.actual_payout ELSE 0 END,
+        NEW.entry_amount
+    )
+    ON CONFLICT (user_id, day) DO UPDATE SET
+        winning_entries = winning_entries + excluded.winning_entries,
+        losing_entries = losing_entries + excluded.losing_entries,
+        total_winnings = total_winnings + excluded.total_winnings,
+        total_wagered = total_wagered + excluded.total_wagered;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rollup_entries_update
+AFTER UPDATE OF user_id, entry_amount, actual_payout, status, created_at ON entries
+BEGIN
+    -- Remove the old contribution
+    UPDATE user_daily_stats SET
+        winning_entries = winning_entries - (OLD.status = 'won'),
+        losing_entries = losing_entries - (OLD.status = 'lost'),
+        total_winnings = total_winnings - CASE WHEN OLD.status = 'won' THEN OLD.actual_payout ELSE 0 END,
+        total_wagered = total_wagered - OLD.entry_amount
+    WHERE OLD.status IN ('won', 'lost')
+      AND user_id = OLD.user_id
+      AND day = DATE(OLD.created_at);
+
+    -- Add the new contribution
+    INSERT INTO user_daily_stats (user_id, day, winning_entries, losing_entries, total_winnings, total_wagered)
+    SELECT
+        NEW.user_id,
+        DATE(NEW.created_at),
+        NEW.status = 'won',
+        NEW.status = 'lost',
+        CASE WHEN NEW.status = 'won' THEN NEW.actual_payout ELSE 0 END,
+        NEW.entry_amount
+    WHERE NEW.status IN ('won', 'lost')
+    ON CONFLICT (user_id, day) DO UPDATE SET
+        winning_entries = winning_entries + excluded.winning_entries,
+        losing_entries = losing_entries + excluded.losing_entries,
+        total_winnings = total_winnings + excluded.total_winnings,
+        total_wagered = total_wagered + excluded.total_wagered;
+
+    -- Line revenue counts the entry's payout once per hit pick while the entry is won
+    UPDATE line_daily_stats SET
+        revenue = line_daily_stats.revenue
+            - CASE WHEN OLD.status = 'won' THEN OLD.actual_payout ELSE 0 END * h.hits
+            + CASE WHEN NEW.status = 'won' THEN NEW.actual_payout ELSE 0 END * h.hits
+    FROM (
+        SELECT pk.player_id, pk.stat_type, pk.line, pk.selection, DATE(pk.created_at) AS day, COUNT(*) AS hits
+        FROM picks pk
+        WHERE pk.entry_id = NEW.entry_id AND pk.result = 'hit'
+        GROUP BY pk.player_id, pk.stat_type, pk.line, pk.selection, DATE(pk.created_at)
+    ) AS h
+    WHERE (OLD.status = 'won' OR NEW.status = 'won')
+      AND line_daily_stats.player_id = h.player_id
+      AND line_daily_stats.stat_type = h.stat_type
+      AND line_daily_stats.line = h.line
+      AND line_daily_stats.selection = h.selection
+      AND line_daily_stats.day = h.day
+      AND line_daily_stats.state = (SELECT state FROM users WHERE user_id = NEW.user_id);
+END;
+
+-- BEFORE so the entry's picks can still be read (and joined to it) to remove their line stats;
+-- the picks delete trigger skips picks whose entry is already gone
+CREATE TRIGGER IF NOT EXISTS trg_rollup_entries_delete
+BEFORE DELETE ON entries
+BEGIN
+    UPDATE user_daily_stats SET
+        winning_entries = winning_entries - (OLD.status = 'won'),
+        losing_entries = losing_entries - (OLD.status = 'lost'),
+        total_winnings = total_winnings - CASE WHEN OLD.status = 'won' THEN OLD.actual_payout ELSE 0 END,
+        total_wagered = total_wagered - OLD.entry_amount
+    WHERE OLD.status IN ('won', 'lost')
+      AND user_id = OLD.user_id
+      AND day = DATE(OLD.created_at);
+
+    UPDATE line_daily_stats SET
+        times_hit = line_daily_stats.times_hit - s.hits,
+        times_missed = line_daily_stats.times_missed - s.misses,
+        revenue = line_daily_stats.revenue - CASE WHEN OLD.status = 'won' THEN OLD.actual_payout ELSE 0 END * s.hits
+    FROM (
+        SELECT
+            pk.player_id, pk.stat_type, pk.line, pk.selection, DATE(pk.created_at) AS day,
+            SUM(pk.result = 'hit') AS hits,
+            SUM(pk.result = 'miss') AS misses
+        FROM picks pk
+        WHERE pk.entry_id = OLD.entry_id AND pk.result IN ('hit', 'miss')
+        GROUP BY pk.player_id, pk.stat_type, pk.line, pk.selection, DATE(pk.created_at)
+    ) AS s
+    WHERE line_daily_stats.player_id = s.player_id
+      AND line_daily_stats.stat_type = s.stat_type
+      AND line_daily_stats.line = s.line
+      AND line_daily_stats.selection = s.selection
+      AND line_daily_stats.day = s.day
+      AND line_daily_stats.state = (SELECT state FROM users WHERE user_id = OLD.user_id);
+END;
+
+-- Pick settled / created settled: add to the line's day
+CREATE TRIGGER IF NOT EXISTS trg_rollup_picks_insert
+AFTER INSERT ON picks
+WHEN NEW.result IN ('hit', 'miss')
+BEGIN
+    INSERT INTO line_daily_stats (player_id, stat_type, line, selection, state, day, times_hit, times_missed, revenue)
+    SELECT
+        NEW.player_id,
+        NEW.stat_type,
+        NEW.line,
+        NEW.selection,
+        u.state,
+        DATE(NEW.created_at),
+        NEW.result = 'hit',
+        NEW.result = 'miss',
+        CASE WHEN NEW.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END
+    FROM entries e
+    JOIN users u ON u.user_id = e.user_id
+    WHERE e.entry_id = NEW.entry_id
+    ON CONFLICT (player_id, stat_type, line, selection, state, day) DO UPDATE SET
+        times_hit = times_hit + excluded.times_hit,
+        times_missed = times_missed + excluded.times_missed,
+        revenue = revenue + excluded.revenue;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rollup_picks_update
+AFTER UPDATE OF entry_id, player_id, stat_type, line, selection, result, created_at ON picks
+BEGIN
+    -- Remove the old contribution
+    UPDATE line_daily_stats SET
+        times_hit = line_daily_stats.times_hit - (OLD.result = 'hit'),
+        times_missed = line_daily_stats.times_missed - (OLD.result = 'miss'),
+        revenue = line_daily_stats.revenue - CASE WHEN OLD.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END
+    FROM entries e
+    JOIN users u ON u.user_id = e.user_id
+    WHERE OLD.result IN ('hit', 'miss')
+      AND e.entry_id = OLD.entry_id
+      AND line_daily_stats.player_id = OLD.player_id
+      AND line_daily_stats.stat_type = OLD.stat_type
+      AND line_daily_stats.line = OLD.line
+      AND line_daily_stats.selection = OLD.selection
+      AND line_daily_stats.state = u.state
+      AND line_daily_stats.day = DATE(OLD.created_at);
+
+    -- Add the new contribution
+    INSERT INTO line_daily_stats (player_id, stat_type, line, selection, state, day, times_hit, times_missed, revenue)
+    SELECT
+        NEW.player_id,
+        NEW.stat_type,
+        NEW.line,
+        NEW.selection,
+        u.state,
+        DATE(NEW.created_at),
+        NEW.result = 'hit',
+        NEW.result = 'miss',
+        CASE WHEN NEW.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END
+    FROM entries e
+    JOIN users u ON u.user_id = e.user_id
+    WHERE NEW.result IN ('hit', 'miss')
+      AND e.entry_id = NEW.entry_id
+    ON CONFLICT (player_id, stat_type, line, selection, state, day) DO UPDATE SET
+        times_hit = times_hit + excluded.times_hit,
+        times_missed = times_missed + excluded.times_missed,
+        revenue = revenue + excluded.revenue;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_rollup_picks_delete
+AFTER DELETE ON picks
+WHEN OLD.result IN ('hit', 'miss')
+BEGIN
+    UPDATE line_daily_stats SET
+        times_hit = line_daily_stats.times_hit - (OLD.result = 'hit'),
+        times_missed = line_daily_stats.times_missed - (OLD.result = 'miss'),
+        revenue = line_daily_stats.revenue - CASE WHEN OLD.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END
+    FROM entries e
+    JOIN users u ON u.user_id = e.user_id
+    WHERE e.entry_id = OLD.entry_id
+      AND line_daily_stats.player_id = OLD.player_id
+      AND line_daily_stats.stat_type = OLD.stat_type
+      AND line_daily_stats.line = OLD.line
+      AND line_daily_stats.selection = OLD.selection
+      AND line_daily_stats.state = u.state
+      AND line_daily_stats.day = DATE(OLD.created_at);
+END;
+
+-- ============================================================================
+-- TABLE COUNT TRIGGERS
+-- One row added or removed per statement row; bulk loads that drop these
+-- triggers recompute the counts with rollups.rebuild_rollups()
+-- ============================================================================
+
+CREATE TRIGGER IF NOT EXISTS trg_table_counts_users_insert
+AFTER INSERT ON users
+BEGIN
+    UPDATE table_counts SET row_count = row_count + 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_table_counts_users_delete
+AFTER DELETE ON users
+BEGIN
+    UPDATE table_counts SET row_count = row_count - 1 WHERE table_name = 'users';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_table_counts_entries_insert
+AFTER INSERT ON entries
+BEGIN
+    UPDATE table_counts SET row_count = row_count + 1 WHERE table_name = 'entries';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_table_counts_entries_delete
+AFTER DELETE ON entries
+BEGIN
+    UPDATE table_counts SET row_count = row_count - 1 WHERE table_name = 'entries';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_table_counts_picks_insert
+AFTER INSERT ON picks
+BEGIN
+    UPDATE table_counts SET row_count = row_count + 1 WHERE table_name = 'picks';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_table_counts_picks_delete
+AFTER DELETE ON picks
+BEGIN
+    UPDATE table_counts SET row_count = row_count - 1 WHERE table_name = 'picks';
+END;
+
+-- ============================================================================
+-- USER SEARCH TRIGGERS
+-- Mirror every users change into users_fts (external content tables must be
+-- told the old values to remove them from the index)
+-- ============================================================================
+
+CREATE TRIGGER IF NOT EXISTS trg_users_fts_insert
+AFTER INSERT ON users
+BEGIN
+    INSERT INTO users_fts (rowid, username, email, first_name, last_name)
+    VALUES (NEW.user_id, NEW.username, NEW.email, NEW.first_name, NEW.last_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_fts_delete
+AFTER DELETE ON users
+BEGIN
+    INSERT INTO users_fts (users_fts, rowid, username, email, first_name, last_name)
+    VALUES ('delete', OLD.user_id, OLD.username, OLD.email, OLD.first_name, OLD.last_name);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_users_fts_update
+AFTER UPDATE OF user_id, username, email, first_name, last_name ON users
+BEGIN
+    INSERT INTO users_fts (users_fts, rowid, username, email, first_name, last_name)
+    VALUES ('delete', OLD.user_id, OLD.username, OLD.email, OLD.first_name, OLD.last_name);
+    INSERT INTO users_fts (rowid, username, email, first_name, last_name)
+    VALUES (NEW.user_id, NEW.username, NEW.email, NEW.first_name, NEW.last_name);
+END;
+
+-- ============================================================================
+-- WALLET LEDGER TRIGGERS
+-- transactions is the ledger; wallets holds its running totals per user.
+-- Only completed transactions count. Every change removes the old row's
+-- effect and applies the new one. Amounts are rounded to cents per
+-- transaction, so removing a transaction exactly undoes applying it.
+--   deposit     +balance  +total_deposits
+--   withdrawal  -balance  +total_withdrawals
+--   bet_placed  -balance  +total_wagered
+--   payout      +balance  +total_winnings
+--   refund      +balance  -total_wagered
+--   bonus       +balance
+-- updated_at is the date of the user's latest completed transaction.
+-- Verify or rebuild with wallet_ledger.py
+-- ============================================================================
+
+CREATE TRIGGER IF NOT EXISTS trg_wallet_ledger_insert
+AFTER INSERT ON transactions
+WHEN NEW.status = 'completed'
+BEGIN
+    INSERT OR IGNORE INTO wallets (user_id, updated_at) VALUES (NEW.user_id, NEW.transaction_date);
+
+    UPDATE wallets SET
+        current_balance = ROUND(current_balance
+            + CASE WHEN NEW.transaction_type IN ('withdrawal', 'bet_placed') THEN -ROUND(NEW.amount, 2) ELSE ROUND(NEW.amount, 2) END, 2),
+        total_deposits = ROUND(total_deposits + CASE WHEN NEW.transaction_type = 'deposit' THEN ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        total_withdrawals = ROUND(total_withdrawals + CASE WHEN NEW.transaction_type = 'withdrawal' THEN ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        total_winnings = ROUND(total_winnings + CASE WHEN NEW.transaction_type = 'payout' THEN ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        total_wagered = ROUND(total_wagered + CASE NEW.transaction_type
+            WHEN 'bet_placed' THEN ROUND(NEW.amount, 2) WHEN 'refund' THEN -ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        -- The first completed transaction replaces the wallet's creation time
+        updated_at = CASE WHEN EXISTS (
+            SELECT 1 FROM transactions
+            WHERE user_id = NEW.user_id AND status = 'completed' AND transaction_id <> NEW.transaction_id
+        ) THEN MAX(updated_at, NEW.transaction_date) ELSE NEW.transaction_date END
+    WHERE user_id = NEW.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_wallet_ledger_update
+AFTER UPDATE OF user_id, transaction_type, amount, status ON transactions
+BEGIN
+    -- Remove the old effect
+    UPDATE wallets SET
+        current_balance = ROUND(current_balance
+            - CASE WHEN OLD.transaction_type IN ('withdrawal', 'bet_placed') THEN -ROUND(OLD.amount, 2) ELSE ROUND(OLD.amount, 2) END, 2),
+        total_deposits = ROUND(total_deposits - CASE WHEN OLD.transaction_type = 'deposit' THEN ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        total_withdrawals = ROUND(total_withdrawals - CASE WHEN OLD.transaction_type = 'withdrawal' THEN ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        total_winnings = ROUND(total_winnings - CASE WHEN OLD.transaction_type = 'payout' THEN ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        total_wagered = ROUND(total_wagered - CASE OLD.transaction_type
+            WHEN 'bet_placed' THEN ROUND(OLD.amount, 2) WHEN 'refund' THEN -ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        updated_at = COALESCE((
+            SELECT MAX(transaction_date) FROM transactions
+            WHERE user_id = OLD.user_id AND status = 'completed'
+        ), updated_at)
+    WHERE OLD.status = 'completed'
+      AND user_id = OLD.user_id;
+
+    -- Apply the new effect
+    INSERT OR IGNORE INTO wallets (user_id, updated_at)
+    SELECT NEW.user_id, NEW.transaction_date WHERE NEW.status = 'completed';
+
+    UPDATE wallets SET
+        current_balance = ROUND(current_balance
+            + CASE WHEN NEW.transaction_type IN ('withdrawal', 'bet_placed') THEN -ROUND(NEW.amount, 2) ELSE ROUND(NEW.amount, 2) END, 2),
+        total_deposits = ROUND(total_deposits + CASE WHEN NEW.transaction_type = 'deposit' THEN ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        total_withdrawals = ROUND(total_withdrawals + CASE WHEN NEW.transaction_type = 'withdrawal' THEN ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        total_winnings = ROUND(total_winnings + CASE WHEN NEW.transaction_type = 'payout' THEN ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        total_wagered = ROUND(total_wagered + CASE NEW.transaction_type
+            WHEN 'bet_placed' THEN ROUND(NEW.amount, 2) WHEN 'refund' THEN -ROUND(NEW.amount, 2) ELSE 0 END, 2),
+        -- The first completed transaction replaces the wallet's creation time
+        updated_at = CASE WHEN EXISTS (
+            SELECT 1 FROM transactions
+            WHERE user_id = NEW.user_id AND status = 'completed' AND transaction_id <> NEW.transaction_id
+        ) THEN MAX(updated_at, NEW.transaction_date) ELSE NEW.transaction_date END
+    WHERE NEW.status = 'completed'
+      AND user_id = NEW.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_wallet_ledger_delete
+AFTER DELETE ON transactions
+WHEN OLD.status = 'completed'
+BEGIN
+    UPDATE wallets SET
+        current_balance = ROUND(current_balance
+            - CASE WHEN OLD.transaction_type IN ('withdrawal', 'bet_placed') THEN -ROUND(OLD.amount, 2) ELSE ROUND(OLD.amount, 2) END, 2),
+        total_deposits = ROUND(total_deposits - CASE WHEN OLD.transaction_type = 'deposit' THEN ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        total_withdrawals = ROUND(total_withdrawals - CASE WHEN OLD.transaction_type = 'withdrawal' THEN ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        total_winnings = ROUND(total_winnings - CASE WHEN OLD.transaction_type = 'payout' THEN ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        total_wagered = ROUND(total_wagered - CASE OLD.transaction_type
+            WHEN 'bet_placed' THEN ROUND(OLD.amount, 2) WHEN 'refund' THEN -ROUND(OLD.amount, 2) ELSE 0 END, 2),
+        updated_at = COALESCE((
+            SELECT MAX(transaction_date) FROM transactions
+            WHERE user_id = OLD.user_id AND status = 'completed'
+        ), updated_at)
+    WHERE user_id = OLD.user_id;
+END;
+
 -- ============================================================================
 -- VIEWS FOR COMMON QUERIES
 -- Pre-defined queries for dashboard analytics
@@ -5,6 +5,16 @@ Reads create_schema.sql and creates the SQLite database with all tables, indexes
 
 import sqlite3
 import os
+import sys
+
+try:
+    from backend.data_storage.migrate_timestamps import sync_migrated_tables
+    from backend.data_storage.rollups import rebuild_rollups
+    from backend.data_storage.wallet_ledger import reconcile_wallets
+except ImportError:  # Run directly as a script from backend/data_storage
+    from migrate_timestamps import sync_migrated_tables
+    from rollups import rebuild_rollups
+    from wallet_ledger import reconcile_wallets
 
 # File paths - relative to project root
 # This script is in backend/data_storage/
@@ -15,6 +25,28 @@ DATA_STORAGE_DIR = os.path.join(PROJECT_ROOT, 'backend', 'data_storage')
 SCHEMA_FILE = os.path.join(DATA_STORAGE_DIR, 'create_schema.sql')
 DATABASE_FILE = os.path.join(DATA_STORAGE_DIR, 'user_data.db')
 
+# Settings for every connection that writes user_data.db
+WRITER_PRAGMAS = (
+    # Stored in the database file: readers keep reading the last commit while a
+    # writer works, instead of waiting on its lock
+    "PRAGMA journal_mode = WAL",
+    # Per connection: in WAL mode only checkpoints fsync, and a power loss can
+    # lose the latest commits but never corrupt the database
+    "PRAGMA synchronous = NORMAL",
+)
+
+def apply_writer_pragmas(conn):
+    """
+    Put a write connection into WAL mode with synchronous=NORMAL
+    
+    Returns:
+        str: The journal mode now in effect
+    """
+    mode = conn.execute(WRITER_PRAGMAS[0]).fetchone()[0]
+    for pragma in WRITER_PRAGMAS[1:]:
+        conn.execute(pragma)
+    return mode
+
 def init_database():
     """
     Initialize the database by:
@@ -50,6 +82,7 @@ def init_database():
         print(f"\n📁 Creating database at: {DATABASE_FILE}")
         conn = sqlite3.connect(DATABASE_FILE)
         cursor = conn.cursor()
+        print(f"📝 Journal mode: {apply_writer_pragmas(conn)}")
         
         # Read the schema file
         print(f"📖 Reading schema from: {SCHEMA_FILE}")
@@ -106,6 +139,80 @@ def init_database():
         print(f"\n❌ UNEXPECTED ERROR: {e}")
         return False
 
+def upgrade_database():
+    """
+    Apply the current schema to an existing database without deleting any data
+    
+    Every statement in create_schema.sql is idempotent (IF NOT EXISTS / IF EXISTS),
+    so re-running it adds new tables, indexes, triggers and views, drops superseded
+    indexes and leaves existing rows alone. Tables migrated to created_ts get its
+    covering indexes too. The database is switched to WAL mode.
+    The leaderboard rollups are then rebuilt from entries and picks, wallet totals
+    are reconciled with the transaction ledger, the user search index is rebuilt
+    from users, and ANALYZE refreshes the planner statistics so the new indexes
+    are picked up.
+    """
+    
+    print("=" * 60)
+    print("⬆️  UPGRADING PRIZEPICKS USER DATABASE SCHEMA")
+    print("=" * 60)
+    
+    if not os.path.exists(DATABASE_FILE):
+        print(f"❌ Database not found at {DATABASE_FILE}")
+        print("Run init_database.py without --upgrade to create it")
+        return False
+    
+    try:
+        conn = sqlite3.connect(DATABASE_FILE)
+        cursor = conn.cursor()
+        print(f"📝 Journal mode: {apply_writer_pragmas(conn)}")
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%'")
+        before = {row[0] for row in cursor.fetchall()}
+        
+        print(f"📖 Applying schema from: {SCHEMA_FILE}")
+        with open(SCHEMA_FILE, 'r') as f:
+            cursor.executescript(f.read())
+        
+        # Tables migrated to created_ts also need its covering indexes (migrate_timestamps.py)
+        migrated = sync_migrated_tables(cursor)
+        if migrated:
+            print(f"🕒 created_ts indexes + sync triggers ready on {', '.join(migrated)}")
+        
+        print("📊 Rebuilding leaderboard rollups...")
+        for table, count in rebuild_rollups(conn).items():
+            print(f"   {table}: {count:,} rows")
+        
+        # Wallets written before the ledger triggers existed may have drifted from transactions
+        print("💰 Reconciling wallets with the transaction ledger...")
+        print(f"   {reconcile_wallets(conn):,} wallets corrected")
+        
+        # Indexes users that existed before users_fts and its sync triggers
+        print("🔎 Rebuilding user search index...")
+        cursor.execute("INSERT INTO users_fts(users_fts) VALUES('rebuild')")
+        
+        print("📈 Refreshing query planner statistics (ANALYZE)...")
+        cursor.execute("ANALYZE")
+        conn.commit()
+        
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%'")
+        after = {row[0] for row in cursor.fetchall()}
+        
+        for name in sorted(after - before):
+            print(f"   ➕ {name}")
+        for name in sorted(before - after):
+            print(f"   ➖ {name}")
+        if before == after:
+            print("   Indexes already up to date")
+        
+        conn.close()
+        print("\n✅ DATABASE UPGRADED - existing data kept")
+        return True
+        
+    except sqlite3.Error as e:
+        print(f"\n❌ DATABASE ERROR: {e}")
+        return False
+
 def get_database_info():
     """
     Display information about the existing database
@@ -141,6 +248,9 @@ def get_database_info():
         for view in views:
             print(f"   - {view[0]}")
     
+    cursor.execute("PRAGMA journal_mode")
+    print(f"\n📝 Journal mode: {cursor.fetchone()[0]}")
+    
     # Get database file size
     db_size = os.path.getsize(DATABASE_FILE)
     print(f"\n💾 Database size: {db_size:,} bytes ({db_size / 1024:.2f} KB)")
@@ -148,6 +258,11 @@ def get_database_info():
     conn.close()
 
 if __name__ == "__main__":
+    if '--upgrade' in sys.argv:
+        # Non-destructive: python backend/data_storage/init_database.py --upgrade
+        success = upgrade_database()
+        sys.exit(0 if success else 1)
+    
     # Run the initialization
     success = init_database()
     
@@ -0,0 +1,185 @@
+"""
+Optional migration: integer epoch timestamps for entries and picks
+
+Adds a created_ts INTEGER column (UTC epoch seconds) next to created_at on the
+entries and picks tables, backfills it, indexes it and keeps it in sync with
+triggers. database_queries.py detects the column and switches its date range
+filters to created_ts, which makes range scans integer comparisons on a
+compact index instead of text comparisons.
+
+created_at is left untouched, so everything that reads it keeps working.
+
+Usage (from the project root):
+    python backend/data_storage/migrate_timestamps.py            # apply
+    python backend/data_storage/migrate_timestamps.py --revert   # undo
+"""
+
+import sqlite3
+import os
+import sys
+
+# File paths - relative to project root
+# This script is in backend/data_storage/
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))  # Go up 2 levels to project root
+DATA_STORAGE_DIR = os.path.join(PROJECT_ROOT, 'backend', 'data_storage')
+
+DATABASE_FILE = os.path.join(DATA_STORAGE_DIR, 'user_data.db')
+
+# table -> primary key column
+MIGRATED_TABLES = {
+    'entries': 'entry_id',
+    'picks': 'pick_id',
+}
+
+EPOCH_COLUMN = 'created_ts'
+
+# The covering indexes in create_schema.sql that include created_at, keyed on
+# created_ts instead: once the range filters move to created_ts, the created_at
+# versions no longer cover the leaderboard queries
+EPOCH_COVER_INDEXES = {
+    'entries': {
+        'idx_entries_status_created_ts_cover': '(status, created_ts, user_id, entry_amount, actual_payout)',
+        'idx_entries_user_status_ts_cover': '(user_id, status, created_ts, entry_amount, actual_payout)',
+    },
+    'picks': {
+        'idx_picks_result_created_ts_cover': '(result, created_ts, player_id, stat_type, line, selection, entry_id)',
+        'idx_picks_entry_ts_cover': '(entry_id, result, created_ts, player_id, stat_type, line, selection)',
+    },
+}
+
+def _has_column(cursor, table, column):
+    cursor.execute(f"PRAGMA table_info({table})")
+    return any(row[1] == column for row in cursor.fetchall())
+
+def backfill_epoch_timestamps(cursor, table):
+    """Recompute created_ts from created_at for every row of a migrated table"""
+    cursor.execute(f"""
+        UPDATE {table}
+        SET {EPOCH_COLUMN} = CAST(strftime('%s', created_at) AS INTEGER)
+        WHERE created_at IS NOT NULL
+    """)
+    return cursor.rowcount
+
+def create_epoch_sync(cursor, table):
+    """
+    Create the indexes and the triggers that keep created_ts in step with created_at
+
+    Each statement goes through cursor.execute (executescript would commit first),
+    so this runs inside the caller's transaction.
+    """
+    key = MIGRATED_TABLES[table]
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{EPOCH_COLUMN} ON {table}({EPOCH_COLUMN})")
+    for name, columns in EPOCH_COVER_INDEXES[table].items():
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}{columns}")
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{EPOCH_COLUMN}_insert
+        AFTER INSERT ON {table}
+        WHEN NEW.{EPOCH_COLUMN} IS NULL AND NEW.created_at IS NOT NULL
+        BEGIN
+            UPDATE {table}
+            SET {EPOCH_COLUMN} = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+            WHERE {key} = NEW.{key};
+        END
+    """)
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_{EPOCH_COLUMN}_update
+        AFTER UPDATE OF created_at ON {table}
+        BEGIN
+            UPDATE {table}
+            SET {EPOCH_COLUMN} = CAST(strftime('%s', NEW.created_at) AS INTEGER)
+            WHERE {key} = NEW.{key};
+        END
+    """)
+
+def sync_migrated_tables(cursor):
+    """
+    Re-create the created_ts indexes and triggers on every table that has the column
+    (init_database.py --upgrade calls this, so an upgrade keeps a migrated database
+    index-only)
+
+    Returns:
+        list: Tables that have created_ts
+    """
+    migrated = [table for table in MIGRATED_TABLES if _has_column(cursor, table, EPOCH_COLUMN)]
+    for table in migrated:
+        create_epoch_sync(cursor, table)
+    return migrated
+
+def migrate(database_file=DATABASE_FILE):
+    """
+    Add, backfill, index and sync created_ts on entries and picks
+    Safe to run more than once (it re-backfills and leaves existing objects alone)
+    """
+    print("=" * 60)
+    print("🕒 MIGRATING TIMESTAMPS TO INTEGER EPOCH SECONDS")
+    print("=" * 60)
+
+    if not os.path.exists(database_file):
+        print(f"❌ Database not found at {database_file}")
+        return False
+
+    conn = sqlite3.connect(database_file)
+    cursor = conn.cursor()
+    try:
+        # One transaction for every table: a failure leaves the database as it was
+        cursor.execute("BEGIN")
+        for table in MIGRATED_TABLES:
+            if not _has_column(cursor, table, EPOCH_COLUMN):
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {EPOCH_COLUMN} INTEGER")
+                print(f"➕ Added {table}.{EPOCH_COLUMN}")
+            rows = backfill_epoch_timestamps(cursor, table)
+            print(f"📝 Backfilled {rows:,} {table} rows")
+            create_epoch_sync(cursor, table)
+            print(f"🔍 Index + sync triggers ready on {table}")
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"\n❌ DATABASE ERROR: {e}")
+        return False
+    finally:
+        conn.close()
+
+    print("\n✅ Migration complete - restart the API server to pick up created_ts")
+    return True
+
+def revert(database_file=DATABASE_FILE):
+    """Drop the triggers, indexes and created_ts columns added by migrate()"""
+    print("=" * 60)
+    print("↩️  REVERTING EPOCH TIMESTAMP MIGRATION")
+    print("=" * 60)
+
+    if not os.path.exists(database_file):
+        print(f"❌ Database not found at {database_file}")
+        return False
+
+    conn = sqlite3.connect(database_file)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN")
+        for table in MIGRATED_TABLES:
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_{EPOCH_COLUMN}_insert")
+            cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_{EPOCH_COLUMN}_update")
+            cursor.execute(f"DROP INDEX IF EXISTS idx_{table}_{EPOCH_COLUMN}")
+            for name in EPOCH_COVER_INDEXES[table]:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+            if _has_column(cursor, table, EPOCH_COLUMN):
+                # DROP COLUMN needs SQLite 3.35+
+                cursor.execute(f"ALTER TABLE {table} DROP COLUMN {EPOCH_COLUMN}")
+            print(f"🗑️  Removed {table}.{EPOCH_COLUMN}")
+        conn.commit()
+    except sqlite3.Error as e:
+        conn.rollback()
+        print(f"\n❌ DATABASE ERROR: {e}")
+        return False
+    finally:
+        conn.close()
+
+    print("\n✅ Revert complete")
+    return True
+
+if __name__ == "__main__":
+    if '--revert' in sys.argv:
+        revert()
+    else:
+        migrate()
@@ -0,0 +1,116 @@
+"""
+Leaderboard rollup tables (user_daily_stats, line_daily_stats) and table_counts
+
+The tables and the triggers that keep them current are defined in
+create_schema.sql. This module rebuilds them from scratch: after upgrading an
+existing database, after a bulk load that ran with the triggers dropped, or
+whenever the rollups are suspected to have drifted.
+
+Usage (from the project root):
+    python backend/data_storage/rollups.py
+"""
+
+import sqlite3
+import os
+
+# File paths - relative to project root
+# This script is in backend/data_storage/
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))  # Go up 2 levels to project root
+DATA_STORAGE_DIR = os.path.join(PROJECT_ROOT, 'backend', 'data_storage')
+
+DATABASE_FILE = os.path.join(DATA_STORAGE_DIR, 'user_data.db')
+
+ROLLUP_TABLES = ('user_daily_stats', 'line_daily_stats')
+
+# Same aggregation the triggers maintain incrementally, computed in one pass
+REBUILD_SQL = """
+    DELETE FROM user_daily_stats;
+
+    INSERT INTO user_daily_stats (user_id, day, winning_entries, losing_entries, total_winnings, total_wagered)
+    SELECT
+        user_id,
+        DATE(created_at),
+        SUM(status = 'won'),
+        SUM(status = 'lost'),
+        SUM(CASE WHEN status = 'won' THEN actual_payout ELSE 0 END),
+        SUM(entry_amount)
+    FROM entries
+    WHERE status IN ('won', 'lost')
+    GROUP BY user_id, DATE(created_at);
+
+    DELETE FROM line_daily_stats;
+
+    INSERT INTO line_daily_stats (player_id, stat_type, line, selection, state, day, times_hit, times_missed, revenue)
+    SELECT
+        pk.player_id,
+        pk.stat_type,
+        pk.line,
+        pk.selection,
+        u.state,
+        DATE(pk.created_at),
+        SUM(pk.result = 'hit'),
+        SUM(pk.result = 'miss'),
+        SUM(CASE WHEN pk.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END)
+    FROM picks pk
+    JOIN entries e ON pk.entry_id = e.entry_id
+    JOIN users u ON e.user_id = u.user_id
+    WHERE pk.result IN ('hit', 'miss')
+    GROUP BY pk.player_id, pk.stat_type, pk.line, pk.selection, u.state, DATE(pk.created_at);
+"""
+
+# Row counts the table count triggers maintain (table_counts is newer than the rollups)
+COUNTS_REBUILD_SQL = """
+    DELETE FROM table_counts;
+
+    INSERT INTO table_counts (table_name, row_count)
+    SELECT 'users', COUNT(*) FROM users
+    UNION ALL SELECT 'entries', COUNT(*) FROM entries
+    UNION ALL SELECT 'picks', COUNT(*) FROM picks;
+"""
+
+def rollups_exist(cursor):
+    """Whether both rollup tables are present in the database"""
+    placeholders = ', '.join('?' for _ in ROLLUP_TABLES)
+    cursor.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+        ROLLUP_TABLES
+    )
+    return cursor.fetchone()[0] == len(ROLLUP_TABLES)
+
+def rebuild_rollups(conn):
+    """
+    Recompute user_daily_stats and line_daily_stats from entries and picks,
+    and table_counts where the database has it
+
+    Args:
+        conn: Open sqlite3 connection (committed on success)
+
+    Returns:
+        Dictionary of table name -> row count after the rebuild
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'table_counts'")
+    counts_sql = COUNTS_REBUILD_SQL if cursor.fetchone() else ''
+    cursor.executescript(f"BEGIN; {REBUILD_SQL} {counts_sql} COMMIT;")
+    counts = {}
+    for table in ROLLUP_TABLES:
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        counts[table] = cursor.fetchone()[0]
+    return counts
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("📊 REBUILDING LEADERBOARD ROLLUPS")
+    print("=" * 60)
+
+    if not os.path.exists(DATABASE_FILE):
+        print(f"❌ Database not found at {DATABASE_FILE}")
+    else:
+        conn = sqlite3.connect(DATABASE_FILE)
+        if not rollups_exist(conn.cursor()):
+            print("❌ Rollup tables missing - run init_database.py --upgrade first")
+        else:
+            for table, count in rebuild_rollups(conn).items():
+                print(f"   ✅ {table}: {count:,} rows")
+        conn.close()
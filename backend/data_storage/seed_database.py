@@ -2,20 +2,53 @@
 Seed PrizePicks User Dashboard Database with Realistic Mock Data
 
 Generates:
-- 500 users (70% casual, 24% regular, 5% winning sharps, 1% elite sharps)
+- 500 users by default (70% casual, 24% regular, 5% winning sharps, 1% elite sharps)
 - 200 real NFL players
 - 50 NFL games (Weeks 9-11 of 2025 season)
 - ~5,000 entries with varying bet sizes
 - Individual picks for each entry
 - Transaction history for all money movements
+
+Usage (from the project root):
+    python backend/data_storage/seed_database.py
+    python backend/data_storage/seed_database.py --users 1000000 --entries 16000000 --yes
+    python backend/data_storage/seed_database.py --seed 42 --workers 8
+
+Users are generated in blocks of USERS_PER_BATCH, each from its own random
+stream derived from --seed, with every pick result decided up front. Worker
+processes write the blocks to temporary shard databases, which are merged in
+block order, so a given seed produces the same rows whatever --workers is.
+Indexes and triggers are dropped for the load and recreated once it finishes,
+followed by a rebuild of the wallet totals (from the transaction ledger), the
+rollups and the user search index.
 """
 
+import argparse
+import bisect
+import multiprocessing
 import sqlite3
 import os
 import random
+import tempfile
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from decimal import Decimal
 
+try:
+    from backend.data_storage.init_database import apply_writer_pragmas
+except ImportError:  # Run directly as a script from backend/data_storage
+    from init_database import apply_writer_pragmas
+
+try:
+    from backend.data_storage.rollups import rollups_exist, rebuild_rollups
+    from backend.data_storage.migrate_timestamps import MIGRATED_TABLES, EPOCH_COLUMN, backfill_epoch_timestamps
+    from backend.data_storage.wallet_ledger import reconcile_wallets
+except ImportError:  # Run directly as a script from backend/data_storage
+    from rollups import rollups_exist, rebuild_rollups
+    from migrate_timestamps import MIGRATED_TABLES, EPOCH_COLUMN, backfill_epoch_timestamps
+    from wallet_ledger import reconcile_wallets
+
 # File paths - relative to project root
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))
@@ -55,6 +88,9 @@ ELITE_WIN_RATE = 0.58
 END_DATE = datetime(2025, 11, 12)  # Current date
 START_DATE = END_DATE - timedelta(days=30)
 
+# Written where the schema would default to CURRENT_TIMESTAMP, so a seed always reproduces the same rows
+SEED_TIMESTAMP = END_DATE
+
 # ============================================================================
 # REAL NFL DATA
 # ============================================================================
@@ -346,39 +382,39 @@ ENTRY_TYPES = [
 # HELPER FUNCTIONS
 # ============================================================================
 
-def random_date_between(start, end):
+def random_date_between(start, end, rng=random):
     """Generate random datetime between start and end dates"""
     # Handle edge case where start >= end
     if start >= end:
         return end
     
     delta = end - start
-    random_days = random.randint(0, delta.days)
-    random_seconds = random.randint(0, 86400)
+    random_days = rng.randint(0, delta.days)
+    random_seconds = rng.randint(0, 86400)
     return start + timedelta(days=random_days, seconds=random_seconds)
 
-def generate_username(first_name, last_name):
+def generate_username(first_name, last_name, rng=random):
     """Generate realistic username variations"""
     variations = [
         f"{first_name.lower()}{last_name.lower()}",
         f"{first_name.lower()}.{last_name.lower()}",
         f"{first_name[0].lower()}{last_name.lower()}",
-        f"{first_name.lower()}{last_name.lower()}{random.randint(1, 999)}",
+        f"{first_name.lower()}{last_name.lower()}{rng.randint(1, 999)}",
         f"{first_name.lower()}_{last_name.lower()}",
         f"{last_name.lower()}{first_name[0].lower()}",
     ]
-    return random.choice(variations)
+    return rng.choice(variations)
 
-def generate_email(username):
+def generate_email(username, rng=random):
     """Generate email address"""
     domains = ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com", "aol.com"]
-    return f"{username}@{random.choice(domains)}"
+    return f"{username}@{rng.choice(domains)}"
 
-def generate_phone():
+def generate_phone(rng=random):
     """Generate fake phone number"""
-    area_code = random.randint(200, 999)
-    prefix = random.randint(200, 999)
-    line = random.randint(1000, 9999)
+    area_code = rng.randint(200, 999)
+    prefix = rng.randint(200, 999)
+    line = rng.randint(1000, 9999)
     return f"{area_code}-{prefix}-{line}"
 
 def get_user_tier_params(tier):
@@ -412,12 +448,12 @@ def get_user_tier_params(tier):
             "initial_deposit": (2000, 5000),
         }
 
-def weighted_choice(choices):
+def weighted_choice(choices, rng=random):
     """Select item based on probability weights"""
     items, probabilities = zip(*choices)
-    return random.choices(items, weights=probabilities, k=1)[0]
+    return rng.choices(items, weights=probabilities, k=1)[0]
 
-def generate_line_for_stat(stat_type, position):
+def generate_line_for_stat(stat_type, position, rng=random):
     """Generate realistic prop line for a stat"""
     line_ranges = {
         "Passing Yards": (220.5, 285.5),
@@ -437,10 +473,10 @@ def generate_line_for_stat(stat_type, position):
     
     min_line, max_line = line_ranges.get(stat_type, (50.5, 100.5))
     # Generate line in 0.5 increments
-    line = random.choice([x + 0.5 for x in range(int(min_line), int(max_line))])
+    line = rng.choice([x + 0.5 for x in range(int(min_line), int(max_line))])
     return line
 
-def simulate_pick_result(win_rate, entry_status):
+def simulate_pick_result(win_rate, entry_status, rng=random):
     """Simulate whether a pick hit or missed based on win rate"""
     if entry_status == "pending":
         return "pending"
@@ -448,23 +484,198 @@ def simulate_pick_result(win_rate, entry_status):
         return "void"
     else:
         # Small chance of push (0.5 on exact number)
-        if random.random() < 0.05:
+        if rng.random() < 0.05:
             return "push"
-        return "hit" if random.random() < win_rate else "miss"
+        return "hit" if rng.random() < win_rate else "miss"
+
+# ============================================================================
+# BULK LOAD
+# ============================================================================
+
+# Users generated per transaction; each block is written with one executemany per table
+USERS_PER_BATCH = 10_000
+
+# Applied for the duration of the load; apply_writer_pragmas restores the normal settings
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -262144",  # 256 MiB
+    "PRAGMA temp_store = MEMORY",
+)
+
+INSERT_USER_SQL = """
+    INSERT INTO users (user_id, username, email, first_name, last_name, state, date_of_birth,
+                       created_at, last_login, account_status, kyc_verified, phone_number)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Totals start at zero; reconcile_wallets fills them in from the transactions after the load
+INSERT_WALLET_SQL = """
+    INSERT INTO wallets (user_id) VALUES (?)
+"""
+
+INSERT_ENTRY_SQL = """
+    INSERT INTO entries (entry_id, user_id, entry_amount, potential_payout, actual_payout,
+                         num_picks, entry_type, status, created_at, settled_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_PICK_SQL = """
+    INSERT INTO picks (pick_id, entry_id, player_id, game_id, stat_type, line, selection,
+                       result, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (user_id, transaction_type, amount, balance_before,
+                              balance_after, related_entry_id, status, payment_method,
+                              transaction_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Per-worker shard tables: the columns the INSERT statements above write, without
+# constraints or indexes. Untyped columns keep every value exactly as generated.
+SHARD_SCHEMA = """
+    CREATE TABLE users (user_id INTEGER PRIMARY KEY, username, email, first_name, last_name, state,
+                        date_of_birth, created_at, last_login, account_status, kyc_verified, phone_number);
+    CREATE TABLE wallets (user_id INTEGER PRIMARY KEY);
+    CREATE TABLE entries (entry_id INTEGER PRIMARY KEY, user_id, entry_amount, potential_payout, actual_payout,
+                          num_picks, entry_type, status, created_at, settled_at);
+    CREATE TABLE picks (pick_id INTEGER PRIMARY KEY, entry_id, player_id, game_id, stat_type, line, selection,
+                        result, created_at);
+    CREATE TABLE transactions (transaction_id INTEGER PRIMARY KEY, user_id, transaction_type, amount,
+                               balance_before, balance_after, related_entry_id, status, payment_method,
+                               transaction_date);
+"""
+
+# Copies an attached shard into the main database, shifting its block-local entry and pick ids
+MERGE_SHARD_SQL = (
+    """
+    INSERT INTO users (user_id, username, email, first_name, last_name, state, date_of_birth,
+                       created_at, last_login, account_status, kyc_verified, phone_number)
+    SELECT user_id, username, email, first_name, last_name, state, date_of_birth,
+           created_at, last_login, account_status, kyc_verified, phone_number
+    FROM shard.users ORDER BY user_id
+    """,
+    """
+    INSERT INTO wallets (user_id, updated_at)
+    SELECT user_id, :updated_at
+    FROM shard.wallets ORDER BY user_id
+    """,
+    """
+    INSERT INTO entries (entry_id, user_id, entry_amount, potential_payout, actual_payout,
+                         num_picks, entry_type, status, created_at, settled_at)
+    SELECT entry_id + :entry_offset, user_id, entry_amount, potential_payout, actual_payout,
+           num_picks, entry_type, status, created_at, settled_at
+    FROM shard.entries ORDER BY entry_id
+    """,
+    """
+    INSERT INTO picks (pick_id, entry_id, player_id, game_id, stat_type, line, selection,
+                       result, created_at)
+    SELECT pick_id + :pick_offset, entry_id + :entry_offset, player_id, game_id, stat_type, line, selection,
+           result, created_at
+    FROM shard.picks ORDER BY pick_id
+    """,
+    """
+    INSERT INTO transactions (user_id, transaction_type, amount, balance_before,
+                              balance_after, related_entry_id, status, payment_method,
+                              transaction_date)
+    SELECT user_id, transaction_type, amount, balance_before,
+           balance_after, related_entry_id + :entry_offset, status, payment_method,
+           transaction_date
+    FROM shard.transactions ORDER BY transaction_id
+    """,
+)
+
+class SeedBatch:
+    """Rows generated for one block of users, with explicit ids so nothing is read back"""
+
+    
+    def __init__(self, next_entry_id, next_pick_id):
+        self.users = []
+        self.wallets = []
+        self.entries = []
+        self.picks = []
+        self.transactions = []
+        self.next_entry_id = next_entry_id
+        self.next_pick_id = next_pick_id
+    
+    def write(self, cursor):
+        """Insert every buffered row, one executemany per table"""
+        cursor.executemany(INSERT_USER_SQL, self.users)
+        cursor.executemany(INSERT_WALLET_SQL, self.wallets)
+        cursor.executemany(INSERT_ENTRY_SQL, self.entries)
+        cursor.executemany(INSERT_PICK_SQL, self.picks)
+        cursor.executemany(INSERT_TRANSACTION_SQL, self.transactions)
+
+def drop_secondary_objects(cursor):
+    """
+    Drop every index and trigger so a bulk load only writes table pages
+    
+    Returns:
+        List of (type, name, sql) rows, indexes first, for restore_secondary_objects
+    """
+    cursor.execute("""
+        SELECT type, name, sql FROM sqlite_master
+        WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+        ORDER BY type = 'trigger', name
+    """)
+    objects = cursor.fetchall()
+    for obj_type, name, _ in objects:
+        cursor.execute(f"DROP {obj_type.upper()} IF EXISTS {name}")
+    return objects
+
+def restore_secondary_objects(conn, objects):
+    """
+    Recreate the indexes and triggers dropped before a bulk load
+    
+    Indexes are built once over the loaded tables, then everything the dropped
+    triggers would have maintained row by row is recomputed in one pass: the
+    wallet totals, the leaderboard rollups, the user search index and the epoch
+    timestamp columns.
+    """
+    cursor = conn.cursor()
+    
+    print(f"\n🔍 Rebuilding {len(objects)} indexes and triggers...")
+    for _, _, sql in objects:
+        cursor.execute(sql)
+    
+    for table in MIGRATED_TABLES:
+        cursor.execute(f"PRAGMA table_info({table})")
+        if any(row[1] == EPOCH_COLUMN for row in cursor.fetchall()):
+            backfill_epoch_timestamps(cursor, table)
+    conn.commit()
+    
+    print("💰 Reconciling wallets with the transaction ledger...")
+    reconcile_wallets(conn)
+    
+    if rollups_exist(cursor):
+        print("📊 Rebuilding leaderboard rollups...")
+        rebuild_rollups(conn)
+    
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'")
+    if cursor.fetchone():
+        print("🔎 Rebuilding user search index...")
+        cursor.execute("INSERT INTO users_fts(users_fts) VALUES('rebuild')")
+    
+    print("📈 Refreshing query planner statistics (ANALYZE)...")
+    cursor.execute("ANALYZE")
+    conn.commit()
 
 # ============================================================================
 # DATA GENERATION FUNCTIONS
 # ============================================================================
 
-def seed_players(cursor):
+def seed_players(cursor, rng=random):
     """Insert NFL players into database"""
     print("\n📊 Generating 200 NFL players...")
     
-    for player_name, team, position, sport in NFL_PLAYERS:
-        cursor.execute("""
-            INSERT INTO players (player_name, team, position, sport, jersey_number, is_active)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (player_name, team, position, sport, random.randint(1, 99), 1))
+    cursor.executemany("""
+        INSERT INTO players (player_name, team, position, sport, jersey_number, is_active, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (player_name, team, position, sport, rng.randint(1, 99), 1, SEED_TIMESTAMP)
+        for player_name, team, position, sport in NFL_PLAYERS
+    ])
     
     print(f"✅ Created {len(NFL_PLAYERS)} NFL players")
 
@@ -472,355 +683,435 @@ def seed_games(cursor):
     """Insert NFL games into database"""
     print("\n🏈 Generating 50 NFL games (Weeks 9-11)...")
     
-    for home, away, game_date, status, home_score, away_score in NFL_GAMES:
-        cursor.execute("""
-            INSERT INTO games (sport, league, home_team, away_team, game_date, venue, status, home_score, away_score)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, ("NFL", "NFL", home, away, game_date, f"{home} Stadium", status, home_score, away_score))
+    cursor.executemany("""
+        INSERT INTO games (sport, league, home_team, away_team, game_date, venue, status, home_score, away_score, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        ("NFL", "NFL", home, away, game_date, f"{home} Stadium", status, home_score, away_score, SEED_TIMESTAMP)
+        for home, away, game_date, status, home_score, away_score in NFL_GAMES
+    ])
     
     print(f"✅ Created {len(NFL_GAMES)} NFL games")
 
-def seed_users_and_wallets(cursor):
-    """Generate 500 users with proper tier distribution"""
-    print("\n👥 Generating 500 users across 4 tiers...")
-    
-    # Determine user tiers
+def assign_user_tiers(total_users, rng=random):
+    """Shuffled list of tiers, one per user, in the configured proportions"""
     user_tiers = (
-        ["casual"] * int(TOTAL_USERS * CASUAL_PERCENT) +
-        ["regular"] * int(TOTAL_USERS * REGULAR_PERCENT) +
-        ["sharp"] * int(TOTAL_USERS * SHARP_PERCENT) +
-        ["elite"] * int(TOTAL_USERS * ELITE_PERCENT)
+        ["casual"] * int(total_users * CASUAL_PERCENT) +
+        ["regular"] * int(total_users * REGULAR_PERCENT) +
+        ["sharp"] * int(total_users * SHARP_PERCENT) +
+        ["elite"] * int(total_users * ELITE_PERCENT)
     )
     
-    # Adjust to exactly 500
-    while len(user_tiers) < TOTAL_USERS:
+    # Adjust to exactly total_users
+    while len(user_tiers) < total_users:
         user_tiers.append("casual")
-    user_tiers = user_tiers[:TOTAL_USERS]
+    user_tiers = user_tiers[:total_users]
     
-    random.shuffle(user_tiers)
+    rng.shuffle(user_tiers)
+    return user_tiers
+
+def entry_scale_for(user_tiers, total_entries):
+    """
+    Multiplier applied to every user's entry count to reach roughly total_entries
     
-    tier_counts = {"casual": 0, "regular": 0, "sharp": 0, "elite": 0}
+    Args:
+        user_tiers: Tier of every user, from assign_user_tiers
+        total_entries: Target number of entries, or None for the tier ranges as configured
     
-    used_usernames = set()
-    used_emails = set()
+    Returns:
+        float: 1.0 when no target is given
+    """
+    if not total_entries:
+        return 1.0
+    expected = sum(sum(get_user_tier_params(tier)["entries"]) / 2 for tier in user_tiers)
+    return total_entries / expected
+
+def generate_user(batch, rng, user_id, tier, used_usernames):
+    """Append one user and their (empty) wallet to the batch"""
+    # Generate unique username (email is derived from it, so it is unique too)
+    while True:
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        username = generate_username(first_name, last_name, rng)
+        # Each shard only sees its own names: past the first block the user id
+        # keeps them unique across shards
+        if user_id > USERS_PER_BATCH:
+            username = f"{username}_{user_id}"
+        if username not in used_usernames:
+            break
+    used_usernames.add(username)
+    email = generate_email(username, rng)
     
-    for i, tier in enumerate(user_tiers):
-        tier_counts[tier] += 1
-        
-        # Generate unique username and email
-        while True:
-            first_name = random.choice(FIRST_NAMES)
-            last_name = random.choice(LAST_NAMES)
-            username = generate_username(first_name, last_name)
-            email = generate_email(username)
-            
-            if username not in used_usernames and email not in used_emails:
-                used_usernames.add(username)
-                used_emails.add(email)
-                break
-        
-        # User creation date (some recent, some older)
-        # Ensure created_at is before END_DATE
-        user_start = START_DATE - timedelta(days=365)
-        user_end = END_DATE - timedelta(days=1)  # At least 1 day before END_DATE
-        created_at = random_date_between(user_start, user_end)
-        last_login = random_date_between(created_at, END_DATE)
-        
-        # Account status (elite sharps might be suspended!)
-        if tier == "elite" and random.random() < 0.4:
-            account_status = "suspended"
-        else:
-            account_status = "active"
-        
-        # Insert user
-        cursor.execute("""
-            INSERT INTO users (username, email, first_name, last_name, state, date_of_birth, 
-                             created_at, last_login, account_status, kyc_verified, phone_number)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            username, email, first_name, last_name, random.choice(LEGAL_STATES),
-            datetime(random.randint(1970, 2000), random.randint(1, 12), random.randint(1, 28)),
-            created_at, last_login, account_status, 1, generate_phone()
-        ))
-        
-        user_id = cursor.lastrowid
-        
-        # Create wallet for user (will be updated later with actual totals)
-        cursor.execute("""
-            INSERT INTO wallets (user_id, current_balance, total_deposits, total_withdrawals, 
-                               total_winnings, total_wagered)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (user_id, 0, 0, 0, 0, 0))
+    # User creation date (some recent, some older)
+    # Ensure created_at is before END_DATE
+    user_start = START_DATE - timedelta(days=365)
+    user_end = END_DATE - timedelta(days=1)  # At least 1 day before END_DATE
+    created_at = random_date_between(user_start, user_end, rng)
+    last_login = random_date_between(created_at, END_DATE, rng)
     
-    print(f"✅ Created 500 users:")
-    print(f"   - Casual: {tier_counts['casual']} users")
-    print(f"   - Regular: {tier_counts['regular']} users")
-    print(f"   - Sharp: {tier_counts['sharp']} users")
-    print(f"   - Elite: {tier_counts['elite']} users")
+    # Account status (elite sharps might be suspended!)
+    if tier == "elite" and rng.random() < 0.4:
+        account_status = "suspended"
+    else:
+        account_status = "active"
     
-    return user_tiers
+    batch.users.append((
+        user_id, username, email, first_name, last_name, rng.choice(LEGAL_STATES),
+        datetime(rng.randint(1970, 2000), rng.randint(1, 12), rng.randint(1, 28)),
+        created_at, last_login, account_status, 1, generate_phone(rng)
+    ))
+    batch.wallets.append((user_id,))
 
-def seed_entries_and_picks(cursor, user_tiers):
-    """Generate entries and picks for each user"""
-    print("\n🎲 Generating entries and picks for all users...")
+def generate_entries(batch, rng, user_id, tier, players, games_by_team, league_schedule, entry_scale=1.0):
+    """
+    Append a user's entries, picks and transactions to the batch
     
-    # Get all players and games
-    cursor.execute("SELECT player_id, player_name, position, team FROM players WHERE is_active = 1")
-    players = cursor.fetchall()
+    Every pick result is decided here, before anything is inserted, so each row
+    is written exactly once. Wallet totals are not generated: they are derived
+    from the transactions (see wallet_ledger.py).
     
-    cursor.execute("SELECT game_id, home_team, away_team, game_date, status FROM games")
-    games = cursor.fetchall()
+    Returns:
+        tuple: (entries, picks) generated for this user
+    """
+    params = get_user_tier_params(tier)
     
-    # Create lookup for games by teams
-    # Convert game_date strings back to datetime objects
-    games_by_team = {}
-    for game_id, home, away, game_date_str, status in games:
-        # Convert string to datetime if needed
-        if isinstance(game_date_str, str):
-            game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-        else:
-            game_date = game_date_str
-        games_by_team.setdefault(home, []).append((game_id, game_date, status))
-        games_by_team.setdefault(away, []).append((game_id, game_date, status))
+    # Determine number of entries for this user
+    num_entries = max(1, round(rng.randint(*params["entries"]) * entry_scale))
     
-    total_entries = 0
-    total_picks = 0
+    user_transactions = []
+    user_picks = 0
     
-    # Get all users
-    cursor.execute("SELECT user_id FROM users")
-    users = cursor.fetchall()
+    # Initial deposit (rounded to 2 decimals, like every other amount, so the ledger adds up exactly)
+    initial_deposit = round(rng.uniform(*params["initial_deposit"]), 2)
+    user_balance = initial_deposit
     
-    for idx, (user_id,) in enumerate(users):
-        tier = user_tiers[idx]
-        params = get_user_tier_params(tier)
+    # Record deposit transaction
+    user_transactions.append({
+        "user_id": user_id,
+        "type": "deposit",
+        "amount": initial_deposit,
+        "balance_before": 0,
+        "balance_after": user_balance,
+        "date": random_date_between(START_DATE - timedelta(days=30), START_DATE, rng),
+        "payment_method": rng.choice(["credit_card", "paypal", "venmo", "bank_transfer"]),
+    })
+    
+    for _ in range(num_entries):
+        # Entry amount
+        bet_size = rng.uniform(*params["bet_size"])
+        bet_size = round(bet_size, 2)
+        
+        # Make sure user has enough balance (add deposit if needed)
+        if user_balance < bet_size:
+            additional_deposit = round(rng.uniform(bet_size * 2, bet_size * 5), 2)
+            balance_before = user_balance
+            user_balance += additional_deposit
+            user_transactions.append({
+                "user_id": user_id,
+                "type": "deposit",
+                "amount": additional_deposit,
+                "balance_before": balance_before,
+                "balance_after": user_balance,
+                "date": random_date_between(START_DATE, END_DATE, rng),
+                "payment_method": rng.choice(["credit_card", "paypal", "venmo"]),
+            })
+        
+        # Number of picks (2-6)
+        num_picks = rng.choices([2, 3, 4, 5, 6], weights=[0.35, 0.35, 0.15, 0.10, 0.05], k=1)[0]
+        
+        # Entry type
+        entry_type = weighted_choice(ENTRY_TYPES, rng)
         
-        # Determine number of entries for this user
-        num_entries = random.randint(*params["entries"])
+        # Potential payout
+        multiplier = PAYOUT_MULTIPLIERS[num_picks]
+        potential_payout = round(bet_size * multiplier, 2)
         
-        user_total_deposits = 0
-        user_total_wagered = 0
-        user_total_winnings = 0
-        user_transactions = []
+        # Entry creation time
+        entry_date = random_date_between(START_DATE, END_DATE, rng)
         
-        # Initial deposit
-        initial_deposit = random.uniform(*params["initial_deposit"])
-        user_total_deposits = initial_deposit
-        user_balance = initial_deposit
+        entry_id = batch.next_entry_id
+        batch.next_entry_id += 1
         
-        # Record deposit transaction
+        # Deduct bet from balance
+        balance_before = user_balance
+        user_balance -= bet_size
+        
+        # Record bet transaction
         user_transactions.append({
             "user_id": user_id,
-            "type": "deposit",
-            "amount": initial_deposit,
-            "balance_before": 0,
+            "type": "bet_placed",
+            "amount": bet_size,
+            "balance_before": balance_before,
             "balance_after": user_balance,
-            "date": random_date_between(START_DATE - timedelta(days=30), START_DATE),
-            "payment_method": random.choice(["credit_card", "paypal", "venmo", "bank_transfer"]),
+            "related_entry_id": entry_id,
+            "date": entry_date,
         })
         
-        for _ in range(num_entries):
-            # Entry amount
-            bet_size = random.uniform(*params["bet_size"])
-            bet_size = round(bet_size, 2)
-            
-            # Make sure user has enough balance (add deposit if needed)
-            if user_balance < bet_size:
-                additional_deposit = random.uniform(bet_size * 2, bet_size * 5)
-                user_total_deposits += additional_deposit
-                balance_before = user_balance
-                user_balance += additional_deposit
-                user_transactions.append({
-                    "user_id": user_id,
-                    "type": "deposit",
-                    "amount": additional_deposit,
-                    "balance_before": balance_before,
-                    "balance_after": user_balance,
-                    "date": random_date_between(START_DATE, END_DATE),
-                    "payment_method": random.choice(["credit_card", "paypal", "venmo"]),
-                })
-            
-            # Number of picks (2-6)
-            num_picks = random.choices([2, 3, 4, 5, 6], weights=[0.35, 0.35, 0.15, 0.10, 0.05], k=1)[0]
-            
-            # Entry type
-            entry_type = weighted_choice(ENTRY_TYPES)
-            
-            # Potential payout
-            multiplier = PAYOUT_MULTIPLIERS[num_picks]
-            potential_payout = round(bet_size * multiplier, 2)
-            
-            # Entry creation time
-            entry_date = random_date_between(START_DATE, END_DATE)
-            
-            # Determine if entry is settled or pending based on latest pick's game
-            # For simplicity, we'll determine this after creating picks
+        # Create picks for this entry
+        selected_players = rng.sample(players, num_picks)
+        entry_picks = []
+        latest_game_date = entry_date
+        all_games_final = True
+        
+        for player_id, player_name, position, team in selected_players:
+            # Pick a game for this player's team that's after entry date
+            # (any game of the league if the team has none)
+            schedule = games_by_team.get(team, league_schedule)
+            game_id, game_date, game_status = pick_game(schedule, entry_date, rng)
             
-            # Insert entry (initially pending)
-            cursor.execute("""
-                INSERT INTO entries (user_id, entry_amount, potential_payout, num_picks, 
-                                   entry_type, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (user_id, bet_size, potential_payout, num_picks, entry_type, "pending", entry_date))
+            # Track latest game date
+            if game_date > latest_game_date:
+                latest_game_date = game_date
             
-            entry_id = cursor.lastrowid
-            total_entries += 1
+            if game_status != "final":
+                all_games_final = False
             
-            # Deduct bet from balance
-            balance_before = user_balance
-            user_balance -= bet_size
-            user_total_wagered += bet_size
+            # Select stat type based on position
+            stat_options = STAT_TYPES.get(position, ["Receiving Yards"])
+            stat_type = rng.choice(stat_options)
             
-            # Record bet transaction
-            user_transactions.append({
-                "user_id": user_id,
-                "type": "bet_placed",
-                "amount": bet_size,
-                "balance_before": balance_before,
-                "balance_after": user_balance,
-                "related_entry_id": entry_id,
-                "date": entry_date,
-            })
+            # Generate line
+            line = generate_line_for_stat(stat_type, position, rng)
             
-            # Create picks for this entry
-            selected_players = random.sample(players, num_picks)
-            pick_results = []
-            latest_game_date = entry_date
-            all_games_final = True
+            # Over or under
+            selection = rng.choice(["over", "under"])
             
-            for player_id, player_name, position, team in selected_players:
-                # Find a game for this player's team
-                team_games = games_by_team.get(team, [])
-                if not team_games:
-                    # Use a random game as fallback - need to convert all games too
-                    all_games_converted = []
-                    for g in games:
-                        gid, home, away, gdate_str, gstatus = g
-                        if isinstance(gdate_str, str):
-                            gdate = datetime.fromisoformat(gdate_str.replace('Z', '+00:00'))
-                        else:
-                            gdate = gdate_str
-                        all_games_converted.append((gid, gdate, gstatus))
-                    game_id, game_date, game_status = random.choice(all_games_converted)
-                else:
-                    # Pick a game that's after entry date
-                    valid_games = [(gid, gdate, gstatus) for gid, gdate, gstatus in team_games if gdate >= entry_date]
-                    if not valid_games:
-                        valid_games = team_games
-                    game_id, game_date, game_status = random.choice(valid_games)
-                
-                # Track latest game date
-                if game_date > latest_game_date:
-                    latest_game_date = game_date
-                
-                if game_status != "final":
-                    all_games_final = False
-                
-                # Select stat type based on position
-                stat_options = STAT_TYPES.get(position, ["Receiving Yards"])
-                stat_type = random.choice(stat_options)
-                
-                # Generate line
-                line = generate_line_for_stat(stat_type, position)
-                
-                # Over or under
-                selection = random.choice(["over", "under"])
-                
-                # Insert pick (initially pending)
-                cursor.execute("""
-                    INSERT INTO picks (entry_id, player_id, game_id, stat_type, line, selection, 
-                                     result, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (entry_id, player_id, game_id, stat_type, line, selection, "pending", entry_date))
-                
-                total_picks += 1
-                pick_results.append(("pending", player_name, stat_type, line, selection))
+            entry_picks.append((player_id, game_id, stat_type, line, selection))
+        
+        # Determine entry status (and every pick result) based on games
+        settled_at = None
+        actual_payout = 0
+        if all_games_final:
+            # Simulate results based on user's win rate
+            win_rate = params["win_rate"]
+            entry_won = rng.random() < win_rate
+            settled_at = latest_game_date + timedelta(hours=3)
             
-            # Determine entry status based on games
-            if all_games_final:
-                # Simulate results based on user's win rate
-                win_rate = params["win_rate"]
-                entry_won = random.random() < win_rate
+            if entry_won:
+                entry_status = "won"
+                actual_payout = potential_payout
+                user_balance += actual_payout
+                pick_results = ["hit"] * num_picks
                 
-                if entry_won:
-                    entry_status = "won"
-                    actual_payout = potential_payout
-                    user_balance += actual_payout
-                    user_total_winnings += actual_payout
-                    
-                    # Update picks to "hit"
-                    cursor.execute("SELECT pick_id FROM picks WHERE entry_id = ?", (entry_id,))
-                    for (pick_id,) in cursor.fetchall():
-                        cursor.execute("UPDATE picks SET result = ? WHERE pick_id = ?", ("hit", pick_id))
-                    
-                    # Record payout transaction
-                    balance_before = user_balance - actual_payout
-                    user_transactions.append({
-                        "user_id": user_id,
-                        "type": "payout",
-                        "amount": actual_payout,
-                        "balance_before": balance_before,
-                        "balance_after": user_balance,
-                        "related_entry_id": entry_id,
-                        "date": latest_game_date + timedelta(hours=3),
-                    })
-                else:
-                    entry_status = "lost"
-                    actual_payout = 0
-                    
-                    # Update some picks to "miss"
-                    cursor.execute("SELECT pick_id FROM picks WHERE entry_id = ?", (entry_id,))
-                    all_picks = cursor.fetchall()
-                    # At least one pick must miss for entry to lose
-                    num_misses = random.randint(1, len(all_picks))
-                    missed_picks = random.sample(all_picks, num_misses)
-                    
-                    for (pick_id,) in all_picks:
-                        if (pick_id,) in missed_picks:
-                            cursor.execute("UPDATE picks SET result = ? WHERE pick_id = ?", ("miss", pick_id))
-                        else:
-                            cursor.execute("UPDATE picks SET result = ? WHERE pick_id = ?", ("hit", pick_id))
-                
-                # Update entry with final status
-                settled_at = latest_game_date + timedelta(hours=3)
-                cursor.execute("""
-                    UPDATE entries 
-                    SET status = ?, actual_payout = ?, settled_at = ?
-                    WHERE entry_id = ?
-                """, (entry_status, actual_payout, settled_at, entry_id))
+                # Record payout transaction
+                balance_before = user_balance - actual_payout
+                user_transactions.append({
+                    "user_id": user_id,
+                    "type": "payout",
+                    "amount": actual_payout,
+                    "balance_before": balance_before,
+                    "balance_after": user_balance,
+                    "related_entry_id": entry_id,
+                    "date": settled_at,
+                })
             else:
-                # Entry is still pending
-                cursor.execute("UPDATE entries SET status = ? WHERE entry_id = ?", ("pending", entry_id))
-        
-        # Update user's wallet with final totals
-        cursor.execute("""
-            UPDATE wallets 
-            SET current_balance = ?, total_deposits = ?, total_wagered = ?, total_winnings = ?
-            WHERE user_id = ?
-        """, (round(user_balance, 2), round(user_total_deposits, 2), 
-              round(user_total_wagered, 2), round(user_total_winnings, 2), user_id))
-        
-        # Insert all transactions
-        for trans in user_transactions:
-            cursor.execute("""
-                INSERT INTO transactions (user_id, transaction_type, amount, balance_before, 
-                                        balance_after, related_entry_id, status, payment_method, 
-                                        transaction_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trans["user_id"], trans["type"], round(trans["amount"], 2),
-                round(trans["balance_before"], 2), round(trans["balance_after"], 2),
-                trans.get("related_entry_id"), "completed", trans.get("payment_method"),
-                trans["date"]
-            ))
-    
-    print(f"✅ Created {total_entries} entries with {total_picks} total picks")
+                entry_status = "lost"
+                
+                # At least one pick must miss for entry to lose
+                num_misses = rng.randint(1, num_picks)
+                missed_picks = set(rng.sample(range(num_picks), num_misses))
+                pick_results = ["miss" if i in missed_picks else "hit" for i in range(num_picks)]
+        else:
+            # Entry is still pending
+            entry_status = "pending"
+            pick_results = ["pending"] * num_picks
+        
+        batch.entries.append((
+            entry_id, user_id, bet_size, potential_payout, actual_payout,
+            num_picks, entry_type, entry_status, entry_date, settled_at
+        ))
+        for pick, result in zip(entry_picks, pick_results):
+            batch.picks.append((batch.next_pick_id, entry_id, *pick, result, entry_date))
+            batch.next_pick_id += 1
+        user_picks += num_picks
+    
+    for trans in user_transactions:
+        batch.transactions.append((
+            trans["user_id"], trans["type"], round(trans["amount"], 2),
+            round(trans["balance_before"], 2), round(trans["balance_after"], 2),
+            trans.get("related_entry_id"), "completed", trans.get("payment_method"),
+            trans["date"]
+        ))
+    
+    return num_entries, user_picks
+
+def build_schedule(games):
+    """
+    Sort (game_id, game_date, status) tuples by date for bisect lookups
+    
+    Returns:
+        tuple: (game dates, games), both in date order
+    """
+    games = sorted(games, key=lambda game: (game[1], game[0]))
+    return [game_date for _, game_date, _ in games], games
+
+def pick_game(schedule, entry_date, rng):
+    """
+    Random game from a schedule on or after entry_date, in O(log n)
+    
+    Falls back to any game of the schedule when all of them started before entry_date.
+    """
+    game_dates, games = schedule
+    first = bisect.bisect_left(game_dates, entry_date)
+    if first == len(games):
+        first = 0
+    return games[rng.randrange(first, len(games))]
+
+def load_games(cursor):
+    """
+    Read back the seeded games as schedules for pick_game
+    
+    Returns:
+        tuple: ({team: schedule}, league-wide schedule for teams without games)
+    """
+    cursor.execute("SELECT game_id, home_team, away_team, game_date, status FROM games ORDER BY game_id")
+    
+    # Create lookup for games by teams
+    # Convert game_date strings back to datetime objects
+    games = []
+    team_games = {}
+    for game_id, home, away, game_date_str, status in cursor.fetchall():
+        # Convert string to datetime if needed
+        if isinstance(game_date_str, str):
+            game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+        else:
+            game_date = game_date_str
+        games.append((game_id, game_date, status))
+        team_games.setdefault(home, []).append((game_id, game_date, status))
+        team_games.setdefault(away, []).append((game_id, game_date, status))
+    
+    games_by_team = {team: build_schedule(schedule) for team, schedule in team_games.items()}
+    return games_by_team, build_schedule(games)
+
+def block_rng(seed, block_index):
+    """Independent random stream for one block of users, the same whichever process runs it"""
+    return random.Random(f"{seed}:{block_index}")
+
+def generate_block(task):
+    """
+    Worker: generate one block of users into its own shard database
+    
+    Entry and pick ids in the shard start at 1; merge_shard offsets them.
+    
+    Args:
+        task: (seed, block_index, first_user_id, user_tiers, players,
+               games_by_team, league_schedule, entry_scale, shard_path)
+    
+    Returns:
+        tuple: (shard_path, users, entries, picks)
+    """
+    (seed, block_index, first_user_id, user_tiers, players,
+     games_by_team, league_schedule, entry_scale, shard_path) = task
+    rng = block_rng(seed, block_index)
+    
+    batch = SeedBatch(1, 1)
+    used_usernames = set()
+    total_picks = 0
+    for offset, tier in enumerate(user_tiers):
+        user_id = first_user_id + offset
+        generate_user(batch, rng, user_id, tier, used_usernames)
+        _, picks = generate_entries(batch, rng, user_id, tier, players, games_by_team, league_schedule, entry_scale)
+        total_picks += picks
+    
+    shard = sqlite3.connect(shard_path)
+    shard.execute("PRAGMA journal_mode = OFF")
+    shard.execute("PRAGMA synchronous = OFF")
+    shard.executescript(SHARD_SCHEMA)
+    batch.write(shard.cursor())
+    shard.commit()
+    shard.close()
+    
+    return shard_path, len(batch.users), len(batch.entries), total_picks
+
+def merge_shard(conn, shard_path, entry_offset, pick_offset):
+    """Copy one shard into the main database as a single transaction, shifting its entry and pick ids"""
+    cursor = conn.cursor()
+    cursor.execute("ATTACH DATABASE ? AS shard", (shard_path,))
+    params = {
+        "entry_offset": entry_offset,
+        "pick_offset": pick_offset,
+        "updated_at": SEED_TIMESTAMP,
+    }
+    for sql in MERGE_SHARD_SQL:
+        cursor.execute(sql, params)
+    conn.commit()
+    cursor.execute("DETACH DATABASE shard")
+
+def seed_users_entries_and_picks(conn, user_tiers, seed, workers=1, entry_scale=1.0):
+    """
+    Generate every user with their wallet, entries, picks and transactions
+    
+    Users are split into blocks of USERS_PER_BATCH. Each block has its own
+    random stream (see block_rng) and is generated by a worker process into a
+    temporary shard database; shards are merged in block order, one
+    transaction each. The result depends only on the seed, never on the number
+    of workers.
+    """
+    cursor = conn.cursor()
+    total_users = len(user_tiers)
+    num_blocks = (total_users + USERS_PER_BATCH - 1) // USERS_PER_BATCH
+    workers = max(1, min(workers, num_blocks))
+    print(f"\n👥 Generating {total_users:,} users with entries and picks "
+          f"({num_blocks:,} blocks, {workers} workers)...")
+    
+    cursor.execute("SELECT player_id, player_name, position, team FROM players WHERE is_active = 1 ORDER BY player_id")
+    players = cursor.fetchall()
+    games_by_team, league_schedule = load_games(cursor)
+    
+    total_entries = 0
+    total_picks = 0
+    
+    # Shards sit next to the database so a large load doesn't fill up /tmp
+    with tempfile.TemporaryDirectory(prefix="seed_shards_", dir=os.path.dirname(DATABASE_FILE)) as shard_dir:
+        tasks = [
+            (seed, block_index, block_start + 1, user_tiers[block_start:block_start + USERS_PER_BATCH],
+             players, games_by_team, league_schedule, entry_scale,
+             os.path.join(shard_dir, f"shard_{block_index:05d}.db"))
+            for block_index, block_start in enumerate(range(0, total_users, USERS_PER_BATCH))
+        ]
+        
+        def merge_all(shards):
+            nonlocal total_entries, total_picks
+            merged_users = 0
+            # imap/map yield in block order, so ids come out the same however the work was split
+            for shard_path, users, entries, picks in shards:
+                merge_shard(conn, shard_path, total_entries, total_picks)
+                os.remove(shard_path)
+                merged_users += users
+                total_entries += entries
+                total_picks += picks
+                print(f"   ... {merged_users:,} / {total_users:,} users "
+                      f"({total_entries:,} entries, {total_picks:,} picks)")
+        
+        if workers > 1:
+            with multiprocessing.Pool(workers) as pool:
+                merge_all(pool.imap(generate_block, tasks))
+        else:
+            merge_all(map(generate_block, tasks))
+    
+    tier_counts = Counter(user_tiers)
+    print(f"✅ Created {total_users:,} users:")
+    print(f"   - Casual: {tier_counts['casual']:,} users")
+    print(f"   - Regular: {tier_counts['regular']:,} users")
+    print(f"   - Sharp: {tier_counts['sharp']:,} users")
+    print(f"   - Elite: {tier_counts['elite']:,} users")
+    print(f"✅ Created {total_entries:,} entries with {total_picks:,} total picks")
 
 # ============================================================================
 # MAIN SEED FUNCTION
 # ============================================================================
 
-def seed_database():
-    """Main function to seed all data"""
+def seed_database(total_users=TOTAL_USERS, total_entries=None, assume_yes=False, seed=None, workers=1):
+    """
+    Main function to seed all data
+    
+    Args:
+        total_users: Number of users to generate
+        total_entries: Approximate number of entries across all users (None = tier ranges as configured)
+        assume_yes: Delete existing data without prompting
+        seed: Random seed; the same seed always produces the same rows (None = pick one and print it)
+        workers: Processes generating user blocks in parallel
+    """
     print("=" * 60)
     print("🌱 SEEDING PRIZEPICKS USER DATABASE")
     print("=" * 60)
@@ -830,42 +1121,67 @@ def seed_database():
         print("Run init_database.py first to create the database structure")
         return False
     
+    conn = None
     try:
         conn = sqlite3.connect(DATABASE_FILE)
+        apply_writer_pragmas(conn)
         cursor = conn.cursor()
         
         # Check if database already has data
         cursor.execute("SELECT COUNT(*) FROM users")
         user_count = cursor.fetchone()[0]
         
-        if user_count > 0:
+        if user_count > 0 and not assume_yes:
             print(f"⚠️  WARNING: Database already contains {user_count} users")
             response = input("Do you want to DELETE all data and reseed? (yes/no): ").strip().lower()
             if response != 'yes':
                 print("❌ Seeding cancelled")
-                conn.close()
                 return False
+        
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        print(f"🎲 Seed: {seed} (pass --seed {seed} to reproduce this data set)")
+        rng = random.Random(seed)
+        
+        started = time.perf_counter()
+        for pragma in BULK_LOAD_PRAGMAS:
+            cursor.execute(pragma)
+        
+        # Without indexes or triggers the deletes below and every insert only touch table pages
+        secondary_objects = drop_secondary_objects(cursor)
+        
+        try:
+            if user_count > 0:
+                # Clear all tables
+                print("🗑️  Clearing existing data...")
+                cursor.execute("DELETE FROM transactions")
+                cursor.execute("DELETE FROM picks")
+                cursor.execute("DELETE FROM entries")
+                cursor.execute("DELETE FROM games")
+                cursor.execute("DELETE FROM players")
+                cursor.execute("DELETE FROM wallets")
+                cursor.execute("DELETE FROM users")
+                conn.commit()
+                print("✅ All tables cleared")
             
-            # Clear all tables
-            print("🗑️  Clearing existing data...")
-            cursor.execute("DELETE FROM transactions")
-            cursor.execute("DELETE FROM picks")
-            cursor.execute("DELETE FROM entries")
-            cursor.execute("DELETE FROM games")
-            cursor.execute("DELETE FROM players")
-            cursor.execute("DELETE FROM wallets")
-            cursor.execute("DELETE FROM users")
+            # Seed data in order (respecting foreign keys)
+            seed_players(cursor, rng)
+            seed_games(cursor)
             conn.commit()
-            print("✅ All tables cleared")
+            
+            user_tiers = assign_user_tiers(total_users, rng)
+            seed_users_entries_and_picks(conn, user_tiers, seed, workers, entry_scale_for(user_tiers, total_entries))
+        finally:
+            # Put the indexes and triggers back even if the load failed or was interrupted
+            # (only their SQL above knows what they were)
+            conn.rollback()
+            restore_secondary_objects(conn, secondary_objects)
         
-        # Seed data in order (respecting foreign keys)
-        seed_players(cursor)
-        seed_games(cursor)
-        user_tiers = seed_users_and_wallets(cursor)
-        seed_entries_and_picks(cursor, user_tiers)
+        apply_writer_pragmas(conn)
         
-        # Commit all changes
-        conn.commit()
+        # Fold the seeded pages back into the main file and truncate the WAL
+        cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        print(f"⏱️  Loaded in {time.perf_counter() - started:,.1f}s")
         
         # Display summary
         print("\n" + "=" * 60)
@@ -873,25 +1189,25 @@ def seed_database():
         print("=" * 60)
         
         cursor.execute("SELECT COUNT(*) FROM users")
-        print(f"👥 Users: {cursor.fetchone()[0]}")
+        print(f"👥 Users: {cursor.fetchone()[0]:,}")
         
         cursor.execute("SELECT COUNT(*) FROM wallets")
-        print(f"💰 Wallets: {cursor.fetchone()[0]}")
+        print(f"💰 Wallets: {cursor.fetchone()[0]:,}")
         
         cursor.execute("SELECT COUNT(*) FROM players")
-        print(f"🏈 Players: {cursor.fetchone()[0]}")
+        print(f"🏈 Players: {cursor.fetchone()[0]:,}")
         
         cursor.execute("SELECT COUNT(*) FROM games")
-        print(f"🎮 Games: {cursor.fetchone()[0]}")
+        print(f"🎮 Games: {cursor.fetchone()[0]:,}")
         
         cursor.execute("SELECT COUNT(*) FROM entries")
-        print(f"🎲 Entries: {cursor.fetchone()[0]}")
+        print(f"🎲 Entries: {cursor.fetchone()[0]:,}")
         
         cursor.execute("SELECT COUNT(*) FROM picks")
-        print(f"🎯 Picks: {cursor.fetchone()[0]}")
+        print(f"🎯 Picks: {cursor.fetchone()[0]:,}")
         
         cursor.execute("SELECT COUNT(*) FROM transactions")
-        print(f"💳 Transactions: {cursor.fetchone()[0]}")
+        print(f"💳 Transactions: {cursor.fetchone()[0]:,}")
         
         # Show some stats
         cursor.execute("SELECT SUM(total_deposits) FROM wallets")
@@ -926,9 +1242,8 @@ def seed_database():
         print("=" * 60)
         print("\nNext step: Create Flask API endpoints to query this data")
         
-        conn.close()
         return True
-        
+    
     except sqlite3.Error as e:
         print(f"\n❌ DATABASE ERROR: {e}")
         return False
@@ -937,11 +1252,27 @@ def seed_database():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        if conn is not None:
+            conn.close()
 
 if __name__ == "__main__":
-    success = seed_database()
+    parser = argparse.ArgumentParser(description="Seed the PrizePicks user database with mock data")
+    parser.add_argument("--users", type=int, default=TOTAL_USERS,
+                        help=f"number of users to generate (default: {TOTAL_USERS})")
+    parser.add_argument("--entries", type=int, default=None,
+                        help="approximate total entries; picks average ~3.15 per entry (default: ~7 per user)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="random seed; the same seed reproduces the same data set (default: random)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes generating user blocks (default: CPU count)")
+    parser.add_argument("--yes", action="store_true",
+                        help="delete existing data without prompting")
+    args = parser.parse_args()
+    
+    success = seed_database(args.users, args.entries, args.yes, args.seed, args.workers)
     
     if success:
         print("\n✨ Run your Flask API server to start querying the data!")
     else:
-        print("\n⚠️  Seeding failed. Please check the errors above.")
\ No newline at end of file
+        print("\n⚠️  Seeding failed. Please check the errors above.")
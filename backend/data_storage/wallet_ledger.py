@@ -0,0 +1,148 @@
+"""
+Wallet ledger: wallets totals derived from the transactions table
+
+The triggers in create_schema.sql apply every completed transaction to its
+user's wallet as it is written. This module checks those running totals
+against the ledger, and rebuilds them in one set-based pass: after upgrading
+an existing database, after a bulk load that ran with the triggers dropped, or
+whenever a wallet is suspected to have drifted.
+
+Usage (from the project root):
+    python backend/data_storage/wallet_ledger.py            # verify, exit code 1 on drift
+    python backend/data_storage/wallet_ledger.py --rebuild  # reconcile every wallet
+"""
+
+import sqlite3
+import os
+import sys
+
+# File paths - relative to project root
+# This script is in backend/data_storage/
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(SCRIPT_DIR))  # Go up 2 levels to project root
+DATA_STORAGE_DIR = os.path.join(PROJECT_ROOT, 'backend', 'data_storage')
+
+DATABASE_FILE = os.path.join(DATA_STORAGE_DIR, 'user_data.db')
+
+WALLET_TOTALS = ('current_balance', 'total_deposits', 'total_withdrawals', 'total_winnings', 'total_wagered')
+
+# Same arithmetic the ledger triggers apply one transaction at a time (each amount rounded
+# to cents before it is added), per user in one pass
+LEDGER_TOTALS_SQL = """
+    SELECT
+        user_id,
+        ROUND(SUM(CASE WHEN transaction_type IN ('withdrawal', 'bet_placed') THEN -ROUND(amount, 2) ELSE ROUND(amount, 2) END), 2) AS current_balance,
+        ROUND(SUM(CASE WHEN transaction_type = 'deposit' THEN ROUND(amount, 2) ELSE 0 END), 2) AS total_deposits,
+        ROUND(SUM(CASE WHEN transaction_type = 'withdrawal' THEN ROUND(amount, 2) ELSE 0 END), 2) AS total_withdrawals,
+        ROUND(SUM(CASE WHEN transaction_type = 'payout' THEN ROUND(amount, 2) ELSE 0 END), 2) AS total_winnings,
+        ROUND(SUM(CASE transaction_type WHEN 'bet_placed' THEN ROUND(amount, 2) WHEN 'refund' THEN -ROUND(amount, 2) ELSE 0 END), 2) AS total_wagered,
+        MAX(transaction_date) AS last_transaction
+    FROM transactions
+    WHERE status = 'completed'
+    GROUP BY user_id
+"""
+
+# Any total more than half a cent away from the ledger (wallets with no ledger rows should be all zero)
+DRIFT_CONDITION = ' OR '.join(
+    f"ABS(w.{column} - COALESCE(l.{column}, 0)) > 0.005" for column in WALLET_TOTALS
+)
+
+def find_wallet_drift(cursor, limit=10):
+    """
+    Compare every wallet with the totals of its completed transactions
+
+    Args:
+        cursor: sqlite3 cursor
+        limit: Maximum number of drifted wallets to return
+
+    Returns:
+        tuple: (number of drifted wallets, number of users with transactions but no wallet,
+                up to `limit` (user_id, column, wallet value, ledger value) rows)
+    """
+    cursor.execute(f"""
+        SELECT w.user_id, {', '.join(f'w.{c}, COALESCE(l.{c}, 0)' for c in WALLET_TOTALS)}
+        FROM wallets w
+        LEFT JOIN ({LEDGER_TOTALS_SQL}) l ON l.user_id = w.user_id
+        WHERE {DRIFT_CONDITION}
+        ORDER BY w.user_id
+    """)
+    drifted = cursor.fetchall()
+
+    examples = []
+    for row in drifted[:limit]:
+        for i, column in enumerate(WALLET_TOTALS):
+            wallet_value, ledger_value = row[1 + 2 * i], row[2 + 2 * i]
+            if abs(wallet_value - ledger_value) > 0.005:
+                examples.append((row[0], column, wallet_value, ledger_value))
+
+    cursor.execute("""
+        SELECT COUNT(DISTINCT t.user_id)
+        FROM transactions t
+        WHERE t.status = 'completed'
+          AND NOT EXISTS (SELECT 1 FROM wallets w WHERE w.user_id = t.user_id)
+    """)
+    missing = cursor.fetchone()[0]
+
+    return len(drifted), missing, examples
+
+def reconcile_wallets(conn):
+    """
+    Set every wallet's totals from the ledger in one set-based pass
+
+    Creates missing wallets, and only rewrites wallets whose totals or updated_at
+    differ from the ledger. updated_at is the date of the user's latest completed
+    transaction, as the ledger triggers keep it.
+
+    Args:
+        conn: Open sqlite3 connection (committed on success)
+
+    Returns:
+        int: Number of wallets created or corrected
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT OR IGNORE INTO wallets (user_id)
+        SELECT DISTINCT user_id FROM transactions WHERE status = 'completed'
+    """)
+    created = cursor.rowcount
+
+    # Wallets without a single completed transaction fall out of the join and go to zero
+    cursor.execute(f"""
+        UPDATE wallets SET
+            {', '.join(f'{c} = COALESCE(l.{c}, 0)' for c in WALLET_TOTALS)},
+            updated_at = COALESCE(l.last_transaction, wallets.updated_at)
+        FROM wallets w
+        LEFT JOIN ({LEDGER_TOTALS_SQL}) l ON l.user_id = w.user_id
+        WHERE wallets.user_id = w.user_id
+          AND ({DRIFT_CONDITION} OR w.updated_at IS NOT COALESCE(l.last_transaction, w.updated_at))
+    """)
+    corrected = cursor.rowcount
+    conn.commit()
+    return created + corrected
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("💰 WALLET LEDGER CHECK")
+    print("=" * 60)
+
+    if not os.path.exists(DATABASE_FILE):
+        print(f"❌ Database not found at {DATABASE_FILE}")
+        sys.exit(1)
+
+    conn = sqlite3.connect(DATABASE_FILE)
+    if '--rebuild' in sys.argv:
+        print(f"✅ Reconciled {reconcile_wallets(conn):,} wallets with the transaction ledger")
+    else:
+        drifted, missing, examples = find_wallet_drift(conn.cursor())
+        for user_id, column, wallet_value, ledger_value in examples:
+            print(f"   user {user_id}: {column} = {wallet_value} (ledger {ledger_value})")
+        if missing:
+            print(f"❌ {missing:,} users have transactions but no wallet")
+        if drifted:
+            print(f"❌ {drifted:,} wallets differ from the ledger")
+        if drifted or missing:
+            print("Run python backend/data_storage/wallet_ledger.py --rebuild to reconcile them")
+            conn.close()
+            sys.exit(1)
+        print("✅ Every wallet matches the transaction ledger")
+    conn.close()
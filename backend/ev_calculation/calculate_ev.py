@@ -4,6 +4,8 @@ Converts odds to implied probabilities and determines +EV opportunities
 UPDATED FOR PASSING YARDS with line adjustment
 """
 import json
+import os
+import threading
 
 # Breakeven percentages for each PrizePicks slip type (from your table)
 BREAKEVEN_RATES = {
@@ -16,6 +18,8 @@ BREAKEVEN_RATES = {
     '6_flex': 54.34
 }
 
+OUTPUT_FILE = 'backend/data_storage/ev_analysis.json'
+
 # Probability slope for passing yards (2% per yard)
 YARDS_PROBABILITY_SLOPE = 0.02  # 2% change in probability per yard difference
 
@@ -309,13 +313,45 @@ def display_summary(ev_props):
 
 def save_ev_analysis(ev_props):
     """Save EV analysis to file"""
-    output_file = 'backend/data_storage/ev_analysis.json'
+    output_file = OUTPUT_FILE
     
-    with open(output_file, 'w') as f:
-        json.dump(ev_props, f, indent=2)
+    # Write to a temp file beside it and rename, so EV_CACHE and the stream
+    # broadcaster never load a half-written file
+    tmp_file = f'{output_file}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(ev_props, f, indent=2)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
     
     print(f"\n📁 Saved EV analysis to {output_file}")
 
+def run_ev_calculation(matched_props, save=True):
+    """
+    Calculate, summarize and (optionally) save EV for already-loaded matches
+    
+    Args:
+        matched_props (list): Matched props from match_props
+        save (bool): Also write the results to ev_analysis.json
+    
+    Returns:
+        list: Props with EV analysis attached
+    """
+    # Calculate EV for all props
+    ev_props = calculate_all_ev(matched_props)
+    
+    # Display summary
+    display_summary(ev_props)
+    
+    # Save results
+    if save:
+        save_ev_analysis(ev_props)
+    
+    return ev_props
+
 def main():
     """Main EV calculation workflow"""
     print("\n" + "🎯" * 30)
@@ -327,14 +363,7 @@ def main():
     if not matched_props:
         return
     
-    # Calculate EV for all props
-    ev_props = calculate_all_ev(matched_props)
-    
-    # Display summary
-    display_summary(ev_props)
-    
-    # Save results
-    save_ev_analysis(ev_props)
+    run_ev_calculation(matched_props)
     
     print("\n" + "="*60)
     print("✅ EV CALCULATION COMPLETE!")
@@ -0,0 +1,248 @@
+"""
+In-process refresh pipeline
+Runs collection (sportsbook + PrizePicks, concurrently) -> prop matching -> EV calculation
+in a single interpreter, handing Python objects from one stage to the next.
+
+The intermediate JSON files (qb_passing_yards.json, prizepicks_props.json,
+matched_yards.json) are only written when checkpoint=True. ev_analysis.json is
+always written because it is what /api/ev-data serves.
+
+Run from the project root: python -m backend.pipeline [--checkpoint]
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime
+
+from backend.data_collection import prizepicksapi, sportsbookapi
+from backend.data_processing import match_props
+from backend.ev_calculation import calculate_ev
+
+
+# Pipeline stages in execution order (names used in timings and progress callbacks)
+STAGES = ('collect', 'match', 'ev')
+
+# Per-source collection timeouts in seconds (same budgets the old subprocess steps had)
+SOURCE_TIMEOUTS = {
+    'sportsbook': 60,
+    'prizepicks': 30,
+}
+
+SOURCE_ERRORS = {
+    'sportsbook': 'Sportsbook API failed',
+    'prizepicks': 'PrizePicks API failed',
+}
+
+
+# Output of the last completed run in this process (reused when inputs are unchanged)
+_last_result = None
+
+
+class PipelineError(Exception):
+    """Raised when a pipeline stage fails"""
+
+    def __init__(self, stage, error, details, sources=None):
+        super().__init__(f"{error}: {details}")
+        self.stage = stage
+        self.error = error
+        self.details = details
+        self.sources = sources
+
+
+def _run_stage(stage, error, timings, progress, func, *args, **kwargs):
+    """
+    Run one stage, record its wall-clock time and wrap failures in PipelineError
+
+    progress (if given) is called as progress(stage, 'running') before the stage and
+    progress(stage, 'done' | 'failed', seconds) after it.
+    """
+    if progress:
+        progress(stage, 'running')
+    started = time.perf_counter()
+    status = 'failed'
+    try:
+        result = func(*args, **kwargs)
+        status = 'done'
+        return result
+    except PipelineError:
+        raise
+    except Exception as e:
+        raise PipelineError(stage, error, str(e)) from e
+    finally:
+        timings[stage] = round(time.perf_counter() - started, 3)
+        if progress:
+            progress(stage, status, timings[stage])
+
+
+def _collect_sportsbook(checkpoint):
+    """Fetch sportsbook props and optionally checkpoint them to disk"""
+    all_props, changed = sportsbookapi.fetch_sportsbook_props()
+    if checkpoint:
+        sportsbookapi.save_sportsbook_props(all_props)
+    return all_props, changed
+
+
+def _collect_prizepicks(checkpoint):
+    """Fetch PrizePicks props; fetch_prizepicks_props reports failures by returning None"""
+    data, changed = prizepicksapi.fetch_prizepicks_props(save=checkpoint)
+    if data is None:
+        raise RuntimeError('No data returned from PrizePicks')
+    return data, changed
+
+
+def _timed(func, *args):
+    """Call func and return (result, seconds) so each source reports its own duration"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, round(time.perf_counter() - started, 3)
+
+
+def collect_sources(checkpoint=False, timeouts=None):
+    """
+    Fetch sportsbook and PrizePicks data concurrently
+
+    Both sources are independent until matching, so refresh latency is the slower
+    of the two instead of their sum. Each source has its own timeout; a source that
+    overruns is reported as timed out and its worker thread is abandoned.
+
+    Args:
+        checkpoint (bool): Also write each source's raw payload to backend/data_storage
+        timeouts (dict): Per-source timeouts in seconds (defaults to SOURCE_TIMEOUTS)
+
+    Returns:
+        tuple: (data, report) where data maps source name -> payload and report maps
+        source name -> {'status': 'ok' | 'failed' | 'timeout', 'seconds', 'error', 'changed'}
+
+    Raises:
+        PipelineError: if any source failed, with the full per-source report attached
+    """
+    timeouts = {**SOURCE_TIMEOUTS, **(timeouts or {})}
+    collectors = {
+        'sportsbook': _collect_sportsbook,
+        'prizepicks': _collect_prizepicks,
+    }
+
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(collectors), thread_name_prefix='collect')
+    futures = {name: executor.submit(_timed, func, checkpoint) for name, func in collectors.items()}
+
+    data = {}
+    report = {}
+    try:
+        # Wait on the tightest deadline first so every source gets its full budget
+        for name in sorted(futures, key=lambda n: timeouts[n]):
+            remaining = max(0.0, started + timeouts[name] - time.monotonic())
+            try:
+                (data[name], changed), seconds = futures[name].result(timeout=remaining)
+                report[name] = {'status': 'ok', 'seconds': seconds, 'error': None, 'changed': changed}
+            except FutureTimeoutError:
+                report[name] = {
+                    'status': 'timeout',
+                    'seconds': round(time.monotonic() - started, 3),
+                    'error': f'Timed out after {timeouts[name]}s',
+                    'changed': None
+                }
+            except Exception as e:
+                report[name] = {
+                    'status': 'failed',
+                    'seconds': round(time.monotonic() - started, 3),
+                    'error': str(e),
+                    'changed': None
+                }
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    failed = [name for name in collectors if report[name]['status'] != 'ok']
+    if failed:
+        error = SOURCE_ERRORS[failed[0]] if len(failed) == 1 else 'Data collection failed'
+        details = '; '.join(f"{name}: {report[name]['error']}" for name in failed)
+        raise PipelineError('collect', error, details, sources=report)
+
+    return data, report
+
+
+def run_pipeline(checkpoint=False, progress=None):
+    """
+    Run the full refresh pipeline in-process
+
+    Args:
+        checkpoint (bool): Also write the intermediate JSON files to backend/data_storage
+        progress (callable): Optional progress(stage, status, seconds=None) hook called
+            as each of STAGES starts and finishes
+
+    Returns:
+        dict: {
+            'ev_props': list of props with EV analysis,
+            'prop_count': int,
+            'published': whether ev_analysis.json was rewritten,
+            'unchanged': True when matching/EV were skipped because no source changed,
+            'timings': seconds spent in each stage,
+            'sources': per-source collection report (see collect_sources)
+        }
+
+    Raises:
+        PipelineError: if any stage fails
+    """
+    global _last_result
+    timings = {}
+    started = time.perf_counter()
+
+    try:
+        print("\n" + "🏈" * 30)
+        print("[1/3] 📊 COLLECTING SPORTSBOOK + PRIZEPICKS DATA (concurrently)...")
+        print("🏈" * 30)
+        data, sources = _run_stage(
+            'collect', 'Data collection failed', timings, progress,
+            collect_sources, checkpoint
+        )
+        sportsbook_data = data['sportsbook']
+        prizepicks_data = data['prizepicks']
+        for name, source in sources.items():
+            timings[name] = source['seconds']
+
+        if _last_result is not None and not any(source['changed'] for source in sources.values()):
+            # Neither source moved since the last run, so matching and EV would reproduce it
+            print("\n✅ Upstream data unchanged - skipping matching and EV calculation")
+            timings['total'] = round(time.perf_counter() - started, 3)
+            return {**_last_result, 'published': False, 'unchanged': True, 'timings': timings, 'sources': sources}
+
+        print("\n" + "🔗" * 30)
+        print("[2/3] 🔀 MATCHING PROPS (±2.5 yard tolerance)...")
+        print("🔗" * 30)
+        matches = _run_stage(
+            'match', 'Prop matching failed', timings, progress,
+            match_props.run_matching, sportsbook_data, prizepicks_data, save=checkpoint
+        )
+
+        if not matches:
+            # Keep serving the previous EV analysis rather than publishing an empty board
+            print("\n⚠️  No matches found - keeping previous ev_analysis.json")
+            timings['total'] = round(time.perf_counter() - started, 3)
+            _last_result = {'ev_props': [], 'prop_count': 0}
+            return {**_last_result, 'published': False, 'unchanged': False, 'timings': timings, 'sources': sources}
+
+        print("\n" + "💰" * 30)
+        print("[3/3] 📈 CALCULATING EV (with probability adjustments)...")
+        print("💰" * 30)
+        ev_props = _run_stage(
+            'ev', 'EV calculation failed', timings, progress,
+            calculate_ev.run_ev_calculation, matches
+        )
+
+        timings['total'] = round(time.perf_counter() - started, 3)
+        _last_result = {'ev_props': ev_props, 'prop_count': len(ev_props)}
+        return {**_last_result, 'published': True, 'unchanged': False, 'timings': timings, 'sources': sources}
+
+    except Exception:
+        # The collectors already recorded the new upstream state (ETags, content hashes)
+        # while collecting, so the next run would see every source as unchanged and
+        # return the stale result. Forget it so the next run recomputes.
+        _last_result = None
+        raise
+
+
+if __name__ == "__main__":
+    print(f"⏰ Started at: {datetime.now()}")
+    result = run_pipeline(checkpoint='--checkpoint' in sys.argv)
+    print(f"\n✅ Pipeline complete: {result['prop_count']} props")
+    print(f"⏱️  Stage timings: {result['timings']}")
@@ -0,0 +1,173 @@
+"""
+EXPLAIN QUERY PLAN regression check for the analytics queries
+
+Builds every filter combination of the top-winners and top-hit-lines queries
+(on the rollup tables and on the raw tables) and the entry history page with
+the same builders database_queries.py uses, and asks SQLite for the plan. A
+query fails the check when:
+
+- its plan falls back to a full table scan of a large table (entries, picks).
+  Scanning the small dimension tables (users, players) to drive a join is allowed
+- its plan doesn't use the index it was designed around (EXPECTED_INDEXES), e.g.
+  on a database that was never upgraded
+
+Run from the project root after schema changes or a SQLite upgrade:
+    python check_query_plans.py            # exit code 1 on a regression
+    python check_query_plans.py --verbose  # print every plan
+"""
+
+import itertools
+import re
+import sqlite3
+import sys
+
+import database_queries
+
+# Tables that must never be read with a plain table scan, by the aliases used in database_queries.py
+LARGE_TABLES = {
+    'entries': {'entries', 'e'},
+    'picks': {'picks', 'pk'},
+}
+
+# Filter values to combine (None = filter not applied)
+SORTS = ('revenue', 'count')
+STATES = (None, 'NY')
+DATE_RANGES = ((None, None), ('2025-10-20', None), (None, '2025-10-25'), ('2025-10-20', '2025-10-25'))
+
+# Entry history pages: first page, and a later page (keyset on created_at, entry_id)
+ENTRY_PAGES = (None, ('2025-10-20 12:00:00', 1000))
+
+SCAN_PATTERN = re.compile(r'^SCAN (\w+)(?: USING (COVERING )?INDEX (\w+))?')
+INDEX_PATTERN = re.compile(r'USING (?:COVERING )?INDEX (\w+)')
+
+# Indexes each query is built around, by (query, path). Every group must have at
+# least one of its indexes in the plan; which one depends on the filters and on
+# the statistics ANALYZE gathered, so alternatives the planner may pick are listed together.
+# The *_ts_cover indexes are the created_ts versions added by migrate_timestamps.py
+EXPECTED_INDEXES = {
+    ('top_winners', 'raw'): [{
+        'idx_entries_user_status_cover', 'idx_entries_status_created_cover',
+        'idx_entries_user_status_ts_cover', 'idx_entries_status_created_ts_cover',
+    }],
+    ('top_hit_lines', 'raw'): [{
+        'idx_picks_entry_cover', 'idx_picks_result_created_cover', 'idx_picks_line_result_cover',
+        'idx_picks_entry_ts_cover', 'idx_picks_result_created_ts_cover',
+    }],
+    ('entry_history', 'raw'): [{'idx_entries_user_created'}, {'idx_picks_entry_cover', 'idx_picks_entry_ts_cover'}],
+}
+
+
+def expected_indexes(name, path, state=None, start_date=None, end_date=None):
+    """
+    Index groups a query's plan must use
+
+    The rollup tables are small enough to scan when nothing filters them, so the
+    rollup queries only need an index for the filters they were given. An
+    open-ended date range can cover most of a rollup, where a scan is the better
+    plan, so the day index is only required for a bounded range.
+    """
+    if path == 'raw':
+        return EXPECTED_INDEXES[(name, path)]
+    day_index = {'top_winners': 'idx_user_daily_stats_day', 'top_hit_lines': 'idx_line_daily_stats_day'}[name]
+    if start_date and end_date:
+        # A state filter on the leaderboard may drive the join from users instead
+        return [{day_index, 'idx_users_state'} if state and name == 'top_winners' else {day_index}]
+    if state and name == 'top_winners':
+        return [{'idx_users_state'}]
+    return []
+
+
+def leaderboard_paths():
+    """Leaderboard paths to check: the rollups (when the database has them) and the raw tables"""
+    conn = sqlite3.connect(database_queries.database_uri(read_only=True), uri=True)
+    try:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    finally:
+        conn.close()
+    if set(database_queries.ROLLUP_TABLES) <= names:
+        return ('rollup', 'raw')
+    return ('raw',)
+
+
+def query_shapes():
+    """Yield (label, query, params, expected index groups) for every query shape the API can send"""
+    builders = {
+        'top_winners': database_queries.build_top_winners_query,
+        'top_hit_lines': database_queries.build_top_hit_lines_query,
+    }
+    use_rollups = database_queries.DB_USE_ROLLUPS
+    try:
+        for path in leaderboard_paths():
+            # The builders read the rollups only while DB_USE_ROLLUPS is set
+            database_queries.DB_USE_ROLLUPS = path == 'rollup'
+            for (name, build), sort_by, state, (start_date, end_date) in itertools.product(
+                builders.items(), SORTS, STATES, DATE_RANGES
+            ):
+                query, params = build(sort_by, state, start_date, end_date, 10)
+                label = f"{name}[{path}](sort_by={sort_by}, state={state}, start={start_date}, end={end_date})"
+                yield label, query, params, expected_indexes(name, path, state, start_date, end_date)
+    finally:
+        database_queries.DB_USE_ROLLUPS = use_rollups
+
+    for after in ENTRY_PAGES:
+        query, params = database_queries.build_entry_page_query(1, after, 10)
+        yield f"entry_history(after={after})", query, params, expected_indexes('entry_history', 'raw')
+
+
+def table_scans(plan):
+    """Return the plan steps that scan a large table without using any index"""
+    large_aliases = set().union(*LARGE_TABLES.values())
+    flagged = []
+    for detail in plan:
+        match = SCAN_PATTERN.match(detail)
+        if match and match.group(1) in large_aliases and match.group(3) is None:
+            flagged.append(detail)
+    return flagged
+
+
+def missing_indexes(plan, expected):
+    """Return a note for every expected index group the plan uses none of"""
+    used = {match.group(1) for detail in plan for match in INDEX_PATTERN.finditer(detail)}
+    return [f"expected {' or '.join(sorted(group))}" for group in expected if not group & used]
+
+
+def check_query_plans(verbose=False):
+    """
+    Explain every analytics query shape and report table scans and missing indexes
+
+    Returns:
+        list: (label, flagged steps) for every query whose plan regressed
+    """
+    conn = sqlite3.connect(database_queries.database_uri(read_only=True), uri=True)
+    regressions = []
+    try:
+        for label, query, params, expected in query_shapes():
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)]
+            flagged = table_scans(plan) + missing_indexes(plan, expected)
+            if flagged:
+                regressions.append((label, flagged))
+            if verbose or flagged:
+                print(f"{'❌' if flagged else '✅'} {label}")
+                for step in plan:
+                    print(f"     {step}")
+                for note in flagged:
+                    if note not in plan:
+                        print(f"     ⚠️  {note}")
+    finally:
+        conn.close()
+    return regressions
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🔍 CHECKING ANALYTICS QUERY PLANS")
+    print("=" * 60)
+
+    regressions = check_query_plans(verbose='--verbose' in sys.argv)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} query plan(s) scan a large table or skip their index")
+        print("Run python backend/data_storage/init_database.py --upgrade to apply the current indexes")
+        sys.exit(1)
+
+    print("\n✅ No table scans on entries or picks, every query uses its index")
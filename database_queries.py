@@ -5,10 +5,20 @@ This module contains all SQL query logic for the pre-built analytics views.
 Keeps api_server.py clean and focused on routing.
 """
 
+import base64
+import calendar
+import hashlib
+import json
 import sqlite3
 import os
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 
 # Database configuration
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -16,62 +26,686 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = SCRIPT_DIR
 DATABASE_FILE = os.path.join(PROJECT_ROOT, 'backend', 'data_storage', 'user_data.db')
 
+# Connection pool configuration
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))  # Max open connections
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '5'))  # Seconds to wait for a free connection
+DB_READ_ONLY = os.getenv('DB_READ_ONLY', '1').lower() in ('1', 'true', 'yes')  # Open with mode=ro
+DB_STATEMENT_CACHE = int(os.getenv('DB_STATEMENT_CACHE', '256'))  # Prepared statements kept per connection
+DB_HEALTH_CHECK_INTERVAL = 30  # Seconds idle before a pooled connection is pinged on checkout
+DB_MMAP_SIZE = int(os.getenv('DB_MMAP_SIZE', str(256 * 1024 * 1024)))  # Bytes of the file read via mmap (0 disables)
+DB_CACHE_SIZE_KB = int(os.getenv('DB_CACHE_SIZE_KB', str(32 * 1024)))  # Page cache per connection
+QUERY_CACHE_SIZE = int(os.getenv('QUERY_CACHE_SIZE', '256'))  # Cached analytics results (0 disables)
+QUERY_CACHE_TTL = float(os.getenv('QUERY_CACHE_TTL', '300'))  # Seconds a cached result is served
+QUERY_CACHE_MAX_ROWS = 500  # Larger results are not cached, bounding memory per entry
+DATA_VERSION_CHECK_INTERVAL = 1.0  # Seconds between PRAGMA data_version probes
+DB_USE_ROLLUPS = os.getenv('DB_USE_ROLLUPS', '1').lower() in ('1', 'true', 'yes')  # Leaderboards read rollup tables
+
 # ============================================================================
 # DATABASE CONNECTION HELPER
 # ============================================================================
 
-def get_db_connection():
+def database_uri(read_only: bool = DB_READ_ONLY) -> str:
+    """
+    SQLite URI for DATABASE_FILE
+    
+    The path is percent-encoded, so a '?', '#' or '%' in a directory name can't be
+    mistaken for the URI's query string. mode=ro also stops a missing database
+    file from being silently created.
+    """
+    uri = Path(DATABASE_FILE).absolute().as_uri()
+    return f"{uri}?mode=ro" if read_only else uri
+
+def get_db_connection(read_only: bool = DB_READ_ONLY):
     """
     Create and return a database connection with Row factory
     This allows accessing columns by name like a dictionary
+    
+    Connections may be handed between threads by the pool, and keep up to
+    DB_STATEMENT_CACHE prepared statements warm for as long as they stay open.
+    
+    Reads go through a memory map of the first DB_MMAP_SIZE bytes of the file
+    (no copy into the page cache), with a DB_CACHE_SIZE_KB page cache for the
+    rest and temporary B-trees (GROUP BY / ORDER BY / DISTINCT) kept in memory.
+    With the database in WAL mode (init_database.py) these readers never block,
+    and are never blocked by, a seeding or settlement writer.
     """
-    conn = sqlite3.connect(DATABASE_FILE)
+    conn = sqlite3.connect(
+        database_uri(read_only),
+        uri=True,
+        check_same_thread=False,
+        cached_statements=DB_STATEMENT_CACHE
+    )
     conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size = -{DB_CACHE_SIZE_KB}")  # Negative = KiB rather than pages
+    conn.execute("PRAGMA temp_store = MEMORY")
     return conn
 
-def execute_query(query: str, params: tuple = ()) -> List[Dict]:
+class ConnectionPool:
+    """
+    Fixed-size pool of SQLite connections shared by every query function
+    
+    Connections are opened lazily up to `size` and handed out LIFO, so the most
+    recently used (warmest) connection is reused first. A connection idle for
+    more than DB_HEALTH_CHECK_INTERVAL is pinged before it is handed out and
+    replaced if the ping fails.
+    """
+    
+    def __init__(self, size: int = DB_POOL_SIZE, timeout: float = DB_POOL_TIMEOUT,
+                 read_only: bool = DB_READ_ONLY):
+        self.size = size
+        self.timeout = timeout
+        self.read_only = read_only
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+    
+    def _checkout_idle(self, block: bool):
+        conn, last_used = self._idle.get(block=block, timeout=self.timeout if block else None)
+        if time.monotonic() - last_used > DB_HEALTH_CHECK_INTERVAL:
+            try:
+                conn.execute("SELECT 1").fetchone()
+            except sqlite3.Error:
+                # Swap in a fresh connection under the same slot; _connect gives
+                # the slot back only if the new connection can't be opened
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                return self._connect()
+        return conn
+    
+    def _connect(self):
+        try:
+            return get_db_connection(self.read_only)
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+    
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+    
+    def acquire(self):
+        """
+        Check out a connection, opening one if the pool isn't full yet
+        
+        Raises:
+            TimeoutError: if no connection frees up within the pool timeout
+        """
+        try:
+            return self._checkout_idle(block=False)
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_open = self._opened < self.size
+            if can_open:
+                self._opened += 1
+        if can_open:
+            return self._connect()
+        
+        try:
+            return self._checkout_idle(block=True)
+        except queue.Empty:
+            raise TimeoutError(f"No database connection free after {self.timeout}s (pool size {self.size})")
+    
+    def release(self, conn):
+        """Return a connection to the pool, rolling back anything left open"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        self._idle.put((conn, time.monotonic()))
+    
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out and always returns it"""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+    
+    def close_all(self):
+        """Close every idle connection (in-use ones are closed when released after this)"""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+# Shared by every query function in this process
+DB_POOL = ConnectionPool()
+
+def execute_query(query: str, params: tuple = (), conn: Optional[sqlite3.Connection] = None) -> List[Dict]:
     """
     Execute a query and return results as list of dictionaries
     
     Args:
         query: SQL query string
         params: Query parameters (for preventing SQL injection)
+        conn: Connection to run on (defaults to one checked out of DB_POOL)
     
     Returns:
         List of dictionaries representing rows
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(query, params)
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
-    return results
+    if conn is None:
+        with DB_POOL.connection() as conn:
+            return execute_query(query, params, conn)
+    cursor = conn.execute(query, params)
+    return [dict(row) for row in cursor.fetchall()]
 
 # ============================================================================
-# PRE-BUILT ANALYTICS QUERIES
+# QUERY RESULT CACHE
 # ============================================================================
 
-def get_top_winners(
+class QueryResultCache:
+    """
+    TTL + LRU cache for analytics results, invalidated when the database changes
+    
+    - At most `max_entries` results, least recently used evicted first; results
+      with more than QUERY_CACHE_MAX_ROWS rows are never stored
+    - Concurrent misses on the same key wait for one computation (no stampede)
+    - A dedicated probe connection polls PRAGMA data_version, which changes
+      whenever any other connection or process commits; a change clears the cache.
+      invalidate() clears it explicitly (e.g. after a write in this process)
+    
+    Cached results are shared between callers and must not be mutated.
+    """
+    
+    def __init__(self, max_entries: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        self._key_locks: Dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._probe = None
+        self._probe_lock = threading.Lock()
+        self._data_version = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+    
+    def _check_data_version(self):
+        """Clear the cache if the database was written since the last probe"""
+        now = time.monotonic()
+        if now - self._checked_at < DATA_VERSION_CHECK_INTERVAL:
+            return
+        with self._probe_lock:
+            if now - self._checked_at < DATA_VERSION_CHECK_INTERVAL:
+                return
+            try:
+                if self._probe is None:
+                    self._probe = get_db_connection(read_only=True)
+                version = self._probe.execute("PRAGMA data_version").fetchone()[0]
+            except sqlite3.Error:
+                # Can't tell whether the data changed, so don't trust anything cached
+                self._probe = None
+                version = None
+            if version is None or version != self._data_version:
+                if self._data_version is not None:
+                    self.invalidate()
+                self._data_version = version
+            self._checked_at = now
+    
+    def _get_fresh(self, key: tuple):
+        """Return (True, value) for a live entry, (False, None) otherwise (caller holds the lock)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+    
+    def get_or_compute(self, key: tuple, compute):
+        """
+        Return the cached result for key, computing and storing it on a miss
+        
+        Args:
+            key: Hashable, normalized cache key
+            compute: Zero-argument callable producing the result
+        """
+        if self.max_entries <= 0:
+            return compute()
+        self._check_data_version()
+        
+        with self._lock:
+            found, value = self._get_fresh(key)
+            if found:
+                self.hits += 1
+                return value
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        
+        with key_lock:
+            # Another thread may have filled the entry while we waited
+            with self._lock:
+                found, value = self._get_fresh(key)
+                if found:
+                    self.coalesced += 1
+                    return value
+                self.misses += 1
+            
+            try:
+                value = compute()
+                with self._lock:
+                    if len(value.get('results', ())) <= QUERY_CACHE_MAX_ROWS:
+                        self._entries[key] = (time.monotonic() + self.ttl, value)
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.max_entries:
+                            self._entries.popitem(last=False)
+                            self.evictions += 1
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+            return value
+    
+    def invalidate(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.coalesced + self.misses
+            return {
+                'hits': self.hits,
+                'coalesced': self.coalesced,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.coalesced) / lookups * 100, 1) if lookups else None,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl
+            }
+
+# Shared by the leaderboard functions and get_analytics_metadata in this process
+QUERY_CACHE = QueryResultCache()
+
+LEADERBOARD_MAX_LIMIT = 100  # Largest top-winners / top-hit-lines page
+
+def normalize_filters(
     sort_by: str = 'revenue',
     state: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     limit: int = 10
-) -> Dict[str, Any]:
+) -> Tuple[str, Optional[str], Optional[str], Optional[str], int]:
     """
-    Get top 10 winning users based on either revenue (net profit) or count (number of wins)
+    Canonical form of the leaderboard filters, used both as the cache key and to run the query
+    
+    Anything other than 'revenue' sorts by count (as before), state codes are
+    upper-cased, blank values mean "no filter" and limit is clamped to
+    1..LEADERBOARD_MAX_LIMIT.
+    
+    Raises:
+        ValueError: if a date isn't in YYYY-MM-DD format
+    """
+    sort_by = 'revenue' if sort_by == 'revenue' else 'count'
+    state = (state.strip().upper() or None) if state else None
+    start_date = _day_start(start_date, epoch=False) if start_date else None
+    end_date = _day_start(end_date, epoch=False) if end_date else None
+    limit = max(1, min(int(limit), LEADERBOARD_MAX_LIMIT))
+    return sort_by, state, start_date, end_date, limit
+
+# ============================================================================
+# DATE FILTER HELPERS
+# ============================================================================
+
+# Integer epoch-seconds mirror of created_at, added by backend/data_storage/migrate_timestamps.py
+EPOCH_COLUMN = 'created_ts'
+
+# table -> whether it has EPOCH_COLUMN (checked once per process)
+_epoch_columns: Dict[str, bool] = {}
+
+def _has_epoch_column(table: str) -> bool:
+    if table not in _epoch_columns:
+        columns = execute_query(f"PRAGMA table_info({table})")
+        _epoch_columns[table] = any(column['name'] == EPOCH_COLUMN for column in columns)
+    return _epoch_columns[table]
+
+def _day_start(date_str: str, epoch: bool, days: int = 0):
+    """Start of a YYYY-MM-DD day (plus `days`) as a comparable bound for created_at or created_ts"""
+    day = datetime.strptime(date_str, '%Y-%m-%d') + timedelta(days=days)
+    if epoch:
+        # Timestamps are stored in UTC (CURRENT_TIMESTAMP), same as DATE(created_at)
+        return calendar.timegm(day.timetuple())
+    return day.strftime('%Y-%m-%d')
+
+def date_range_conditions(
+    table: str,
+    alias: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Tuple[List[str], List[Any]]:
+    """
+    Translate inclusive YYYY-MM-DD bounds into a half-open range on the raw timestamp
+    
+    DATE(col) >= ? can't use an index because the column is wrapped in a function;
+    col >= 'start' AND col < 'day after end' matches the same rows and can. When the
+    table has been migrated to integer epoch timestamps the range uses created_ts.
     
     Args:
-        sort_by: 'revenue' (net profit) or 'count' (number of winning entries)
-        state: Filter by US state (e.g., 'NY', 'CA') or None for all states
-        start_date: Start date filter (ISO format: 'YYYY-MM-DD') or None
-        end_date: End date filter (ISO format: 'YYYY-MM-DD') or None
-        limit: Number of results to return (default 10)
+        table: Table the alias refers to
+        alias: Alias used for the table in the query
+        start_date: First day to include (YYYY-MM-DD) or None
+        end_date: Last day to include (YYYY-MM-DD) or None
+    
+    Returns:
+        Tuple of (SQL conditions, parameters)
+    
+    Raises:
+        ValueError: if a date isn't in YYYY-MM-DD format
+    """
+    epoch = _has_epoch_column(table)
+    column = f"{alias}.{EPOCH_COLUMN if epoch else 'created_at'}"
+    conditions = []
+    params = []
+    
+    if start_date:
+        conditions.append(f"{column} >= ?")
+        params.append(_day_start(start_date, epoch))
+    
+    if end_date:
+        conditions.append(f"{column} < ?")
+        params.append(_day_start(end_date, epoch, days=1))
+    
+    return conditions, params
+
+# ============================================================================
+# KEYSET PAGINATION
+# ============================================================================
+
+# Sort key of each paginated query, most significant first. Every key ends in
+# columns that identify a row uniquely, so the order is total and stable.
+# Money columns are ROUND(..., 2) in both the rollup and the raw builders, so
+# either path sorts (and encodes cursors) on the same cent values.
+WINNERS_SORT_KEYS = {
+    'revenue': ('net_profit', 'user_id'),
+    'count': ('winning_entries', 'user_id'),
+}
+HIT_LINES_SORT_KEYS = {
+    'revenue': ('total_revenue_generated', 'player_id', 'stat_type', 'line', 'selection'),
+    'count': ('times_hit', 'player_id', 'stat_type', 'line', 'selection'),
+}
+
+class InvalidCursorError(ValueError):
+    """A page cursor that is malformed or was issued by a different query"""
+
+def encode_cursor(kind: str, values: Sequence[Any]) -> str:
+    """
+    Opaque cursor pointing just past a row
+    
+    Args:
+        kind: What the cursor pages through (e.g. 'top_winners:revenue'), so a
+            cursor from one query can't be replayed against another
+        values: The row's sort key values
+    """
+    raw = json.dumps([kind] + list(values), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: Optional[str], kind: str, size: int) -> Optional[List[Any]]:
+    """
+    Sort key values stored in a cursor from encode_cursor (None for the first page)
+    
+    Raises:
+        InvalidCursorError: if the cursor is malformed or belongs to a different query
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursorError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != size + 1 or values[0] != kind:
+        raise InvalidCursorError('Invalid cursor')
+    return values[1:]
+
+def keyset_page(
+    query: str,
+    params: Sequence[Any],
+    sort_keys: Sequence[str],
+    after: Optional[Sequence[Any]],
+    limit: int
+) -> Tuple[str, tuple]:
+    """
+    Wrap a query so it returns the page of rows that follows `after` in descending sort_keys order
+    
+    The position is a row-value comparison on the sort key instead of an OFFSET,
+    so earlier pages' rows are filtered out before the sort rather than sorted
+    and discarded after it. That does not make a deep page as cheap as the first
+    one when `query` aggregates: its GROUP BY still runs over every matching row
+    on each page, and only the sort and the rows returned shrink.
+    
+    Args:
+        query: Query producing every column named in sort_keys (no ORDER BY / LIMIT)
+        params: Parameters of query
+        sort_keys: Columns of query to order by, all descending
+        after: Sort key of the last row of the previous page, or None for the first page
+        limit: Page size
     
     Returns:
-        Dictionary with query metadata and results
+        Tuple of (query, params)
+    """
+    columns = ', '.join(f"page.{key}" for key in sort_keys)
+    page_query = f"SELECT * FROM ({query}) page"
+    page_params = list(params)
+    
+    if after is not None:
+        placeholders = ', '.join('?' for _ in sort_keys)
+        page_query += f" WHERE ({columns}) < ({placeholders})"
+        page_params.extend(after)
+    
+    page_query += " ORDER BY " + ', '.join(f"page.{key} DESC" for key in sort_keys)
+    page_query += " LIMIT ?"
+    page_params.append(limit)
+    
+    return page_query, tuple(page_params)
+
+def _page_results(rows: List[Dict], kind: str, sort_keys: Sequence[str], limit: int) -> Tuple[List[Dict], Optional[str]]:
+    """Trim the extra look-ahead row off a page and build the cursor to the next one"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(kind, [rows[-1][key] for key in sort_keys])
+
+# ============================================================================
+# LEADERBOARD ROLLUPS
+# ============================================================================
+
+# Per-day aggregates maintained by triggers (see create_schema.sql / backend/data_storage/rollups.py)
+ROLLUP_TABLES = ('user_daily_stats', 'line_daily_stats')
+
+_rollups_available: Optional[bool] = None
+
+def _has_rollups() -> bool:
+    """Whether the leaderboards can be answered from the rollup tables (checked once per process)"""
+    global _rollups_available
+    if _rollups_available is None:
+        placeholders = ', '.join('?' for _ in ROLLUP_TABLES)
+        rows = execute_query(
+            f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+            ROLLUP_TABLES
+        )
+        _rollups_available = len(rows) == len(ROLLUP_TABLES)
+    return DB_USE_ROLLUPS and _rollups_available
+
+def day_range_conditions(
+    alias: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> Tuple[List[str], List[Any]]:
+    """
+    Inclusive YYYY-MM-DD bounds on a rollup table's day column
+    
+    Raises:
+        ValueError: if a date isn't in YYYY-MM-DD format
     """
+    conditions = []
+    params = []
+    
+    if start_date:
+        conditions.append(f"{alias}.day >= ?")
+        params.append(_day_start(start_date, epoch=False))
+    
+    if end_date:
+        conditions.append(f"{alias}.day <= ?")
+        params.append(_day_start(end_date, epoch=False))
     
+    return conditions, params
+
+def _build_top_winners_rollup_query(
+    sort_by: str,
+    state: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[str, List[Any]]:
+    """get_top_winners answered from user_daily_stats (days x users rows instead of entries)"""
+    query = """
+        SELECT 
+            u.user_id,
+            u.username,
+            u.state,
+            u.account_status,
+            SUM(s.winning_entries + s.losing_entries) as total_entries,
+            SUM(s.winning_entries) as winning_entries,
+            SUM(s.losing_entries) as losing_entries,
+            ROUND(SUM(s.total_winnings), 2) as total_winnings,
+            ROUND(SUM(s.total_wagered), 2) as total_wagered,
+            ROUND(SUM(s.total_winnings) - SUM(s.total_wagered), 2) as net_profit,
+    """
+    if sort_by == 'revenue':
+        query += """
+            CASE 
+                WHEN SUM(s.total_wagered) > 0 
+                THEN ROUND((SUM(s.total_winnings) - SUM(s.total_wagered)) / SUM(s.total_wagered) * 100, 2)
+                ELSE 0 
+            END as roi_percentage,
+        """
+    query += """
+            ROUND(CAST(SUM(s.winning_entries) AS FLOAT) / 
+                  NULLIF(SUM(s.winning_entries + s.losing_entries), 0) * 100, 1) as win_rate_percentage
+        FROM user_daily_stats s
+        JOIN users u ON u.user_id = s.user_id
+        WHERE 1 = 1
+    """
+    
+    params = []
+    
+    if state:
+        query += " AND u.state = ?"
+        params.append(state)
+    
+    day_conditions, day_params = day_range_conditions('s', start_date, end_date)
+    for condition in day_conditions:
+        query += f" AND {condition}"
+    params.extend(day_params)
+    
+    query += """
+        GROUP BY s.user_id
+        HAVING SUM(s.winning_entries + s.losing_entries) > 0
+    """
+    
+    return query, params
+
+def _build_top_hit_lines_rollup_query(
+    state: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[str, List[Any]]:
+    """get_top_hit_lines answered from line_daily_stats (days x lines x states rows instead of picks)"""
+    query = """
+        SELECT 
+            l.player_id,
+            p.player_name,
+            p.position,
+            p.team,
+            l.stat_type,
+            l.line,
+            l.selection,
+            SUM(l.times_hit + l.times_missed) as times_picked,
+            SUM(l.times_hit) as times_hit,
+            SUM(l.times_missed) as times_missed,
+            ROUND(SUM(l.revenue), 2) as total_revenue_generated,
+            ROUND(CAST(SUM(l.times_hit) AS FLOAT) / 
+                  NULLIF(SUM(l.times_hit + l.times_missed), 0) * 100, 1) as hit_rate_percentage
+        FROM line_daily_stats l
+        JOIN players p ON l.player_id = p.player_id
+        WHERE 1 = 1
+    """
+    
+    params = []
+    
+    if state:
+        query += " AND l.state = ?"
+        params.append(state)
+    
+    day_conditions, day_params = day_range_conditions('l', start_date, end_date)
+    for condition in day_conditions:
+        query += f" AND {condition}"
+    params.extend(day_params)
+    
+    query += """
+        GROUP BY l.player_id, l.stat_type, l.line, l.selection
+        HAVING SUM(l.times_hit) > 0
+    """
+    
+    return query, params
+
+# ============================================================================
+# PRE-BUILT ANALYTICS QUERIES
+# ============================================================================
+
+def build_top_winners_query(
+    sort_by: str = 'revenue',
+    state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 10,
+    after: Optional[Sequence[Any]] = None
+) -> Tuple[str, tuple]:
+    """
+    Build the SQL and parameters behind get_top_winners (also used by check_query_plans.py)
+    
+    Reads the daily rollups when the database has them, the raw tables otherwise,
+    and returns the page of `limit` users after the sort key `after`
+    (WINNERS_SORT_KEYS[sort_by]).
+    
+    Returns:
+        Tuple of (query, params)
+    """
+    if _has_rollups():
+        query, params = _build_top_winners_rollup_query(sort_by, state, start_date, end_date)
+    else:
+        query, params = _build_top_winners_raw_query(sort_by, state, start_date, end_date)
+    return keyset_page(query, params, WINNERS_SORT_KEYS[sort_by], after, limit)
+
+def _build_top_winners_raw_query(
+    sort_by: str,
+    state: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[str, List[Any]]:
+    """get_top_winners aggregated from entries"""
+
     # Build the base query
     if sort_by == 'revenue':
         # Sort by net profit (total winnings - total wagered)
@@ -84,9 +718,9 @@ def get_top_winners(
                 COUNT(DISTINCT e.entry_id) as total_entries,
                 COUNT(DISTINCT CASE WHEN e.status = 'won' THEN e.entry_id END) as winning_entries,
                 COUNT(DISTINCT CASE WHEN e.status = 'lost' THEN e.entry_id END) as losing_entries,
-                SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) as total_winnings,
-                SUM(e.entry_amount) as total_wagered,
-                (SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) - SUM(e.entry_amount)) as net_profit,
+                ROUND(SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END), 2) as total_winnings,
+                ROUND(SUM(e.entry_amount), 2) as total_wagered,
+                ROUND(SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) - SUM(e.entry_amount), 2) as net_profit,
                 CASE 
                     WHEN SUM(e.entry_amount) > 0 
                     THEN ROUND((SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) - SUM(e.entry_amount)) / SUM(e.entry_amount) * 100, 2)
@@ -98,7 +732,6 @@ def get_top_winners(
             JOIN entries e ON u.user_id = e.user_id
             WHERE e.status IN ('won', 'lost')
         """
-        order_by = "ORDER BY net_profit DESC"
     else:  # sort_by == 'count'
         # Sort by number of winning entries
         query = """
@@ -110,16 +743,15 @@ def get_top_winners(
                 COUNT(DISTINCT e.entry_id) as total_entries,
                 COUNT(DISTINCT CASE WHEN e.status = 'won' THEN e.entry_id END) as winning_entries,
                 COUNT(DISTINCT CASE WHEN e.status = 'lost' THEN e.entry_id END) as losing_entries,
-                SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) as total_winnings,
-                SUM(e.entry_amount) as total_wagered,
-                (SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) - SUM(e.entry_amount)) as net_profit,
+                ROUND(SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END), 2) as total_winnings,
+                ROUND(SUM(e.entry_amount), 2) as total_wagered,
+                ROUND(SUM(CASE WHEN e.status = 'won' THEN e.actual_payout ELSE 0 END) - SUM(e.entry_amount), 2) as net_profit,
                 ROUND(CAST(COUNT(CASE WHEN e.status = 'won' THEN 1 END) AS FLOAT) / 
                       NULLIF(COUNT(CASE WHEN e.status IN ('won', 'lost') THEN 1 END), 0) * 100, 1) as win_rate_percentage
             FROM users u
             JOIN entries e ON u.user_id = e.user_id
             WHERE e.status IN ('won', 'lost')
         """
-        order_by = "ORDER BY winning_entries DESC"
     
     # Add filters
     params = []
@@ -128,25 +760,68 @@ def get_top_winners(
         query += " AND u.state = ?"
         params.append(state)
     
-    if start_date:
-        query += " AND DATE(e.created_at) >= ?"
-        params.append(start_date)
-    
-    if end_date:
-        query += " AND DATE(e.created_at) <= ?"
-        params.append(end_date)
+    date_conditions, date_params = date_range_conditions('entries', 'e', start_date, end_date)
+    for condition in date_conditions:
+        query += f" AND {condition}"
+    params.extend(date_params)
     
-    # Group by user and add ordering and limit
-    query += f"""
+    # Group by user (ordering and paging are added by keyset_page)
+    query += """
         GROUP BY u.user_id
         HAVING total_entries > 0
-        {order_by}
-        LIMIT ?
     """
-    params.append(limit)
     
-    # Execute query
-    results = execute_query(query, tuple(params))
+    return query, params
+
+def get_top_winners(
+    sort_by: str = 'revenue',
+    state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 10,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get top 10 winning users based on either revenue (net profit) or count (number of wins)
+    
+    Args:
+        sort_by: 'revenue' (net profit) or 'count' (number of winning entries)
+        state: Filter by US state (e.g., 'NY', 'CA') or None for all states
+        start_date: Start date filter (ISO format: 'YYYY-MM-DD') or None
+        end_date: End date filter (ISO format: 'YYYY-MM-DD') or None
+        limit: Number of results to return (default 10, capped at LEADERBOARD_MAX_LIMIT)
+        cursor: next_cursor of the previous page, or None for the first page
+    
+    Returns:
+        Dictionary with query metadata, results and next_cursor (None on the last page)
+    
+    Raises:
+        ValueError: if a date isn't in YYYY-MM-DD format
+        InvalidCursorError: if the cursor is invalid
+    """
+    
+    filters = normalize_filters(sort_by, state, start_date, end_date, limit)
+    return QUERY_CACHE.get_or_compute(
+        ('top_winners',) + filters + (cursor or None,),
+        lambda: _get_top_winners(*filters, cursor=cursor)
+    )
+
+def _get_top_winners(
+    sort_by: str,
+    state: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    limit: int,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """Run get_top_winners against the database (no cache)"""
+    kind = f"top_winners:{sort_by}"
+    sort_keys = WINNERS_SORT_KEYS[sort_by]
+    after = decode_cursor(cursor, kind, len(sort_keys))
+    
+    # One row past the page tells us whether there is a next one
+    query, params = build_top_winners_query(sort_by, state, start_date, end_date, limit + 1, after)
+    results, next_cursor = _page_results(execute_query(query, params), kind, sort_keys, limit)
     
     return {
         'query_type': 'top_winners',
@@ -155,36 +830,49 @@ def get_top_winners(
             'state': state,
             'start_date': start_date,
             'end_date': end_date,
-            'limit': limit
+            'limit': limit,
+            'cursor': cursor
         },
         'count': len(results),
-        'results': results
+        'results': results,
+        'next_cursor': next_cursor
     }
 
-def get_top_hit_lines(
+def build_top_hit_lines_query(
     sort_by: str = 'revenue',
     state: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
-    limit: int = 10
-) -> Dict[str, Any]:
+    limit: int = 10,
+    after: Optional[Sequence[Any]] = None
+) -> Tuple[str, tuple]:
     """
-    Get top 10 hit lines (specific player props that users won on)
+    Build the SQL and parameters behind get_top_hit_lines (also used by check_query_plans.py)
     
-    Args:
-        sort_by: 'revenue' (total payout from this line) or 'count' (number of times hit)
-        state: Filter by US state or None for all states
-        start_date: Start date filter (ISO format: 'YYYY-MM-DD') or None
-        end_date: End date filter (ISO format: 'YYYY-MM-DD') or None
-        limit: Number of results to return (default 10)
+    Reads the daily rollups when the database has them, the raw tables otherwise,
+    and returns the page of `limit` lines after the sort key `after`
+    (HIT_LINES_SORT_KEYS[sort_by]).
     
     Returns:
-        Dictionary with query metadata and results
+        Tuple of (query, params)
     """
-    
+    if _has_rollups():
+        query, params = _build_top_hit_lines_rollup_query(state, start_date, end_date)
+    else:
+        query, params = _build_top_hit_lines_raw_query(state, start_date, end_date)
+    return keyset_page(query, params, HIT_LINES_SORT_KEYS[sort_by], after, limit)
+
+def _build_top_hit_lines_raw_query(
+    state: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str]
+) -> Tuple[str, List[Any]]:
+    """get_top_hit_lines aggregated from picks"""
+
     # Build the query
     query = """
         SELECT 
+            p.player_id,
             p.player_name,
             p.position,
             p.team,
@@ -194,7 +882,7 @@ def get_top_hit_lines(
             COUNT(pk.pick_id) as times_picked,
             COUNT(CASE WHEN pk.result = 'hit' THEN 1 END) as times_hit,
             COUNT(CASE WHEN pk.result = 'miss' THEN 1 END) as times_missed,
-            SUM(CASE WHEN pk.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END) as total_revenue_generated,
+            ROUND(SUM(CASE WHEN pk.result = 'hit' AND e.status = 'won' THEN e.actual_payout ELSE 0 END), 2) as total_revenue_generated,
             ROUND(CAST(COUNT(CASE WHEN pk.result = 'hit' THEN 1 END) AS FLOAT) / 
                   NULLIF(COUNT(CASE WHEN pk.result IN ('hit', 'miss') THEN 1 END), 0) * 100, 1) as hit_rate_percentage
         FROM picks pk
@@ -211,31 +899,68 @@ def get_top_hit_lines(
         query += " AND u.state = ?"
         params.append(state)
     
-    if start_date:
-        query += " AND DATE(pk.created_at) >= ?"
-        params.append(start_date)
-    
-    if end_date:
-        query += " AND DATE(pk.created_at) <= ?"
-        params.append(end_date)
+    date_conditions, date_params = date_range_conditions('picks', 'pk', start_date, end_date)
+    for condition in date_conditions:
+        query += f" AND {condition}"
+    params.extend(date_params)
     
-    # Group by specific line (player + stat + line + selection)
+    # Group by specific line (player + stat + line + selection); ordering and paging are added by keyset_page
     query += """
         GROUP BY p.player_id, pk.stat_type, pk.line, pk.selection
         HAVING times_hit > 0
     """
     
-    # Add ordering based on sort_by
-    if sort_by == 'revenue':
-        query += " ORDER BY total_revenue_generated DESC"
-    else:  # sort_by == 'count'
-        query += " ORDER BY times_hit DESC"
+    return query, params
+
+def get_top_hit_lines(
+    sort_by: str = 'revenue',
+    state: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    limit: int = 10,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get top 10 hit lines (specific player props that users won on)
     
-    query += " LIMIT ?"
-    params.append(limit)
+    Args:
+        sort_by: 'revenue' (total payout from this line) or 'count' (number of times hit)
+        state: Filter by US state or None for all states
+        start_date: Start date filter (ISO format: 'YYYY-MM-DD') or None
+        end_date: End date filter (ISO format: 'YYYY-MM-DD') or None
+        limit: Number of results to return (default 10, capped at LEADERBOARD_MAX_LIMIT)
+        cursor: next_cursor of the previous page, or None for the first page
+    
+    Returns:
+        Dictionary with query metadata, results and next_cursor (None on the last page)
     
-    # Execute query
-    results = execute_query(query, tuple(params))
+    Raises:
+        ValueError: if a date isn't in YYYY-MM-DD format
+        InvalidCursorError: if the cursor is invalid
+    """
+    
+    filters = normalize_filters(sort_by, state, start_date, end_date, limit)
+    return QUERY_CACHE.get_or_compute(
+        ('top_hit_lines',) + filters + (cursor or None,),
+        lambda: _get_top_hit_lines(*filters, cursor=cursor)
+    )
+
+def _get_top_hit_lines(
+    sort_by: str,
+    state: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    limit: int,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """Run get_top_hit_lines against the database (no cache)"""
+    kind = f"top_hit_lines:{sort_by}"
+    sort_keys = HIT_LINES_SORT_KEYS[sort_by]
+    after = decode_cursor(cursor, kind, len(sort_keys))
+    
+    # One row past the page tells us whether there is a next one
+    query, params = build_top_hit_lines_query(sort_by, state, start_date, end_date, limit + 1, after)
+    results, next_cursor = _page_results(execute_query(query, params), kind, sort_keys, limit)
     
     # Format the line description for frontend
     for result in results:
@@ -248,18 +973,120 @@ def get_top_hit_lines(
             'state': state,
             'start_date': start_date,
             'end_date': end_date,
-            'limit': limit
+            'limit': limit,
+            'cursor': cursor
         },
         'count': len(results),
-        'results': results
+        'results': results,
+        'next_cursor': next_cursor
     }
 
-def search_user(search_query: str) -> Dict[str, Any]:
+# ============================================================================
+# USER SEARCH
+# ============================================================================
+
+USER_SEARCH_TABLE = 'users_fts'  # Trigram FTS5 index over users (see create_schema.sql)
+USER_SEARCH_MIN_LENGTH = 3  # Shorter queries have no trigram and use the LIKE fallback
+USER_SEARCH_MAX_LIMIT = 50
+# bm25 column weights (username, email, first_name, last_name): account identifiers outrank names
+USER_SEARCH_WEIGHTS = (10.0, 10.0, 1.0, 1.0)
+
+_user_search_index_available: Optional[bool] = None
+
+def _has_user_search_index() -> bool:
+    """Whether the users_fts trigram index exists (checked once per process)"""
+    global _user_search_index_available
+    if _user_search_index_available is None:
+        rows = execute_query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (USER_SEARCH_TABLE,)
+        )
+        _user_search_index_available = bool(rows)
+    return _user_search_index_available
+
+def build_user_search_query(search_query: str, limit: int, offset: int) -> Tuple[str, List[Any]]:
+    """
+    Build the ranked user search SQL
+    
+    Queries of USER_SEARCH_MIN_LENGTH characters or more are answered from the
+    trigram index: the whole query is one FTS5 phrase, i.e. a case-insensitive
+    substring match on any indexed column. Exact username/email matches come
+    first, then bm25 relevance. Shorter queries (and databases without users_fts)
+    fall back to LIKE in user_id order, which stops scanning at the page end.
+    
+    Returns:
+        Tuple of (query, params)
+    """
+    columns = "u.user_id, u.username, u.email, u.first_name, u.last_name, u.state, u.account_status"
+    
+    if len(search_query) >= USER_SEARCH_MIN_LENGTH and _has_user_search_index():
+        phrase = '"' + search_query.replace('"', '""') + '"'
+        weights = ', '.join(str(weight) for weight in USER_SEARCH_WEIGHTS)
+        query = f"""
+            SELECT {columns}
+            FROM {USER_SEARCH_TABLE}
+            JOIN users u ON u.user_id = {USER_SEARCH_TABLE}.rowid
+            WHERE {USER_SEARCH_TABLE} MATCH ?
+            ORDER BY
+                (u.username = ? COLLATE NOCASE OR u.email = ? COLLATE NOCASE) DESC,
+                bm25({USER_SEARCH_TABLE}, {weights}),
+                u.user_id
+            LIMIT ? OFFSET ?
+        """
+        return query, [phrase, search_query, search_query, limit, offset]
+    
+    search_pattern = f"%{search_query}%"
+    query = f"""
+        SELECT {columns}
+        FROM users u
+        WHERE u.username LIKE ? OR u.email LIKE ? OR u.first_name LIKE ? OR u.last_name LIKE ?
+        ORDER BY u.user_id
+        LIMIT ? OFFSET ?
+    """
+    return query, [search_pattern] * 4 + [limit, offset]
+
+def search_users(
+    search_query: str,
+    limit: int = 10,
+    offset: int = 0,
+    conn: Optional[sqlite3.Connection] = None
+) -> Dict[str, Any]:
+    """
+    Find users whose username, email or name contains search_query, best match first
+    
+    Args:
+        search_query: Text to look for (case-insensitive substring)
+        limit: Page size (capped at USER_SEARCH_MAX_LIMIT)
+        offset: Number of matches to skip
+        conn: Optional connection to run on (defaults to the pool)
+    
+    Returns:
+        Dictionary with the page of matches and whether more exist
+    """
+    search_query = search_query.strip()
+    limit = max(1, min(limit, USER_SEARCH_MAX_LIMIT))
+    offset = max(0, offset)
+    
+    # One extra row tells us whether there is a next page without a COUNT(*)
+    query, params = build_user_search_query(search_query, limit + 1, offset)
+    matches = execute_query(query, tuple(params), conn)
+    
+    return {
+        'search_query': search_query,
+        'limit': limit,
+        'offset': offset,
+        'has_more': len(matches) > limit,
+        'matches': matches[:limit]
+    }
+
+def search_user(search_query: str, limit: int = 10, offset: int = 0) -> Dict[str, Any]:
     """
-    Search for a user by username or email and return their complete profile
+    Search for users by username, email or name and return the best match's complete profile
     
     Args:
-        search_query: Username or email to search for (partial match supported)
+        search_query: Text to search for (partial match supported)
+        limit: Number of ranked matches to list
+        offset: Number of ranked matches to skip (the profile is the first match of the page)
     
     Returns:
         Dictionary with user profile data including:
@@ -268,10 +1095,68 @@ def search_user(search_query: str) -> Dict[str, Any]:
         - Entry statistics (total, wins, losses, win rate)
         - Most picked players
         - Recent entries
+        - The ranked page of matching users (matches, has_more)
     """
+    # One pooled connection for the search and every sub-query of the profile
+    with DB_POOL.connection() as conn:
+        return _search_user(conn, search_query, limit, offset)
+
+# Columns of the consolidated profile query that belong in entry_stats
+ENTRY_STATS_COLUMNS = (
+    'total_entries',
+    'winning_entries',
+    'losing_entries',
+    'pending_entries',
+    'avg_bet_size',
+    'biggest_win',
+    'smallest_win',
+    'win_rate_percentage'
+)
+
+# Columns of the entry history (entries + picks) query that belong to the entry (the rest are pick columns)
+RECENT_ENTRY_COLUMNS = (
+    'entry_id',
+    'entry_amount',
+    'potential_payout',
+    'actual_payout',
+    'num_picks',
+    'entry_type',
+    'status',
+    'created_at',
+    'settled_at',
+    'profit_loss'
+)
+
+def _search_user(
+    conn: sqlite3.Connection,
+    search_query: str,
+    limit: int = 10,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    Build the search_user profile on an already checked-out connection
     
-    # Search for user (case-insensitive partial match)
-    user_query = """
+    Always 4 round-trips, however many users match and entries the user has:
+    1. Ranked page of matching users (search_users)
+    2. User + wallet + entry statistics
+    3. Most picked players
+    4. Recent entries joined to their picks (first page of get_user_entry_history)
+    """
+    
+    search = search_users(search_query, limit, offset, conn)
+    
+    if not search['matches']:
+        return {
+            'query_type': 'user_search',
+            'search_query': search_query,
+            'found': False,
+            'message': 'No user found matching that username or email',
+            'matches': [],
+            'has_more': False
+        }
+    
+    # Load the full profile of the top-ranked match and aggregate their entries in the same pass
+    profile_query = """
         SELECT 
             u.user_id,
             u.username,
@@ -286,26 +1171,30 @@ def search_user(search_query: str) -> Dict[str, Any]:
             w.current_balance,
             w.total_deposits,
             w.total_wagered,
-            w.total_winnings
+            w.total_winnings,
+            s.*
         FROM users u
         LEFT JOIN wallets w ON u.user_id = w.user_id
-        WHERE u.username LIKE ? OR u.email LIKE ?
-        LIMIT 1
+        CROSS JOIN (
+            SELECT 
+                COUNT(*) as total_entries,
+                COUNT(CASE WHEN status = 'won' THEN 1 END) as winning_entries,
+                COUNT(CASE WHEN status = 'lost' THEN 1 END) as losing_entries,
+                COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_entries,
+                ROUND(AVG(entry_amount), 2) as avg_bet_size,
+                MAX(actual_payout) as biggest_win,
+                MIN(CASE WHEN status = 'won' THEN actual_payout END) as smallest_win,
+                ROUND(CAST(COUNT(CASE WHEN status = 'won' THEN 1 END) AS FLOAT) / 
+                      NULLIF(COUNT(CASE WHEN status IN ('won', 'lost') THEN 1 END), 0) * 100, 1) as win_rate_percentage
+            FROM entries
+            WHERE user_id = ?
+        ) s
+        WHERE u.user_id = ?
     """
     
-    search_pattern = f"%{search_query}%"
-    results = execute_query(user_query, (search_pattern, search_pattern))
-    
-    if not results:
-        return {
-            'query_type': 'user_search',
-            'search_query': search_query,
-            'found': False,
-            'message': 'No user found matching that username or email'
-        }
-    
-    user = results[0]
-    user_id = user['user_id']
+    user_id = search['matches'][0]['user_id']
+    user = execute_query(profile_query, (user_id, user_id), conn)[0]
+    entry_stats = {column: user.pop(column) for column in ENTRY_STATS_COLUMNS}
     
     # Calculate net profit and ROI
     net_profit = user['total_winnings'] - user['total_wagered']
@@ -314,24 +1203,6 @@ def search_user(search_query: str) -> Dict[str, Any]:
     user['net_profit'] = round(net_profit, 2)
     user['roi_percentage'] = round(roi, 2)
     
-    # Get entry statistics
-    entry_stats_query = """
-        SELECT 
-            COUNT(*) as total_entries,
-            COUNT(CASE WHEN status = 'won' THEN 1 END) as winning_entries,
-            COUNT(CASE WHEN status = 'lost' THEN 1 END) as losing_entries,
-            COUNT(CASE WHEN status = 'pending' THEN 1 END) as pending_entries,
-            ROUND(AVG(entry_amount), 2) as avg_bet_size,
-            MAX(actual_payout) as biggest_win,
-            MIN(CASE WHEN status = 'won' THEN actual_payout END) as smallest_win,
-            ROUND(CAST(COUNT(CASE WHEN status = 'won' THEN 1 END) AS FLOAT) / 
-                  NULLIF(COUNT(CASE WHEN status IN ('won', 'lost') THEN 1 END), 0) * 100, 1) as win_rate_percentage
-        FROM entries
-        WHERE user_id = ?
-    """
-    
-    entry_stats = execute_query(entry_stats_query, (user_id,))[0]
-    
     # Get most picked players (top 5)
     most_picked_query = """
         SELECT 
@@ -351,44 +1222,10 @@ def search_user(search_query: str) -> Dict[str, Any]:
         LIMIT 5
     """
     
-    most_picked_players = execute_query(most_picked_query, (user_id,))
+    most_picked_players = execute_query(most_picked_query, (user_id,), conn)
     
-    # Get recent entries (last 10)
-    recent_entries_query = """
-        SELECT 
-            e.entry_id,
-            e.entry_amount,
-            e.potential_payout,
-            e.actual_payout,
-            e.num_picks,
-            e.entry_type,
-            e.status,
-            e.created_at,
-            e.settled_at,
-            (e.actual_payout - e.entry_amount) as profit_loss
-        FROM entries e
-        WHERE e.user_id = ?
-        ORDER BY e.created_at DESC
-        LIMIT 10
-    """
-    
-    recent_entries = execute_query(recent_entries_query, (user_id,))
-    
-    # Get picks for each recent entry
-    for entry in recent_entries:
-        picks_query = """
-            SELECT 
-                p.player_name,
-                p.position,
-                pk.stat_type,
-                pk.line,
-                pk.selection,
-                pk.result
-            FROM picks pk
-            JOIN players p ON pk.player_id = p.player_id
-            WHERE pk.entry_id = ?
-        """
-        entry['picks'] = execute_query(picks_query, (entry['entry_id'],))
+    # Get recent entries (first page of the entry history) with all of their picks in one query
+    recent_entries, entries_cursor = _get_entry_page(conn, user_id, None, RECENT_ENTRIES_LIMIT)
     
     return {
         'query_type': 'user_search',
@@ -397,43 +1234,265 @@ def search_user(search_query: str) -> Dict[str, Any]:
         'user': user,
         'entry_stats': entry_stats,
         'most_picked_players': most_picked_players,
-        'recent_entries': recent_entries
+        'recent_entries': recent_entries,
+        'entries_cursor': entries_cursor,
+        'matches': search['matches'],
+        'has_more': search['has_more'],
+        'offset': search['offset'],
+        'limit': search['limit']
+    }
+
+# ============================================================================
+# ENTRY HISTORY
+# ============================================================================
+
+RECENT_ENTRIES_LIMIT = 10  # Entries embedded in a search_user profile
+ENTRY_HISTORY_MAX_LIMIT = 100
+# Newest first; entry_id breaks ties between entries created in the same second
+ENTRY_HISTORY_SORT_KEYS = ('created_at', 'entry_id')
+
+def get_user_entry_history(
+    user_id: int,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    summary: bool = False
+) -> Dict[str, Any]:
+    """
+    One page of a user's entries, newest first, each with its picks
+    
+    Pages are addressed by keyset cursor and read from idx_entries_user_created,
+    so page 1,000 costs the same as page 1 however many entries the user has.
+    
+    Args:
+        user_id: User whose entries to list
+        limit: Entries per page (capped at ENTRY_HISTORY_MAX_LIMIT)
+        cursor: next_cursor of the previous page (or a profile's entries_cursor)
+        summary: Also return totals over the entries of this page
+    
+    Returns:
+        Dictionary with the page of entries, next_cursor (None on the last page)
+        and, with summary=True, the page totals
+    
+    Raises:
+        InvalidCursorError: if the cursor is invalid
+    """
+    limit = max(1, min(int(limit), ENTRY_HISTORY_MAX_LIMIT))
+    after = decode_cursor(cursor, f"entries:{user_id}", len(ENTRY_HISTORY_SORT_KEYS))
+    
+    with DB_POOL.connection() as conn:
+        entries, next_cursor = _get_entry_page(conn, user_id, after, limit)
+    
+    result = {
+        'query_type': 'entry_history',
+        'user_id': user_id,
+        'limit': limit,
+        'cursor': cursor,
+        'count': len(entries),
+        'entries': entries,
+        'next_cursor': next_cursor
     }
+    if summary:
+        result['summary'] = summarize_entries(entries)
+    return result
+
+def summarize_entries(entries: List[Dict]) -> Dict[str, Any]:
+    """
+    Totals over a page of entries (the page is already in memory, so no extra query)
+    
+    Returns:
+        Dictionary with entry counts by status, amounts and the page's first/last dates
+    """
+    settled = [entry for entry in entries if entry['status'] in ('won', 'lost')]
+    wins = sum(1 for entry in settled if entry['status'] == 'won')
+    total_wagered = sum(entry['entry_amount'] or 0 for entry in entries)
+    total_payout = sum(entry['actual_payout'] or 0 for entry in entries if entry['status'] == 'won')
+    
+    return {
+        'entries': len(entries),
+        'winning_entries': wins,
+        'losing_entries': len(settled) - wins,
+        'pending_entries': sum(1 for entry in entries if entry['status'] == 'pending'),
+        'picks': sum(len(entry['picks']) for entry in entries),
+        'total_wagered': round(total_wagered, 2),
+        'total_payout': round(total_payout, 2),
+        'net_profit': round(total_payout - sum(entry['entry_amount'] or 0 for entry in settled), 2),
+        'win_rate_percentage': round(wins / len(settled) * 100, 1) if settled else None,
+        'newest': entries[0]['created_at'] if entries else None,
+        'oldest': entries[-1]['created_at'] if entries else None
+    }
+
+def build_entry_page_query(
+    user_id: int,
+    after: Optional[Sequence[Any]],
+    limit: int
+) -> Tuple[str, tuple]:
+    """
+    Build the SQL and parameters behind one page of get_user_entry_history
+    (also used by check_query_plans.py)
+    
+    Returns:
+        Tuple of (query, params)
+    """
+    params: List[Any] = [user_id]
+    keyset = ""
+    if after is not None:
+        keyset = "AND (e.created_at, e.entry_id) < (?, ?)"
+        params.extend(after)
+    # One entry past the page tells us whether there is a next one
+    params.append(limit + 1)
+    
+    entry_page_query = f"""
+        WITH page AS (
+            SELECT 
+                e.entry_id,
+                e.entry_amount,
+                e.potential_payout,
+                e.actual_payout,
+                e.num_picks,
+                e.entry_type,
+                e.status,
+                e.created_at,
+                e.settled_at,
+                (e.actual_payout - e.entry_amount) as profit_loss
+            FROM entries e
+            WHERE e.user_id = ? {keyset}
+            ORDER BY e.created_at DESC, e.entry_id DESC
+            LIMIT ?
+        )
+        SELECT 
+            r.*,
+            pk.pick_id,
+            p.player_name,
+            p.position,
+            pk.stat_type,
+            pk.line,
+            pk.selection,
+            pk.result
+        FROM page r
+        LEFT JOIN picks pk ON pk.entry_id = r.entry_id
+        LEFT JOIN players p ON pk.player_id = p.player_id
+        ORDER BY r.created_at DESC, r.entry_id DESC, pk.pick_id
+    """
+    
+    return entry_page_query, tuple(params)
+
+def _get_entry_page(
+    conn: sqlite3.Connection,
+    user_id: int,
+    after: Optional[Sequence[Any]],
+    limit: int
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Fetch one page of entries joined to their picks and group the picks per entry
+    
+    Returns:
+        Tuple of (entries, cursor to the next page or None)
+    """
+    entry_page_query, params = build_entry_page_query(user_id, after, limit)
+    
+    entries = []
+    entries_by_id = {}
+    for row in execute_query(entry_page_query, params, conn):
+        entry = entries_by_id.get(row['entry_id'])
+        if entry is None:
+            entry = {column: row[column] for column in RECENT_ENTRY_COLUMNS}
+            entry['picks'] = []
+            entries_by_id[row['entry_id']] = entry
+            entries.append(entry)
+        if row['pick_id'] is not None:
+            entry['picks'].append({
+                'player_name': row['player_name'],
+                'position': row['position'],
+                'stat_type': row['stat_type'],
+                'line': row['line'],
+                'selection': row['selection'],
+                'result': row['result']
+            })
+    
+    return _page_results(entries, f"entries:{user_id}", ENTRY_HISTORY_SORT_KEYS, limit)
 
 # ============================================================================
 # HELPER FUNCTIONS FOR API
 # ============================================================================
 
-def get_available_states() -> List[str]:
+def get_analytics_metadata() -> Dict[str, Any]:
     """
-    Get list of all states that have users
-    Useful for populating state dropdown in frontend
+    Everything the analytics page needs before its first query, in one snapshot:
+    states with users, min/max entry dates and table row counts
+    
+    Computed once and held in QUERY_CACHE, so it is only recomputed after a
+    write to the database (data_version change), an explicit invalidate() or
+    QUERY_CACHE_TTL; the row counts come from table_counts, so a recompute is a
+    handful of index lookups rather than full scans. 'version' is a hash of the content, stable while the data
+    is unchanged (used as the bootstrap endpoint's ETag).
     """
-    query = """
+    return QUERY_CACHE.get_or_compute(('analytics_metadata',), _get_analytics_metadata)
+
+# Row counts kept by the table count triggers (see create_schema.sql)
+COUNTED_TABLES = ('users', 'entries', 'picks')
+
+_table_counts_available: Optional[bool] = None
+
+def _has_table_counts() -> bool:
+    """Whether the database has the trigger-maintained table_counts table (checked once per process)"""
+    global _table_counts_available
+    if _table_counts_available is None:
+        rows = execute_query("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'table_counts'")
+        _table_counts_available = bool(rows)
+    return _table_counts_available
+
+def _get_analytics_metadata() -> Dict[str, Any]:
+    """Uncached get_analytics_metadata"""
+    # Each count is a primary key lookup in table_counts; databases that predate it
+    # (not yet run through init_database.py --upgrade) fall back to COUNT(*) scans
+    if _has_table_counts():
+        counts = [f"(SELECT row_count FROM table_counts WHERE table_name = '{table}') as {table}" for table in COUNTED_TABLES]
+    else:
+        counts = [f"(SELECT COUNT(*) FROM {table}) as {table}" for table in COUNTED_TABLES]
+    
+    # One MIN/MAX per subquery so each is a single seek on idx_entries_created_at
+    summary_query = f"""
+        SELECT 
+            DATE((SELECT MIN(created_at) FROM entries)) as min_date,
+            DATE((SELECT MAX(created_at) FROM entries)) as max_date,
+            {', '.join(counts)}
+    """
+    states_query = """
         SELECT DISTINCT state 
         FROM users 
         WHERE state IS NOT NULL 
         ORDER BY state
     """
-    results = execute_query(query)
-    return [row['state'] for row in results]
+    
+    with DB_POOL.connection() as conn:
+        summary = execute_query(summary_query, conn=conn)[0]
+        states = [row['state'] for row in execute_query(states_query, conn=conn)]
+    
+    metadata = {
+        'states': states,
+        'date_range': {
+            'min_date': summary['min_date'],
+            'max_date': summary['max_date']
+        },
+        'counts': {table: summary[table] for table in COUNTED_TABLES}
+    }
+    digest = hashlib.sha256(json.dumps(metadata, sort_keys=True).encode('utf-8'))
+    metadata['version'] = digest.hexdigest()[:16]
+    return metadata
+
+def get_available_states() -> List[str]:
+    """
+    Get list of all states that have users
+    Useful for populating state dropdown in frontend
+    """
+    return list(get_analytics_metadata()['states'])
 
 def get_date_range() -> Dict[str, str]:
     """
     Get the min and max dates from entries table
     Useful for setting date picker bounds in frontend
     """
-    query = """
-        SELECT 
-            MIN(DATE(created_at)) as min_date,
-            MAX(DATE(created_at)) as max_date
-        FROM entries
-    """
-    result = execute_query(query)[0]
-    return {
-        'min_date': result['min_date'],
-        'max_date': result['max_date']
-    }
+    return dict(get_analytics_metadata()['date_range'])
 
 # ============================================================================
 # TESTING
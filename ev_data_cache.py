@@ -0,0 +1,75 @@
+"""
+Process-level cache for the /api/ev-data response
+
+ev_analysis.json is parsed and serialized once per change instead of on every
+request. The cache keeps the compact JSON bytes, a gzip-compressed copy and a
+strong ETag, and reloads only when the file's (mtime, inode, size) changes or the
+pipeline calls invalidate() after publishing new data.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import NamedTuple, Optional, Tuple
+
+
+class EVSnapshot(NamedTuple):
+    """Pre-serialized EV data ready to be written to a response"""
+    body: bytes
+    gzip_body: bytes
+    etag: str
+    prop_count: int
+
+
+class EVDataCache:
+    """Holds the serialized contents of one JSON file, keyed by its stat signature"""
+
+    def __init__(self, path: str, compress_level: int = 6):
+        self.path = path
+        self.compress_level = compress_level
+        # (stat signature, snapshot) swapped as one tuple so readers never see a mismatched pair
+        self._state: Optional[Tuple[Tuple[int, int, int], EVSnapshot]] = None
+        self._lock = threading.Lock()
+
+    def _stat_signature(self) -> Tuple[int, int, int]:
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+    def get(self) -> EVSnapshot:
+        """
+        Return the current snapshot, reloading the file if it changed on disk
+
+        Raises:
+            FileNotFoundError: if the data file does not exist
+        """
+        signature = self._stat_signature()
+        state = self._state
+        if state is not None and state[0] == signature:
+            return state[1]
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            state = self._state
+            if state is not None and state[0] == signature:
+                return state[1]
+
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+
+            # Same shape jsonify produces outside debug mode (compact, sorted keys)
+            body = json.dumps(data, separators=(',', ':'), sort_keys=True).encode('utf-8')
+            snapshot = EVSnapshot(
+                body=body,
+                gzip_body=gzip.compress(body, compresslevel=self.compress_level),
+                etag=hashlib.sha256(body).hexdigest()[:32],
+                prop_count=len(data),
+            )
+            self._state = (signature, snapshot)
+            return snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next get() re-reads the file"""
+        with self._lock:
+            self._state = None
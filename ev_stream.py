@@ -0,0 +1,217 @@
+"""
+Server-Sent Events push of EV updates
+
+Dashboards subscribe to /api/ev-stream once and receive:
+
+- snapshot: the full EV array when they connect (skipped when their Last-Event-ID
+  already matches the current data)
+- diff: {added, changed, removed, order} whenever a new ev_analysis result is
+  published; added and changed props are sent as full records, and a prop counts
+  as changed when any of its fields moved
+
+Each update is diffed and serialized once and the same bytes are queued to every
+subscriber, so N open dashboards cost one broadcast rather than N full polls of
+/api/ev-data. Event ids are the EV cache ETag, so a reconnecting client only gets
+a fresh snapshot if it missed an update.
+
+Every open stream holds a server thread for as long as the dashboard is open, so
+serve the app with threaded workers (gunicorn.conf.py uses gthread); a sync
+worker would be pinned by a single stream. Streams are capped per process at
+MAX_SUBSCRIBERS, below the worker's thread count so ordinary requests always
+have threads left. Clients turned away get a 503 and poll /api/ev-data instead.
+"""
+
+import json
+import os
+import queue
+import threading
+
+# Seconds between keep-alive comments (also how often data published by another
+# process, e.g. the sidecar scheduler, is picked up)
+KEEPALIVE_INTERVAL = 15
+
+# Messages buffered per subscriber before it is considered too slow and dropped
+SUBSCRIBER_QUEUE_SIZE = 32
+
+# Open streams per process (keep below gunicorn's threads per worker)
+MAX_SUBSCRIBERS = int(os.getenv('EV_STREAM_MAX_SUBSCRIBERS', '16'))
+
+
+class StreamLimitError(Exception):
+    """Raised when a process already serves MAX_SUBSCRIBERS streams"""
+
+
+def prop_key(prop):
+    """Stable identity of a prop across refreshes (mirrored by propKey in EVdashboard.js)"""
+    return f"{prop.get('player')}|{prop.get('game')}"
+
+
+def diff_ev_props(old_props, new_props):
+    """
+    Compare two EV results
+
+    Args:
+        old_props (list): Previously published props
+        new_props (list): Newly published props
+
+    Returns:
+        dict: {
+            'added': props only in new_props,
+            'changed': full new records of props with any field changed,
+            'removed': keys of props only in old_props,
+            'order': keys of new_props in published order
+        }
+    """
+    old_by_key = {prop_key(prop): prop for prop in old_props}
+    new_keys = set()
+    added = []
+    changed = []
+    for prop in new_props:
+        key = prop_key(prop)
+        new_keys.add(key)
+        previous = old_by_key.get(key)
+        if previous is None:
+            added.append(prop)
+        elif previous != prop:
+            changed.append(prop)
+
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': [key for key in old_by_key if key not in new_keys],
+        'order': [prop_key(prop) for prop in new_props],
+    }
+
+
+def format_event(event, data, event_id=None):
+    """Encode one SSE message; data must already be single-line JSON (bytes or str)"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    head = f'id: {event_id}\n' if event_id else ''
+    return f'{head}event: {event}\n'.encode('utf-8') + b'data: ' + data + b'\n\n'
+
+
+class EVBroadcaster:
+    """
+    Fans EV diffs out to every connected stream
+
+    Args:
+        cache (EVDataCache): Source of the published EV snapshot (and its ETag)
+        max_subscribers (int): Streams this process serves at once
+    """
+
+    def __init__(self, cache, max_subscribers=MAX_SUBSCRIBERS):
+        self.cache = cache
+        self.max_subscribers = max_subscribers
+        self._subscribers = set()
+        self._props = None
+        self._etag = None
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    def subscribe(self):
+        """
+        Register a new stream and return its message queue
+
+        Raises:
+            StreamLimitError: If max_subscribers streams are already open
+        """
+        subscriber = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            if len(self._subscribers) >= self.max_subscribers:
+                raise StreamLimitError(f"{len(self._subscribers)} EV streams already open")
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def _broadcast(self, message):
+        """Queue one pre-encoded message to every subscriber (caller holds the lock)"""
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # A stalled client must not hold up everyone else; close its stream
+                self._subscribers.discard(subscriber)
+                _close(subscriber)
+
+    def publish(self, props, etag):
+        """
+        Diff props against the last published result and broadcast the changes
+
+        Args:
+            props (list): The newly published EV props
+            etag (str): ETag of the new snapshot (becomes the SSE event id)
+
+        Returns:
+            dict: The diff, or None if nothing was broadcast
+        """
+        with self._lock:
+            if etag == self._etag:
+                return None
+            previous, self._props, self._etag = self._props, props, etag
+            if previous is None:
+                # First load in this process: nothing to diff against yet
+                return None
+            diff = diff_ev_props(previous, props)
+            if diff['added'] or diff['changed'] or diff['removed']:
+                body = json.dumps(diff, separators=(',', ':'), sort_keys=True)
+                self._broadcast(format_event('diff', body, etag))
+            return diff
+
+    def sync(self):
+        """Publish whatever the EV cache currently holds if it is newer than our copy"""
+        try:
+            snapshot = self.cache.get()
+        except (OSError, ValueError):
+            return None
+        if snapshot.etag == self._etag:
+            return snapshot
+        self.publish(json.loads(snapshot.body), snapshot.etag)
+        return snapshot
+
+    def stream(self, subscriber, last_event_id=None, keepalive=KEEPALIVE_INTERVAL):
+        """
+        Generator of SSE bytes for one client
+
+        Subscribe first (so a full server can still answer with an error status)
+        and unsubscribe when the response closes: a generator that never started
+        does not run its cleanup.
+
+        Args:
+            subscriber (queue.Queue): Queue returned by subscribe()
+            last_event_id (str): Last-Event-ID sent by a reconnecting EventSource
+            keepalive (float): Seconds between keep-alive comments
+        """
+        try:
+            yield f'retry: {keepalive * 1000}\n\n'.encode('utf-8')
+            snapshot = self.sync()
+            if snapshot is not None and snapshot.etag != last_event_id:
+                yield format_event('snapshot', snapshot.body, snapshot.etag)
+            while True:
+                try:
+                    message = subscriber.get(timeout=keepalive)
+                except queue.Empty:
+                    self.sync()
+                    yield b': keepalive\n\n'
+                    continue
+                if message is None:
+                    return
+                yield message
+        finally:
+            self.unsubscribe(subscriber)
+
+
+def _close(subscriber):
+    """Replace a subscriber's backlog with the end-of-stream marker"""
+    try:
+        while True:
+            subscriber.get_nowait()
+    except queue.Empty:
+        pass
+    subscriber.put_nowait(None)
@@ -6,12 +6,39 @@ import EVDashboard from "./pages/EVdashboard.js";
 import UserAnalytics from "./pages/UserAnalytics.js";
 
 const API_URL = process.env.REACT_APP_API_URL || "http://127.0.0.1:5000";
+const REFRESH_POLL_INTERVAL = 1000; // ms between refresh status checks
 
 function App() {
+  // Poll a refresh job until the pipeline finishes
+  const pollRefreshJob = (statusUrl) =>
+    new Promise((resolve, reject) => {
+      const poll = () => {
+        fetch(`${API_URL}${statusUrl}`)
+          .then((response) => {
+            if (!response.ok) {
+              throw new Error("Refresh status unavailable");
+            }
+            return response.json();
+          })
+          .then((job) => {
+            console.log(`⏳ Refresh ${job.status}:`, job.stages);
+            if (job.status === "succeeded") {
+              resolve(job);
+            } else if (job.status === "failed") {
+              reject(new Error(job.message || "Refresh failed"));
+            } else {
+              setTimeout(poll, REFRESH_POLL_INTERVAL);
+            }
+          })
+          .catch(reject);
+      };
+      poll();
+    });
+
   const handleRefresh = () => {
     console.log("🔄 Refresh button clicked - calling backend API...");
 
-    // Call the backend refresh endpoint
+    // Start a refresh job on the backend (returns immediately with a job id)
     fetch(`${API_URL}/api/refresh`, {
       method: "POST",
       headers: {
@@ -24,9 +51,18 @@ function App() {
         }
         return response.json();
       })
-      .then((data) => {
-        console.log("✅ Refresh successful:", data);
-        alert(`Data refreshed successfully! ${data.prop_count} props updated.`);
+      .then((job) => {
+        console.log(
+          job.deduplicated
+            ? "🔁 Joined refresh already in progress:"
+            : "🚀 Refresh started:",
+          job.job_id
+        );
+        return pollRefreshJob(job.status_url);
+      })
+      .then((job) => {
+        console.log("✅ Refresh successful:", job);
+        alert(`${job.message}! ${job.prop_count} props updated.`);
         // Reload the page to show new data
         window.location.reload();
       })
@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from "react";
 import "./AnalyticsCard.css";
+import { fetchAnalyticsBootstrap } from "./analyticsBootstrap";
 
 const API_URL = process.env.REACT_APP_API_URL || "http://127.0.0.1:5000";
 
@@ -13,24 +14,22 @@ function TopHitLinesCard() {
   const [results, setResults] = useState([]);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [pageParams, setPageParams] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [availableStates, setAvailableStates] = useState([]);
   const [dateRange, setDateRange] = useState({ min_date: "", max_date: "" });
 
-  // Fetch available states and date range
+  // Fetch available states and date range (shared, cached bootstrap request)
   useEffect(() => {
-    fetch(`${API_URL}/api/analytics/states`)
-      .then((res) => res.json())
-      .then((data) => setAvailableStates(data.states || []))
-      .catch((err) => console.error("Failed to fetch states:", err));
-
-    fetch(`${API_URL}/api/analytics/date-range`)
-      .then((res) => res.json())
+    fetchAnalyticsBootstrap()
       .then((data) => {
+        setAvailableStates(data.states || []);
         setDateRange(data.date_range || {});
         setStartDate(data.date_range?.min_date || "");
         setEndDate(data.date_range?.max_date || "");
       })
-      .catch((err) => console.error("Failed to fetch date range:", err));
+      .catch((err) => console.error("Failed to fetch analytics metadata:", err));
   }, []);
 
   const fetchTopHitLines = () => {
@@ -53,6 +52,8 @@ function TopHitLinesCard() {
       })
       .then((data) => {
         setResults(data.results || []);
+        setNextCursor(data.next_cursor || null);
+        setPageParams(params.toString());
         setLoading(false);
       })
       .catch((err) => {
@@ -61,6 +62,29 @@ function TopHitLinesCard() {
       });
   };
 
+  // Next page of the same query (filters as of the last "Show Results")
+  const loadMore = () => {
+    setLoadingMore(true);
+
+    const params = new URLSearchParams(pageParams);
+    params.set("cursor", nextCursor);
+
+    fetch(`${API_URL}/api/analytics/top-hit-lines?${params}`)
+      .then((response) => {
+        if (!response.ok) throw new Error("Failed to fetch data");
+        return response.json();
+      })
+      .then((data) => {
+        setResults((previous) => [...previous, ...(data.results || [])]);
+        setNextCursor(data.next_cursor || null);
+        setLoadingMore(false);
+      })
+      .catch((err) => {
+        setError(err.message);
+        setLoadingMore(false);
+      });
+  };
+
   // Fetch on mount
   useEffect(() => {
     fetchTopHitLines();
@@ -171,6 +195,15 @@ function TopHitLinesCard() {
               ))}
             </tbody>
           </table>
+          {nextCursor && (
+            <button
+              className="fetch-button load-more-button"
+              onClick={loadMore}
+              disabled={loadingMore}
+            >
+              {loadingMore ? "Loading..." : "Load More"}
+            </button>
+          )}
         </div>
       )}
 
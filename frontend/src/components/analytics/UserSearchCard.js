@@ -2,15 +2,20 @@ import React, { useState } from "react";
 import "./AnalyticsCard.css";
 
 const API_URL = process.env.REACT_APP_API_URL || "http://127.0.0.1:5000";
+const MATCHES_PER_PAGE = 10;
+const ENTRIES_PER_PAGE = 20;
 
 function UserSearchCard() {
   const [searchQuery, setSearchQuery] = useState("");
   const [result, setResult] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
+  const [entries, setEntries] = useState([]);
+  const [entriesCursor, setEntriesCursor] = useState(null);
+  const [loadingEntries, setLoadingEntries] = useState(false);
 
-  const handleSearch = () => {
-    if (!searchQuery.trim()) {
+  const handleSearch = (query = searchQuery) => {
+    if (!query.trim()) {
       setError("Please enter a username or email");
       return;
     }
@@ -21,8 +26,8 @@ function UserSearchCard() {
 
     fetch(
       `${API_URL}/api/analytics/user-search?q=${encodeURIComponent(
-        searchQuery
-      )}`
+        query
+      )}&limit=${MATCHES_PER_PAGE}`
     )
       .then((response) => {
         if (!response.ok) throw new Error("Failed to search user");
@@ -33,6 +38,8 @@ function UserSearchCard() {
           setError(data.message || "User not found");
         } else {
           setResult(data);
+          setEntries(data.recent_entries || []);
+          setEntriesCursor(data.entries_cursor || null);
         }
         setLoading(false);
       })
@@ -42,6 +49,40 @@ function UserSearchCard() {
       });
   };
 
+  // Next page of the user's entry history, appended below the recent entries
+  const loadMoreEntries = () => {
+    setLoadingEntries(true);
+
+    const params = new URLSearchParams({
+      limit: ENTRIES_PER_PAGE,
+      cursor: entriesCursor,
+    });
+
+    fetch(
+      `${API_URL}/api/analytics/users/${result.user.user_id}/entries?${params}`
+    )
+      .then((response) => {
+        if (!response.ok) throw new Error("Failed to load entries");
+        return response.json();
+      })
+      .then((data) => {
+        setEntries((previous) => [...previous, ...(data.entries || [])]);
+        setEntriesCursor(data.next_cursor || null);
+        setLoadingEntries(false);
+      })
+      .catch((err) => {
+        setError(err.message);
+        setLoadingEntries(false);
+      });
+  };
+
+  // Picking another match re-runs the search on its exact username,
+  // which the API always ranks first
+  const handleSelectMatch = (username) => {
+    setSearchQuery(username);
+    handleSearch(username);
+  };
+
   const handleKeyPress = (e) => {
     if (e.key === "Enter") {
       handleSearch();
@@ -56,12 +97,12 @@ function UserSearchCard() {
         <input
           type="text"
           className="search-input"
-          placeholder="Enter username or email..."
+          placeholder="Enter username, email or name..."
           value={searchQuery}
           onChange={(e) => setSearchQuery(e.target.value)}
           onKeyPress={handleKeyPress}
         />
-        <button className="fetch-button" onClick={handleSearch}>
+        <button className="fetch-button" onClick={() => handleSearch()}>
           Search
         </button>
       </div>
@@ -71,6 +112,32 @@ function UserSearchCard() {
 
       {result && result.found && (
         <div className="user-card-container">
+          {/* Other Matches */}
+          {result.matches && result.matches.length > 1 && (
+            <div className="matches-section">
+              <h4>
+                👥 {result.matches.length}
+                {result.has_more ? "+" : ""} matching users
+              </h4>
+              <div className="matches-list">
+                {result.matches.map((match) => (
+                  <button
+                    key={match.user_id}
+                    className={`match-item ${
+                      match.user_id === result.user.user_id ? "active" : ""
+                    }`}
+                    onClick={() => handleSelectMatch(match.username)}
+                  >
+                    {match.username}
+                    <span className="match-details">
+                      {match.first_name} {match.last_name} · {match.state}
+                    </span>
+                  </button>
+                ))}
+              </div>
+            </div>
+          )}
+
           {/* User Info Section */}
           <div className="user-info-section">
             <h3>{result.user.username}</h3>
@@ -223,13 +290,13 @@ function UserSearchCard() {
             )}
 
           {/* Recent Entries */}
-          {result.recent_entries && result.recent_entries.length > 0 && (
+          {entries.length > 0 && (
             <div className="recent-entries-section">
               <h4>📊 Recent Entries</h4>
               <div>
                 {" "}
                 {/* WRAPPER DIV FOR GRID */}
-                {result.recent_entries.slice(0, 5).map((entry) => (
+                {entries.map((entry) => (
                   <div key={entry.entry_id} className="entry-item">
                     <div className="entry-header">
                       <span className={`status-badge ${entry.status}`}>
@@ -272,6 +339,15 @@ function UserSearchCard() {
                 ))}
               </div>{" "}
               {/* END WRAPPER DIV */}
+              {entriesCursor && (
+                <button
+                  className="fetch-button load-more-button"
+                  onClick={loadMoreEntries}
+                  disabled={loadingEntries}
+                >
+                  {loadingEntries ? "Loading..." : "Load More Entries"}
+                </button>
+              )}
             </div>
           )}
         </div>
@@ -0,0 +1,21 @@
+const API_URL = process.env.REACT_APP_API_URL || "http://127.0.0.1:5000";
+
+// One request per page load: every analytics card shares the same promise
+let bootstrapRequest = null;
+
+// States, date range and row counts for the analytics filters
+export function fetchAnalyticsBootstrap() {
+  if (!bootstrapRequest) {
+    bootstrapRequest = fetch(`${API_URL}/api/analytics/bootstrap`)
+      .then((res) => {
+        if (!res.ok) throw new Error("Failed to fetch analytics metadata");
+        return res.json();
+      })
+      .catch((err) => {
+        // Let the next card (or a remount) try again
+        bootstrapRequest = null;
+        throw err;
+      });
+  }
+  return bootstrapRequest;
+}
@@ -4,14 +4,32 @@ import BreakevenTable from "../components/BreakevenTable";
 
 const API_URL = process.env.REACT_APP_API_URL || "http://127.0.0.1:5000";
 
+// How often to poll /api/ev-data when the server has no stream to spare (ms)
+const POLL_INTERVAL = 60000;
+
+// Must match prop_key() in ev_stream.py
+const propKey = (prop) => `${prop.player}|${prop.game}`;
+
+// Apply an /api/ev-stream diff to the current props
+const applyDiff = (props, diff) => {
+  const byKey = new Map(props.map((prop) => [propKey(prop), prop]));
+  diff.removed.forEach((key) => byKey.delete(key));
+  [...diff.added, ...diff.changed].forEach((prop) =>
+    byKey.set(propKey(prop), prop)
+  );
+  return diff.order.map((key) => byKey.get(key)).filter(Boolean);
+};
+
 function EVDashboard() {
   const [evData, setEvData] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
 
-  // Function to fetch data
-  const fetchData = () => {
-    setLoading(true);
+  // Function to fetch data (quiet skips the loading screen, for background polls)
+  const fetchData = (quiet = false) => {
+    if (!quiet) {
+      setLoading(true);
+    }
     setError(null);
 
     fetch(`${API_URL}/api/ev-data`)
@@ -31,9 +49,50 @@ function EVDashboard() {
       });
   };
 
-  // Load data when component mounts
+  // Subscribe to live updates when component mounts (plain fetch if SSE is unavailable)
   useEffect(() => {
-    fetchData();
+    if (typeof EventSource === "undefined") {
+      fetchData();
+      return undefined;
+    }
+
+    const source = new EventSource(`${API_URL}/api/ev-stream`);
+    let received = false;
+    let pollTimer = null;
+
+    // Full EV array, sent on connect
+    source.addEventListener("snapshot", (event) => {
+      received = true;
+      setEvData(JSON.parse(event.data));
+      setError(null);
+      setLoading(false);
+    });
+
+    // Added / changed / removed props after each refresh
+    source.addEventListener("diff", (event) => {
+      const diff = JSON.parse(event.data);
+      console.log(
+        `📡 EV update: ${diff.added.length} added, ${diff.changed.length} changed, ${diff.removed.length} removed`
+      );
+      setEvData((current) => applyDiff(current, diff));
+    });
+
+    source.onerror = () => {
+      // EventSource reconnects on its own unless the server refused the stream
+      // (e.g. 503 when it is at its stream limit); then poll instead
+      if (!received || source.readyState === EventSource.CLOSED) {
+        source.close();
+        if (pollTimer === null) {
+          fetchData(received);
+          pollTimer = setInterval(() => fetchData(true), POLL_INTERVAL);
+        }
+      }
+    };
+
+    return () => {
+      source.close();
+      clearInterval(pollTimer);
+    };
   }, []);
 
   if (loading) {
@@ -57,8 +116,8 @@ function EVDashboard() {
       <div className="EV-dashboard">
         <h2>+EV Opportunities ({evData.length} props)</h2>
         <div className="player-cards">
-          {evData.map((prop, index) => (
-            <PlayerCard key={index} propData={prop} />
+          {evData.map((prop) => (
+            <PlayerCard key={propKey(prop)} propData={prop} />
           ))}
         </div>
       </div>
@@ -0,0 +1,21 @@
+"""
+Gunicorn settings for the API server
+
+gunicorn reads this file from the working directory, so from the project root:
+    gunicorn api_server:app
+
+/api/ev-stream keeps one request open per dashboard for as long as it stays
+open. A sync worker would be pinned by a single stream, so requests are served
+by threads (gthread): each stream holds one thread and EV_STREAM_MAX_SUBSCRIBERS
+(ev_stream.py) stays below the thread count, leaving threads for everything else.
+"""
+import os
+
+bind = os.getenv('GUNICORN_BIND', '127.0.0.1:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '32'))
+
+# gthread workers heartbeat from their main loop, so a long-lived stream does not
+# count against the timeout
+timeout = 30
@@ -0,0 +1,166 @@
+"""
+Background refresh jobs for the API server
+
+POST /api/refresh no longer blocks on the pipeline. It submits a job and returns
+its id straight away; the pipeline runs in a background thread and clients poll
+GET /api/refresh/<job_id> for per-stage progress and the final result.
+
+Submissions are single-flight: while a refresh is queued or running, further
+submissions are attached to that job instead of starting another pipeline run.
+Jobs live in this process only, so single-flight and job lookups are per server
+process (run one API worker, or move jobs to a shared store, if that matters).
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from backend.pipeline import STAGES, PipelineError
+
+# Finished jobs kept around for status lookups
+JOB_HISTORY = 20
+
+
+class RefreshJob:
+    """One pipeline run and its progress"""
+
+    def __init__(self, trigger='manual'):
+        self.id = uuid.uuid4().hex
+        self.status = 'queued'  # queued -> running -> succeeded | failed
+        self.trigger = trigger
+        self.submitted_at = datetime.now().isoformat()
+        self.started_at = None
+        self.finished_at = None
+        self.stages = {stage: {'status': 'pending', 'seconds': None} for stage in STAGES}
+        self.subscribers = 1
+        self.seconds = None
+        self.result = None
+        self.error = None
+        self._started = None
+
+    @property
+    def active(self):
+        return self.status in ('queued', 'running')
+
+    def to_dict(self):
+        """JSON-ready view of the job"""
+        elapsed = self.seconds
+        if elapsed is None and self._started is not None:
+            elapsed = round(time.perf_counter() - self._started, 3)
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'trigger': self.trigger,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'elapsed': elapsed,
+            'stages': {stage: dict(info) for stage, info in self.stages.items()},
+            'subscribers': self.subscribers,
+            'result': self.result,
+            'error': self.error,
+        }
+
+
+class RefreshJobManager:
+    """
+    Runs refresh jobs one at a time in a background thread
+
+    Args:
+        run (callable): run(progress=...) -> pipeline result dict (backend.pipeline.run_pipeline)
+        on_complete (callable): Optional hook called with the pipeline result after a successful run
+        history (int): Number of finished jobs kept for status lookups
+    """
+
+    def __init__(self, run, on_complete=None, history=JOB_HISTORY):
+        self.run = run
+        self.on_complete = on_complete
+        self.history = history
+        self._jobs = OrderedDict()
+        self._current = None
+        self._lock = threading.Lock()
+
+    def submit(self, trigger='manual'):
+        """
+        Start a refresh, or join the one already in flight
+
+        Returns:
+            tuple: (RefreshJob, deduplicated) where deduplicated is True when the
+            request was attached to an existing queued/running job
+        """
+        with self._lock:
+            if self._current is not None and self._current.active:
+                self._current.subscribers += 1
+                return self._current, True
+
+            job = RefreshJob(trigger)
+            self._jobs[job.id] = job
+            self._current = job
+            # Drop the oldest finished jobs once the history is full
+            while len(self._jobs) > self.history:
+                oldest_id, oldest = next(iter(self._jobs.items()))
+                if oldest.active:
+                    break
+                del self._jobs[oldest_id]
+
+        thread = threading.Thread(target=self._run_job, args=(job,), name=f'refresh-{job.id[:8]}', daemon=True)
+        thread.start()
+        return job, False
+
+    def get(self, job_id):
+        """Return the job with this id, or None if it is unknown or has expired"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def current(self):
+        """Return the most recently submitted job (None before the first refresh)"""
+        with self._lock:
+            return self._current
+
+    def _progress(self, job):
+        def update(stage, status, seconds=None):
+            with self._lock:
+                job.stages[stage] = {'status': status, 'seconds': seconds}
+        return update
+
+    def _run_job(self, job):
+        with self._lock:
+            job.status = 'running'
+            job.started_at = datetime.now().isoformat()
+            job._started = time.perf_counter()
+
+        result = None
+        try:
+            result = self.run(progress=self._progress(job))
+            if self.on_complete:
+                self.on_complete(result)
+        except PipelineError as e:
+            print(f"❌ Refresh job {job.id[:8]} failed in {e.stage}: {e.error}")
+            error = {'stage': e.stage, 'error': e.error, 'details': e.details, 'sources': e.sources}
+        except Exception as e:
+            print(f"❌ Refresh job {job.id[:8]} failed: {e}")
+            error = {'stage': None, 'error': 'Refresh failed', 'details': str(e), 'sources': None}
+        else:
+            error = None
+
+        with self._lock:
+            job.finished_at = datetime.now().isoformat()
+            job.seconds = round(time.perf_counter() - job._started, 3)
+            for info in job.stages.values():
+                # Stages the pipeline short-circuited past never reported progress
+                if info['status'] == 'pending':
+                    info['status'] = 'skipped'
+            if error is None:
+                job.status = 'succeeded'
+                job.result = {
+                    'prop_count': result['prop_count'],
+                    'published': result['published'],
+                    'unchanged': result['unchanged'],
+                    'timings': result['timings'],
+                    'sources': result['sources'],
+                }
+            else:
+                job.status = 'failed'
+                job.error = error
@@ -0,0 +1,318 @@
+"""
+Scheduled background refresher
+
+Re-runs the collection -> match -> EV pipeline on its own so dashboard readers
+always get warm data instead of waiting on POST /api/refresh. The interval
+adapts to the slate:
+
+- It tightens as the nearest upcoming commence_time in ev_analysis.json approaches
+  (KICKOFF_CADENCE)
+- It relaxes overnight (QUIET_HOURS, server local time) and when no game is near
+- It never spends Odds API credits faster than the remaining monthly quota allows:
+  the interval is stretched so (credits left - reserve) last until the quota resets,
+  and refreshes pause entirely once the reserve is reached
+
+Runs inside the API server (REFRESH_SCHEDULER=1) or as a sidecar process:
+python refresh_scheduler.py
+
+Either way only one process per host schedules: whoever holds SCHEDULER_LOCK_FILE.
+Under gunicorn every worker imports api_server and tries the lock, so exactly
+one worker runs the scheduler (and a replacement worker takes over if it is
+recycled). Don't combine REFRESH_SCHEDULER=1 with gunicorn --preload: the
+master would take the lock before forking and no worker could get it.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, assume a single server process
+    fcntl = None
+
+from backend.data_collection.sportsbookapi import MAX_GAMES, RATE_LIMITER, seconds_until_quota_reset
+
+load_dotenv()
+
+# Start the scheduler with the API server
+SCHEDULER_ENABLED = os.getenv('REFRESH_SCHEDULER', '0').lower() in ('1', 'true', 'yes')
+
+DATA_FILE = 'backend/data_storage/ev_analysis.json'
+
+# Only the process holding this lock runs the scheduler
+SCHEDULER_LOCK_FILE = os.getenv('REFRESH_SCHEDULER_LOCK', 'backend/data_storage/refresh_scheduler.lock')
+
+# (seconds until the next kickoff, refresh interval in seconds), tightest first
+KICKOFF_CADENCE = [
+    (60 * 60, int(os.getenv('REFRESH_MIN_INTERVAL', '120'))),  # Within an hour of kickoff
+    (3 * 60 * 60, 300),  # Within 3 hours
+    (24 * 60 * 60, 900),  # Game day
+]
+
+# Interval when no game is within the last KICKOFF_CADENCE window
+IDLE_INTERVAL = int(os.getenv('REFRESH_IDLE_INTERVAL', '3600'))
+
+# Local hours [start, end) treated as overnight, and the interval used then
+QUIET_HOURS = (int(os.getenv('REFRESH_QUIET_START', '1')), int(os.getenv('REFRESH_QUIET_END', '8')))
+QUIET_INTERVAL = int(os.getenv('REFRESH_QUIET_INTERVAL', str(3 * 60 * 60)))
+
+# Credits one refresh is assumed to cost until a run has been measured (games list + 1 per game)
+DEFAULT_REFRESH_COST = (MAX_GAMES or 16) + 1
+
+# Weight of the latest measured run in the cost_per_refresh moving average
+REFRESH_COST_SMOOTHING = 0.25
+
+# How often the loop wakes up to re-check the schedule while waiting
+CHECK_INTERVAL = 30
+
+
+def parse_commence_time(value):
+    """Parse an Odds API commence_time ('2025-11-14T01:15:00Z') into an aware datetime"""
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+def load_kickoffs(path=DATA_FILE):
+    """
+    Read the commence times of every prop currently published
+
+    Returns:
+        list: Sorted, de-duplicated aware datetimes (empty if the file is missing)
+    """
+    try:
+        with open(path, 'r') as f:
+            props = json.load(f)
+    except (OSError, ValueError):
+        return []
+    kickoffs = {parse_commence_time(prop.get('commence_time')) for prop in props}
+    return sorted(k for k in kickoffs if k is not None)
+
+
+def cadence_interval(kickoffs, now=None, local_hour=None):
+    """
+    Refresh interval implied by the slate alone
+
+    Args:
+        kickoffs (list): Upcoming commence times (aware datetimes)
+        now (datetime): Current UTC time (defaults to now)
+        local_hour (int): Current local hour for the overnight check (defaults to now)
+
+    Returns:
+        tuple: (interval in seconds, reason)
+    """
+    now = now or datetime.now(timezone.utc)
+    local_hour = datetime.now().hour if local_hour is None else local_hour
+
+    upcoming = [k for k in kickoffs if k > now]
+    until_kickoff = (upcoming[0] - now).total_seconds() if upcoming else None
+
+    quiet = _is_quiet(local_hour)
+    # Overnight relaxes the game-day tier but never the final hours before a kickoff
+    tiers = KICKOFF_CADENCE[:-1] if quiet else KICKOFF_CADENCE
+    if until_kickoff is not None:
+        for window, interval in tiers:
+            if until_kickoff <= window:
+                return interval, f'kickoff in {int(until_kickoff // 60)} min'
+
+    if quiet:
+        return QUIET_INTERVAL, 'overnight'
+    return IDLE_INTERVAL, 'no games soon'
+
+
+def _is_quiet(hour):
+    start, end = QUIET_HOURS
+    if start <= end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+
+def acquire_scheduler_lock(path=SCHEDULER_LOCK_FILE):
+    """
+    Try to become the one process on this host that runs the scheduler
+
+    Returns:
+        The open lock file (keep a reference: the lock lasts until it is closed or
+        the process exits), or None when another process already holds it
+    """
+    lock_file = open(path, 'a')
+    if fcntl is None:
+        return lock_file
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+def budget_interval(quota_remaining, reserve, cost_per_refresh, now=None):
+    """
+    Shortest interval the remaining Odds API quota can sustain until it resets
+
+    Returns:
+        float: Seconds between refreshes, 0 when the quota is unknown, or None when
+        the quota is at or below the reserve (no refreshes until the reset)
+    """
+    if quota_remaining is None:
+        return 0
+    spendable = quota_remaining - reserve
+    if spendable <= 0:
+        return None
+    refreshes_left = spendable / max(1, cost_per_refresh)
+    return seconds_until_quota_reset(now) / refreshes_left
+
+
+class RefreshScheduler:
+    """
+    Submits scheduled refreshes through a RefreshJobManager
+
+    Args:
+        jobs (RefreshJobManager): Job manager shared with /api/refresh (keeps single-flight)
+        data_file (str): Published EV file the kickoff times are read from
+        limiter (OddsRateLimiter): Source of the Odds API quota state
+    """
+
+    def __init__(self, jobs, data_file=DATA_FILE, limiter=RATE_LIMITER):
+        self.jobs = jobs
+        self.data_file = data_file
+        self.limiter = limiter
+        self.cost_per_refresh = DEFAULT_REFRESH_COST
+        self.next_run_at = None
+        self.interval = None
+        self.reason = None
+        self.last_job_id = None
+        self.last_run_at = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _last_refresh_age(self):
+        """
+        Seconds since the last refresh (None if there has never been one)
+
+        Uses the later of the data file's mtime (so manual refreshes also reset the
+        clock) and the last scheduled run (which may not rewrite the file when
+        nothing changed upstream).
+        """
+        try:
+            last = os.path.getmtime(self.data_file)
+        except OSError:
+            last = None
+        if self.last_run_at is not None:
+            last = max(last or 0, self.last_run_at)
+        return None if last is None else time.time() - last
+
+    def plan(self):
+        """
+        Work out the current interval from the slate and the quota budget
+
+        Returns:
+            tuple: (interval in seconds or None when paused for quota, reason)
+        """
+        interval, reason = cadence_interval(load_kickoffs(self.data_file))
+        budget = budget_interval(self.limiter.quota_remaining, self.limiter.reserve, self.cost_per_refresh)
+        if budget is None:
+            if self.limiter.quota_exhausted():
+                return None, 'quota reserve reached'
+            # The limiter's lockout has expired (monthly reset or probe interval): the
+            # next refresh re-reads the quota, and pauses again if it is still spent
+            return interval, f'{reason}, probing quota'
+        if budget > interval:
+            return budget, f'{reason}, stretched to fit quota'
+        return interval, reason
+
+    def _run_once(self):
+        """Submit a refresh, wait for it and measure what it cost in credits"""
+        used_before = self.limiter.quota_used
+        job, deduplicated = self.jobs.submit(trigger='scheduled')
+        self.last_job_id = job.id
+        print(f"⏰ Scheduled refresh {'joined' if deduplicated else 'started'}: job {job.id[:8]} ({self.reason})")
+        while job.active and not self._stop.wait(1):
+            pass
+        self.last_run_at = time.time()
+        used_after = self.limiter.quota_used
+        if not deduplicated and job.status == 'succeeded' and None not in (used_before, used_after):
+            self._record_cost(used_after - used_before)
+
+    def _record_cost(self, spent):
+        """
+        Fold one run's credit spend into cost_per_refresh
+
+        A run served entirely from the response cache made no upstream calls and
+        says nothing about what the next one will cost, so it is ignored. Otherwise
+        the estimate is a moving average that jumps straight up to a dearer run, so
+        the budget is never planned on a run that happened to hit the cache a lot.
+        """
+        if spent <= 0:
+            return
+        average = self.cost_per_refresh + REFRESH_COST_SMOOTHING * (spent - self.cost_per_refresh)
+        self.cost_per_refresh = max(spent, average)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.interval, self.reason = self.plan()
+            age = self._last_refresh_age()
+            if self.interval is None:
+                self.next_run_at = None
+                wait = CHECK_INTERVAL
+            elif age is None or age >= self.interval:
+                self.next_run_at = time.time()
+                self._run_once()
+                continue
+            else:
+                wait = self.interval - age
+                self.next_run_at = time.time() + wait
+            # Re-plan periodically: kickoff windows and the quota move while we wait
+            self._stop.wait(min(wait, CHECK_INTERVAL))
+
+    def start(self):
+        """Start the scheduler thread (no-op if it is already running)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='refresh-scheduler', daemon=True)
+        self._thread.start()
+        print("⏰ Refresh scheduler started")
+
+    def stop(self):
+        """Ask the scheduler thread to exit after its current step"""
+        self._stop.set()
+
+    def status(self):
+        """JSON-ready scheduler state"""
+        return {
+            'running': self._thread is not None and self._thread.is_alive(),
+            'interval': round(self.interval) if self.interval is not None else None,
+            'reason': self.reason,
+            'next_run_at': datetime.fromtimestamp(self.next_run_at).isoformat() if self.next_run_at else None,
+            'cost_per_refresh': round(self.cost_per_refresh, 1),
+            'quota_remaining': self.limiter.quota_remaining,
+            'quota_reserve': self.limiter.reserve,
+            'last_job_id': self.last_job_id,
+        }
+
+
+if __name__ == "__main__":
+    # Sidecar mode: refresh in this process; the API server picks up the new
+    # ev_analysis.json on its next request because its cache watches the file
+    from backend.pipeline import run_pipeline
+    from refresh_jobs import RefreshJobManager
+
+    lock = acquire_scheduler_lock()
+    if lock is None:
+        raise SystemExit(f"❌ Another process already runs the refresh scheduler ({SCHEDULER_LOCK_FILE})")
+
+    scheduler = RefreshScheduler(RefreshJobManager(run_pipeline))
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(60)
+            print(f"⏰ Scheduler status: {scheduler.status()}")
+    except KeyboardInterrupt:
+        scheduler.stop()
@@ -0,0 +1,72 @@
+"""
+ConnectionPool slot accounting when a pooled connection goes bad
+
+Run from the project root: python -m pytest tests
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import database_queries
+from database_queries import ConnectionPool
+
+
+class ConnectionPoolHealthCheckTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, 'pool.db')
+        sqlite3.connect(path).close()
+        patches = [
+            mock.patch.object(database_queries, 'DATABASE_FILE', path),
+            # Ping every connection on checkout
+            mock.patch.object(database_queries, 'DB_HEALTH_CHECK_INTERVAL', -1),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.pool = ConnectionPool(size=2, timeout=0.1, read_only=True)
+
+    def tearDown(self):
+        self.pool.close_all()
+        self.tmp.cleanup()
+
+    def break_idle_connection(self):
+        """Fill both slots and return them, one as a connection whose next ping fails"""
+        first, second = self.pool.acquire(), self.pool.acquire()
+        self.pool.release(first)
+        second.close()
+        dead = mock.Mock(spec=sqlite3.Connection, in_transaction=False)
+        dead.execute.side_effect = sqlite3.OperationalError('disk I/O error')
+        self.pool.release(dead)
+
+    def test_failed_ping_replaces_connection_in_the_same_slot(self):
+        self.break_idle_connection()
+
+        connections = [self.pool.acquire(), self.pool.acquire()]
+        for conn in connections:
+            self.assertEqual(conn.execute("SELECT 1").fetchone()[0], 1)
+        self.assertEqual(self.pool._opened, 2)
+        with self.assertRaises(TimeoutError):
+            self.pool.acquire()
+
+    def test_failed_reconnect_frees_the_slot_once(self):
+        self.break_idle_connection()
+
+        with mock.patch.object(database_queries, 'get_db_connection', side_effect=sqlite3.OperationalError('gone')):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.pool.acquire()  # LIFO: the dead connection is checked out first
+        self.assertEqual(self.pool._opened, 1)
+
+        connections = [self.pool.acquire(), self.pool.acquire()]
+        self.assertEqual(self.pool._opened, 2)
+        with self.assertRaises(TimeoutError):
+            self.pool.acquire()
+        for conn in connections:
+            self.pool.release(conn)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Rollup triggers against a full rebuild, and the rollup and raw leaderboards
+against each other
+
+Run from the project root: python -m pytest tests
+"""
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+import database_queries
+from backend.data_storage import init_database, seed_database
+from backend.data_storage.rollups import ROLLUP_TABLES, rebuild_rollups
+
+
+def build_database(path, users=60, seed=11):
+    """Create and seed a database at path, with the scripts' output swallowed"""
+    with mock.patch.object(init_database, 'DATABASE_FILE', path), \
+            mock.patch.object(seed_database, 'DATABASE_FILE', path), \
+            contextlib.redirect_stdout(io.StringIO()):
+        init_database.init_database()
+        seed_database.seed_database(users, None, assume_yes=True, seed=seed, workers=1)
+
+
+def rollup_rows(conn, table):
+    """Every non-empty row of a rollup table, money rounded to cents"""
+    rows = conn.execute(f"SELECT * FROM {table}").fetchall()
+    columns = [column[0] for column in conn.execute(f"SELECT * FROM {table} LIMIT 0").description]
+    counters = [i for i, name in enumerate(columns) if name.startswith(('winning', 'losing', 'times'))]
+    return sorted(
+        tuple(round(value, 2) if isinstance(value, float) else value for value in row)
+        for row in rows
+        # The triggers leave a row at zero when its last settled entry or pick goes away
+        if any(row[i] for i in counters)
+    )
+
+
+class LeaderboardRollupTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, 'rollups.db')
+        build_database(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        self.conn = sqlite3.connect(self.path)
+        self.pool = database_queries.ConnectionPool(size=2, read_only=True)
+        patches = [
+            mock.patch.object(database_queries, 'DATABASE_FILE', self.path),
+            mock.patch.object(database_queries, 'DB_POOL', self.pool),
+            mock.patch.object(database_queries, '_rollups_available', None),
+            mock.patch.object(database_queries, '_epoch_columns', {}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.pool.close_all()
+        self.conn.close()
+
+    def mutate(self):
+        """Settle, re-settle, insert and delete entries and picks through the triggers"""
+        cursor = self.conn.cursor()
+        user_id = cursor.execute("SELECT user_id FROM users ORDER BY user_id LIMIT 1").fetchone()[0]
+
+        cursor.execute("""
+            INSERT INTO entries (user_id, entry_amount, potential_payout, actual_payout, num_picks, entry_type, status, created_at)
+            VALUES (?, 12.34, 37.02, 37.02, 2, 'power', 'won', '2025-11-09 13:05:00')
+        """, (user_id,))
+        entry_id = cursor.lastrowid
+        cursor.executemany("""
+            INSERT INTO picks (entry_id, player_id, stat_type, line, selection, result, created_at)
+            VALUES (?, ?, 'Passing Yards', 249.5, 'over', 'hit', '2025-11-09 13:05:00')
+        """, [(entry_id, 1), (entry_id, 2)])
+
+        # Flip results both ways, change a payout and move an entry to another day
+        cursor.execute("""
+            UPDATE entries SET status = CASE status WHEN 'won' THEN 'lost' ELSE 'won' END,
+                               actual_payout = CASE status WHEN 'won' THEN 0 ELSE entry_amount * 3 END
+            WHERE entry_id IN (SELECT entry_id FROM entries WHERE status IN ('won', 'lost') ORDER BY entry_id LIMIT 5)
+        """)
+        cursor.execute("""
+            UPDATE entries SET actual_payout = actual_payout + 0.01
+            WHERE entry_id IN (SELECT entry_id FROM entries WHERE status = 'won' ORDER BY entry_id DESC LIMIT 3)
+        """)
+        cursor.execute("""
+            UPDATE entries SET created_at = DATETIME(created_at, '-1 day')
+            WHERE entry_id IN (SELECT entry_id FROM entries WHERE status IN ('won', 'lost') ORDER BY entry_id DESC LIMIT 2)
+        """)
+        cursor.execute("""
+            UPDATE picks SET result = CASE result WHEN 'hit' THEN 'miss' ELSE 'hit' END
+            WHERE pick_id IN (SELECT pick_id FROM picks WHERE result IN ('hit', 'miss') ORDER BY pick_id LIMIT 8)
+        """)
+
+        # Delete a settled entry with its picks, and a lone settled pick
+        doomed = cursor.execute(
+            "SELECT entry_id FROM entries WHERE status = 'won' ORDER BY entry_id LIMIT 1 OFFSET 10"
+        ).fetchone()[0]
+        cursor.execute("DELETE FROM entries WHERE entry_id = ?", (doomed,))
+        cursor.execute("DELETE FROM picks WHERE entry_id = ?", (doomed,))
+        cursor.execute("""
+            DELETE FROM picks WHERE pick_id = (SELECT pick_id FROM picks WHERE result = 'hit' ORDER BY pick_id DESC LIMIT 1)
+        """)
+        self.conn.commit()
+
+    def leaderboard(self, fetch, sort_by, use_rollups):
+        """Every row of a leaderboard, read page by page through its cursors"""
+        rows, cursor = [], None
+        with mock.patch.object(database_queries, 'DB_USE_ROLLUPS', use_rollups):
+            while True:
+                page = fetch(sort_by, None, None, None, 25, cursor=cursor)
+                rows.extend(page['results'])
+                cursor = page['next_cursor']
+                if cursor is None:
+                    return rows
+
+    def test_rollups_match_rebuild_after_writes(self):
+        self.mutate()
+        maintained = {table: rollup_rows(self.conn, table) for table in ROLLUP_TABLES}
+
+        rebuild_rollups(self.conn)
+        for table in ROLLUP_TABLES:
+            self.assertEqual(maintained[table], rollup_rows(self.conn, table), table)
+
+    def test_rollup_and_raw_leaderboards_agree(self):
+        self.mutate()
+        for sort_by in ('revenue', 'count'):
+            with self.subTest(board='top_winners', sort_by=sort_by):
+                rollup = self.leaderboard(database_queries._get_top_winners, sort_by, True)
+                raw = self.leaderboard(database_queries._get_top_winners, sort_by, False)
+                self.assertTrue(rollup)
+                self.assertEqual(
+                    [(r['user_id'], r['net_profit'], r['winning_entries'], r['total_wagered']) for r in rollup],
+                    [(r['user_id'], r['net_profit'], r['winning_entries'], r['total_wagered']) for r in raw]
+                )
+            with self.subTest(board='top_hit_lines', sort_by=sort_by):
+                key = lambda r: (r['player_id'], r['stat_type'], r['line'], r['selection'],
+                                 r['times_hit'], r['total_revenue_generated'])
+                rollup = self.leaderboard(database_queries._get_top_hit_lines, sort_by, True)
+                raw = self.leaderboard(database_queries._get_top_hit_lines, sort_by, False)
+                self.assertTrue(rollup)
+                self.assertEqual([key(r) for r in rollup], [key(r) for r in raw])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+QueryResultCache: key normalization, TTL expiry, data_version invalidation
+and per-key single flight
+
+Run from the project root: python -m pytest tests
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import database_queries
+from database_queries import QueryResultCache
+
+
+class FakeClock:
+    """Monotonic clock the test moves by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class QueryResultCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.db')
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("CREATE TABLE t (x)")
+        self.clock = FakeClock()
+        patches = [
+            mock.patch.object(database_queries, 'DATABASE_FILE', self.path),
+            mock.patch.object(database_queries, 'DATA_VERSION_CHECK_INTERVAL', 0),
+            mock.patch.object(database_queries, 'time', SimpleNamespace(monotonic=self.clock)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.cache = QueryResultCache(max_entries=8, ttl=60)
+        self.calls = 0
+
+    def tearDown(self):
+        if self.cache._probe is not None:
+            self.cache._probe.close()
+        self.tmp.cleanup()
+
+    def compute(self):
+        self.calls += 1
+        return {'results': [], 'call': self.calls}
+
+    def write(self):
+        """Commit from another connection, as a seeder or settlement job would"""
+        with sqlite3.connect(self.path) as conn:
+            conn.execute("INSERT INTO t VALUES (1)")
+
+    def test_hit_within_ttl(self):
+        self.cache.get_or_compute(('k',), self.compute)
+        self.clock.advance(59)
+        self.assertEqual(self.cache.get_or_compute(('k',), self.compute)['call'], 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_expires_after_ttl(self):
+        self.cache.get_or_compute(('k',), self.compute)
+        self.clock.advance(61)
+        self.assertEqual(self.cache.get_or_compute(('k',), self.compute)['call'], 2)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_write_from_another_connection_invalidates(self):
+        self.cache.get_or_compute(('k',), self.compute)
+        self.write()
+        self.assertEqual(self.cache.get_or_compute(('k',), self.compute)['call'], 2)
+        self.assertEqual(self.cache.invalidations, 1)
+
+        # Unchanged data keeps serving the recomputed result
+        self.assertEqual(self.cache.get_or_compute(('k',), self.compute)['call'], 2)
+
+    def test_lru_eviction(self):
+        cache = QueryResultCache(max_entries=2, ttl=60)
+        self.addCleanup(lambda: cache._probe and cache._probe.close())
+        for key in ('a', 'b', 'a', 'c'):
+            cache.get_or_compute((key,), self.compute)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.get_or_compute(('a',), self.compute)['call'], 1)
+        self.assertEqual(cache.get_or_compute(('b',), self.compute)['call'], 4)
+
+    def test_concurrent_misses_compute_once_per_key(self):
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return self.compute()
+
+        def fetch():
+            results.append(self.cache.get_or_compute(('k',), slow))
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        threads[0].start()
+        self.assertTrue(started.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+
+        # A different key doesn't wait behind the one being computed
+        self.assertEqual(self.cache.get_or_compute(('other',), self.compute)['call'], 1)
+
+        time.sleep(0.2)  # Let the other two block on the key's lock
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(self.calls, 2)
+        self.assertEqual([result['call'] for result in results], [2, 2, 2])
+        self.assertEqual((self.cache.misses, self.cache.coalesced), (2, 2))
+        self.assertEqual(self.cache._key_locks, {})
+
+
+class CacheKeyNormalizationTest(unittest.TestCase):
+
+    def setUp(self):
+        patch = mock.patch.object(database_queries, 'QUERY_CACHE', QueryResultCache(max_entries=8, ttl=60))
+        self.cache = patch.start()
+        self.addCleanup(patch.stop)
+        self.cache._check_data_version = lambda: None
+
+    def test_equivalent_filters_share_an_entry(self):
+        with mock.patch.object(database_queries, '_get_top_winners', return_value={'results': []}) as run:
+            database_queries.get_top_winners('revenue', ' ny ', '2025-11-01', None, 10)
+            database_queries.get_top_winners('revenue', 'NY', '2025-11-01', '', 10)
+        run.assert_called_once_with('revenue', 'NY', '2025-11-01', None, 10, cursor=None)
+
+    def test_sort_and_limit_are_canonical(self):
+        with mock.patch.object(database_queries, '_get_top_hit_lines', return_value={'results': []}) as run:
+            database_queries.get_top_hit_lines('wins', limit=0)
+            database_queries.get_top_hit_lines('count', limit=1)
+            database_queries.get_top_hit_lines('count', limit=5000)
+            database_queries.get_top_hit_lines('count', limit=database_queries.LEADERBOARD_MAX_LIMIT)
+        self.assertEqual(run.call_count, 2)
+
+    def test_boards_and_cursors_are_separate_entries(self):
+        with mock.patch.object(database_queries, '_get_top_winners', return_value={'results': []}) as winners, \
+                mock.patch.object(database_queries, '_get_top_hit_lines', return_value={'results': []}) as lines:
+            database_queries.get_top_winners()
+            database_queries.get_top_winners(cursor='abc')
+            database_queries.get_top_hit_lines()
+        self.assertEqual((winners.call_count, lines.call_count), (2, 1))
+
+    def test_bad_date_is_rejected_before_the_cache(self):
+        with self.assertRaises(ValueError):
+            database_queries.get_top_winners(start_date='11/01/2025')
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
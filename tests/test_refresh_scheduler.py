@@ -0,0 +1,52 @@
+"""
+RefreshScheduler's per-refresh credit estimate
+
+Run from the project root: python -m pytest tests
+"""
+import unittest
+from types import SimpleNamespace
+
+from refresh_scheduler import DEFAULT_REFRESH_COST, RefreshScheduler
+
+
+class FakeJobs:
+    """RefreshJobManager stand-in whose jobs finish at once, spending `cost` credits each"""
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.costs = []
+
+    def submit(self, trigger):
+        self.limiter.quota_used += self.costs.pop(0)
+        return SimpleNamespace(id='0' * 32, active=False, status='succeeded'), False
+
+
+class RefreshCostTest(unittest.TestCase):
+
+    def setUp(self):
+        self.limiter = SimpleNamespace(quota_used=100, quota_remaining=400, reserve=0)
+        self.jobs = FakeJobs(self.limiter)
+        self.scheduler = RefreshScheduler(self.jobs, limiter=self.limiter)
+        self.scheduler.reason = 'test'
+
+    def run_costing(self, *costs):
+        self.jobs.costs.extend(costs)
+        for _ in costs:
+            self.scheduler._run_once()
+
+    def test_cached_runs_leave_the_estimate_alone(self):
+        self.run_costing(0, 0, 0)
+        self.assertEqual(self.scheduler.cost_per_refresh, DEFAULT_REFRESH_COST)
+
+    def test_estimate_rises_at_once_and_falls_gradually(self):
+        self.scheduler.cost_per_refresh = 5
+        self.run_costing(17)
+        self.assertEqual(self.scheduler.cost_per_refresh, 17)
+
+        self.run_costing(1)
+        self.assertGreater(self.scheduler.cost_per_refresh, 10)
+        self.assertLess(self.scheduler.cost_per_refresh, 17)
+
+
+if __name__ == '__main__':
+    unittest.main()
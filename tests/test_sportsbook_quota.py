@@ -0,0 +1,129 @@
+"""
+Odds API quota lockout against the local stub server
+
+Run from the project root: python -m pytest tests
+"""
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+from backend.data_collection import sportsbookapi
+from backend.data_collection.odds_stub_server import OddsStubServer
+from backend.data_collection.response_cache import ResponseCache
+from backend.data_collection.sportsbookapi import OddsRateLimiter, QuotaExhaustedError
+
+
+class FakeClock:
+    """Wall clock the test moves by hand"""
+
+    def __init__(self, when):
+        self.now = when.timestamp()
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class QuotaLockoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = OddsStubServer(remaining=1).start()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.saved = sportsbookapi.ODDS_API_BASE_URL, sportsbookapi.RESPONSE_CACHE
+        sportsbookapi.ODDS_API_BASE_URL = self.server.base_url
+        sportsbookapi.RESPONSE_CACHE = ResponseCache(self.cache_dir.name)
+        self.clock = FakeClock(datetime(2025, 11, 14, 12, 0, tzinfo=timezone.utc))
+
+    def tearDown(self):
+        sportsbookapi.ODDS_API_BASE_URL, sportsbookapi.RESPONSE_CACHE = self.saved
+        self.server.stop()
+        self.cache_dir.cleanup()
+
+    def get_games(self, limiter):
+        return sportsbookapi._get(f'/sports/{sportsbookapi.SPORT}/odds', {'markets': 'h2h'}, limiter, ttl=0)
+
+    def spend_quota(self, limiter):
+        """Use the stub's last credit so the limiter sees 0 remaining"""
+        response = self.get_games(limiter)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(limiter.quota_remaining, 0)
+
+    def test_locked_out_once_reserve_is_reached(self):
+        limiter = OddsRateLimiter(100, 10, reserve=0, probe_interval=3600, clock=self.clock)
+        self.spend_quota(limiter)
+
+        with self.assertRaises(QuotaExhaustedError):
+            self.get_games(limiter)
+        self.assertEqual(self.server.requests, 1)
+        self.assertTrue(limiter.quota_exhausted())
+
+    def test_probe_after_interval_lifts_lockout_when_credits_are_back(self):
+        limiter = OddsRateLimiter(100, 10, reserve=0, probe_interval=3600, clock=self.clock)
+        self.spend_quota(limiter)
+
+        self.server.remaining = 500
+        self.clock.advance(3601)
+        self.assertFalse(limiter.quota_exhausted())
+        self.assertEqual(self.get_games(limiter).status_code, 200)
+        self.assertEqual(limiter.quota_remaining, 499)
+        self.assertIsNone(limiter.locked_until)
+        self.assertEqual(self.get_games(limiter).status_code, 200)
+
+    def test_probe_with_quota_still_spent_locks_out_again(self):
+        limiter = OddsRateLimiter(100, 10, reserve=0, probe_interval=3600, clock=self.clock)
+        self.spend_quota(limiter)
+
+        self.clock.advance(3601)
+        self.assertEqual(self.get_games(limiter).status_code, 401)
+        self.assertEqual(self.server.requests, 2)
+        with self.assertRaises(QuotaExhaustedError):
+            self.get_games(limiter)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_only_one_probe_per_expiry(self):
+        limiter = OddsRateLimiter(100, 10, reserve=0, probe_interval=3600, clock=self.clock)
+        self.spend_quota(limiter)
+
+        self.clock.advance(3601)
+        limiter.acquire()
+        with self.assertRaises(QuotaExhaustedError):
+            limiter.acquire()
+
+    def test_lockout_expires_at_monthly_reset(self):
+        self.clock = FakeClock(datetime(2025, 11, 30, 23, 0, tzinfo=timezone.utc))
+        limiter = OddsRateLimiter(100, 10, reserve=0, probe_interval=0, clock=self.clock)
+        self.spend_quota(limiter)
+
+        self.clock.advance(30 * 60)
+        with self.assertRaises(QuotaExhaustedError):
+            self.get_games(limiter)
+
+        self.server.remaining = 500
+        self.clock.advance(30 * 60)
+        self.assertEqual(self.get_games(limiter).status_code, 200)
+        self.assertEqual(limiter.quota_remaining, 499)
+
+
+class FetcherAgainstStubTest(unittest.TestCase):
+
+    def test_fetch_sportsbook_props(self):
+        server = OddsStubServer(remaining=10).start()
+        saved = sportsbookapi.ODDS_API_BASE_URL, sportsbookapi.RESPONSE_CACHE
+        with tempfile.TemporaryDirectory() as cache_dir:
+            sportsbookapi.ODDS_API_BASE_URL = server.base_url
+            sportsbookapi.RESPONSE_CACHE = ResponseCache(cache_dir)
+            try:
+                props, changed = sportsbookapi.fetch_sportsbook_props(max_games=0, max_workers=2)
+            finally:
+                sportsbookapi.ODDS_API_BASE_URL, sportsbookapi.RESPONSE_CACHE = saved
+                server.stop()
+
+        self.assertTrue(changed)
+        self.assertEqual([p['id'] for p in props], ['stub-event-1', 'stub-event-2'])
+        self.assertEqual(props[0]['bookmakers'][0]['markets'][0]['key'], sportsbookapi.MARKETS)
+
+
+if __name__ == '__main__':
+    unittest.main()
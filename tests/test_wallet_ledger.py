@@ -0,0 +1,111 @@
+"""
+Wallet ledger triggers: wallets stay equal to their completed transactions
+
+Run from the project root: python -m pytest tests
+"""
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from backend.data_storage import init_database, seed_database
+from backend.data_storage.wallet_ledger import find_wallet_drift, reconcile_wallets
+
+INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (user_id, transaction_type, amount, balance_before, balance_after, status, transaction_date)
+    VALUES (?, ?, ?, 0, 0, ?, ?)
+"""
+
+
+class WalletLedgerTriggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, 'ledger.db')
+        with mock.patch.object(init_database, 'DATABASE_FILE', path), \
+                mock.patch.object(seed_database, 'DATABASE_FILE', path), \
+                contextlib.redirect_stdout(io.StringIO()):
+            init_database.init_database()
+            seed_database.seed_database(40, None, assume_yes=True, seed=23, workers=1)
+        self.conn = sqlite3.connect(path)
+        self.cursor = self.conn.cursor()
+        self.user_id, self.other_user_id = [
+            row[0] for row in self.cursor.execute("SELECT user_id FROM users ORDER BY user_id LIMIT 2")
+        ]
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmp.cleanup()
+
+    def transact(self, transaction_type, amount, status='completed', user_id=None, date='2025-11-15 12:00:00'):
+        self.cursor.execute(INSERT_TRANSACTION_SQL, (user_id or self.user_id, transaction_type, amount, status, date))
+        return self.cursor.lastrowid
+
+    def assertNoDrift(self):
+        self.conn.commit()
+        self.assertEqual(find_wallet_drift(self.cursor), (0, 0, []))
+
+    def test_seeded_wallets_match_ledger(self):
+        self.assertNoDrift()
+
+    def test_inserts(self):
+        for transaction_type in ('deposit', 'withdrawal', 'bet_placed', 'payout', 'refund', 'bonus'):
+            self.transact(transaction_type, 10.005)
+        self.transact('deposit', 99.99, status='pending')
+        self.transact('deposit', 50, status='failed')
+        self.assertNoDrift()
+
+    def test_first_transaction_creates_the_wallet(self):
+        self.cursor.execute("""
+            INSERT INTO users (username, email, state) VALUES ('ledger_test', 'ledger_test@example.com', 'NY')
+        """)
+        user_id = self.cursor.lastrowid
+        self.transact('deposit', 25, user_id=user_id, date='2025-11-20 09:30:00')
+        self.assertNoDrift()
+        self.cursor.execute("SELECT current_balance, updated_at FROM wallets WHERE user_id = ?", (user_id,))
+        self.assertEqual(self.cursor.fetchone(), (25, '2025-11-20 09:30:00'))
+
+    def test_updates(self):
+        pending = self.transact('deposit', 142.19, status='pending')
+        completed = self.transact('bet_placed', 10.005)
+        self.assertNoDrift()
+
+        updates = [
+            ("UPDATE transactions SET status = 'completed' WHERE transaction_id = ?", pending),
+            ("UPDATE transactions SET amount = 142.2 WHERE transaction_id = ?", pending),
+            ("UPDATE transactions SET transaction_type = 'payout' WHERE transaction_id = ?", completed),
+            ("UPDATE transactions SET user_id = ? WHERE transaction_id = ?", (self.other_user_id, completed)),
+            ("UPDATE transactions SET transaction_date = '2025-12-01 00:00:00' WHERE transaction_id = ?", pending),
+            ("UPDATE transactions SET status = 'cancelled' WHERE transaction_id = ?", pending),
+        ]
+        for sql, params in updates:
+            with self.subTest(sql=sql):
+                self.cursor.execute(sql, params if isinstance(params, tuple) else (params,))
+                self.assertNoDrift()
+
+    def test_deletes(self):
+        self.transact('deposit', 10.005, date='2025-12-31 23:59:59')
+        self.assertNoDrift()
+
+        self.cursor.execute("""
+            DELETE FROM transactions WHERE transaction_id IN (
+                SELECT transaction_id FROM transactions WHERE user_id = ? ORDER BY transaction_date DESC LIMIT 3
+            )
+        """, (self.user_id,))
+        self.assertNoDrift()
+
+        self.cursor.execute("DELETE FROM transactions WHERE user_id = ?", (self.other_user_id,))
+        self.assertNoDrift()
+
+    def test_reconcile_has_nothing_to_correct(self):
+        self.transact('payout', 33.335)
+        self.cursor.execute("UPDATE transactions SET amount = amount + 0.01 WHERE user_id = ?", (self.other_user_id,))
+        self.conn.commit()
+        self.assertEqual(reconcile_wallets(self.conn), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()